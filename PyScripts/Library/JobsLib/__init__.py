@@ -0,0 +1,14 @@
+from sweep import *
+from jobqueue import *
+from scheduler import *
+from inpstamp import *
+from stafile import *
+from restart import *
+from meshstudy import *
+from fakesolver import fake_command
+from odbbudget import *
+from stepcontrol import *
+from odbfield import *
+from odbhistory import *
+from postpool import *
+from odbcache import *
@@ -0,0 +1,100 @@
+# coding=cp936
+"""
+ Abaqus Ļвҵ
+
+*  abaqus ͬpython fakesolver.py job=<ҵ> input=<inp> cpus=<n> interactive
+*  Amdahl  T1 * (s + (1 - s) / n) ߣڼд .lck׷ .sta
+* ʱд߳ JOB TIME SUMMARY  .msgʽͬ Abaqus/Standard
+* ѡ fake_time=ʱ sfake_serial=бfake_fail=1 ģʧ
+* python fakesolver.py extract job=<ҵ> data=<Ŀ¼>  after.py ȡ .sta ʱɺ-λ
+"""
+import os
+import sys
+import time
+
+
+def fake_solve(job, cpus=1, serial_time=2.0, serial=0.1, fail=False, increments=10):
+    """
+    ģһ
+    :param job: ҵ
+    :param cpus: ߳
+    :param serial_time: ߳ʱ s
+    :param serial: б
+    :param fail: ǷԴ
+    :param increments: 
+    :return: ֵ
+    """
+    wall = serial_time * (serial + (1 - serial) / cpus)
+    start = time.time()
+    open(job + '.lck', 'w').close()
+
+    sta = open(job + '.sta', 'w')
+    sta.write(' Abaqus/Standard 2022                  DATE %s TIME %s\n' % (
+        time.strftime('%d-%m-%Y'), time.strftime('%H:%M:%S')))
+    sta.write(' SUMMARY OF JOB INFORMATION:\n'
+              ' STEP  INC ATT SEVERE EQUIL TOTAL  TOTAL      STEP       INC OF       DOF    IF\n'
+              '               DISCON ITERS ITERS  TIME/    TIME/LPF    TIME/LPF    MONITOR RIKS\n'
+              '               ITERS               FREQ\n')
+    sta.flush()
+    for inc in range(1, increments + 1):
+        time.sleep(wall / increments)
+        t = float(inc) / increments
+        sta.write('   1 %5d   1     0     2     2  %-10.3g %-10.3g %-11.4g\n' % (inc, t, t, 1.0 / increments))
+        sta.flush()
+    sta.write('                          \n')
+    sta.write(' THE ANALYSIS HAS NOT BEEN COMPLETED\n' if fail else ' THE ANALYSIS HAS COMPLETED SUCCESSFULLY\n')
+    sta.close()
+
+    elapsed = time.time() - start
+    with open(job + '.msg', 'w') as msg:
+        msg.write('     ELEMENT OPERATIONS WILL BE CARRIED OUT IN PARALLEL USING %3d THREADS ON 1 DOMAIN\n' % cpus)
+        msg.write('\n\n     JOB TIME SUMMARY\n'
+                  '       USER TIME (SEC)      =   %.1f    \n'
+                  '       SYSTEM TIME (SEC)    =   0.0    \n'
+                  '       TOTAL CPU TIME (SEC) =   %.1f    \n'
+                  '       WALLCLOCK TIME (SEC) =   %10d\n' % (
+                      serial_time, serial_time, max(int(round(elapsed)), 1)))
+    os.remove(job + '.lck')
+    return 1 if fail else 0
+
+
+def fake_extract(job, path='.'):
+    """
+    ģȡȡ <ҵ>.sta д <Ŀ¼>/<ģ>_URF.csv
+    :param job: ҵ Job-<ģ>
+    :param path: Ŀ¼
+    :return: ֵ.sta ڻʱΪ 1
+    """
+    times = [0.0]
+    if os.path.exists(job + '.sta'):
+        with open(job + '.sta') as sta:
+            for line in sta:
+                fields = line.split()
+                if len(fields) >= 9 and fields[0].isdigit() and fields[1].isdigit() and not fields[2].endswith('U'):
+                    times.append(float(fields[6]))
+    if len(times) == 1:
+        return 1
+    with open(os.path.join(path, job[4:] + '_URF.csv'), 'w') as csv:
+        csv.write('U,RF\n')
+        for t in times:
+            csv.write('%g,%g\n' % (100 * t, 300e3 * t / (0.3 + t)))
+    return 0
+
+
+def fake_command(python=None):
+    """
+    ֱΪ JobQueue / Scheduler  command
+    :param python: Python Ĭϵǰ
+    """
+    return [python or sys.executable, os.path.abspath(__file__).replace('.pyc', '.py')]
+
+
+if __name__ == '__main__':
+    args = dict(arg.split('=', 1) for arg in sys.argv[1:] if '=' in arg)
+    if 'extract' in sys.argv[1:]:
+        sys.exit(fake_extract(args['job'], args.get('data', '.')))
+    sys.exit(fake_solve(args['job'],
+                        cpus=int(args.get('cpus', 1)),
+                        serial_time=float(args.get('fake_time', os.environ.get('FAKE_SOLVER_TIME', 2.0))),
+                        serial=float(args.get('fake_serial', os.environ.get('FAKE_SOLVER_SERIAL', 0.1))),
+                        fail=args.get('fake_fail', '0') == '1'))
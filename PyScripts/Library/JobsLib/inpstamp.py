@@ -0,0 +1,245 @@
+# coding=cp936
+"""
+inp 
+
+*  Abaqus/CAE д Job-*.inp Ϊ׸壬ֻдӰĹؼֿ飺
+  غ (*Cload*Dsload*Dload) (*Material ) (*Step inc=*Static)
+* һʽ׸壬ͬʱд N 壬 CAE
+* ֵ Abaqus/CAE ʽinpwriter.format_numberϡʱ CAE д inp һ
+"""
+import io
+import os
+import re
+from ..MaterialsLib.inpwriter import format_number
+
+#  latin-1 дֽڱֵ׸еע
+_ENCODING = 'latin-1'
+
+
+class InpVariant:
+    def __init__(self, job, model=None):
+        """
+        inp 壬¼Ե׸ĸд
+        :param job: ҵ <ҵ>.inp
+        :param model: ģдļͷעͣĬҵȥ "Job-"
+        """
+        self.job = job
+        self.model = model or re.sub(r'^Job-', '', job)
+        self.loads = {}
+        self.materials = {}
+        self.steps = {}
+        self.used = set()
+
+    def load(self, name, value=None, scale=None):
+        """
+        дغɴС
+        :param name: غ Load-CFLoad-P*Dsload  TOTAL_FORCE ѹ贫  / 
+        :param value: ֵ
+        :param scale: ŵ׸еֵ׸Ϊ 6 λЧ֣
+        :return: self
+        """
+        self.loads[name] = (value, scale)
+        return self
+
+    def material(self, text):
+        """
+        滻Ͽ
+        :param text: *Material ؼֿı Concrete(...).to_inp()Steel(None, ...).to_inp()
+        :return: self
+        """
+        name = text.split('\n', 1)[0].split('name=')[1].strip()
+        self.materials[name] = _text(text)
+        return self
+
+    def static(self, step, initial=None, period=None, minimum=None, maximum=None, max_num_inc=None):
+        """
+        дƣΪ None ֵ׸
+        :param step: 
+        :param initial: ʼ
+        :param period: ʱ
+        :param minimum: С
+        :param maximum: 
+        :param max_num_inc: 
+        :return: self
+        """
+        self.steps[step] = (initial, period, minimum, maximum, max_num_inc)
+        return self
+
+    def edits(self):
+        """
+        ȫдڼǷе׸
+        """
+        return set([('load', name) for name in self.loads] +
+                   [('material', name) for name in self.materials] +
+                   [('step', name) for name in self.steps])
+
+
+def _text(value):
+    """
+    Python 2 ° str תΪ unicode io ıд
+    """
+    if not isinstance(value, type(u'')):
+        value = value.decode(_ENCODING)
+    return value
+
+
+def _split(line):
+    return [field.strip() for field in line.rstrip('\r\n').split(',')]
+
+
+def _join(fields, line):
+    return ', '.join(fields) + line[len(line.rstrip('\r\n')):]
+
+
+def _load_lines(keyword, lines, value, scale):
+    """
+    дغеĴСֶΣ*Dload Ϊ 3 Ϊĩ
+    """
+    result = []
+    for line in lines:
+        fields = _split(line)
+        index = 2 if keyword == '*dload' and fields[1].upper() == 'GRAV' else len(fields) - 1
+        fields[index] = format_number(float(fields[index]) * scale if value is None else value)
+        result.append(_join(fields, line))
+    return result
+
+
+def _static_lines(lines, controls):
+    fields = _split(lines[0])
+    for index, value in enumerate(controls[:4]):
+        if value is not None:
+            fields[index] = format_number(value)
+    return [_join(fields, lines[0])] + lines[1:]
+
+
+def _blocks(lines):
+    """
+    ȡעеɿ飬ؼгɿ
+    :param lines: Уβ
+    :return:  (Сдؼֻ None, ؼ, б)
+    """
+    keyword = None
+    block = []
+    for line in lines:
+        if line.startswith('*'):
+            if block:
+                yield keyword, block[0], block[1:]
+            if line.startswith('**'):
+                yield None, line, []
+                keyword = None
+                block = []
+            else:
+                keyword = line.split(',')[0].strip().lower()
+                block = [line]
+        else:
+            block.append(line)
+    if block:
+        yield keyword, block[0], block[1:]
+
+
+def _stamp(lines, variants, outputs):
+    """
+    дд
+    :param lines: ׸Уβ
+    :param variants: InpVariant б
+    :param outputs: һһӦļ
+    """
+    load = None
+    step = None
+    material = None
+    for keyword, head, data in _blocks(lines):
+        texts = None
+
+        # עͣļͷҵغϿһעʹ
+        if keyword is None:
+            material = None
+            if head.startswith('** Job name:'):
+                end = head[len(head.rstrip('\r\n')):]
+                texts = ['** Job name: %s Model name: %s%s' % (v.job, v.model, end) for v in variants]
+            match = re.match(r'\*\* Name: (\S+)', head)
+            load = match.group(1) if match else load
+
+        elif keyword == '*material':
+            material = head.split('name=')[1].strip()
+            texts = []
+            for variant in variants:
+                if material in variant.materials:
+                    variant.used.add(('material', material))
+                    texts.append(variant.materials[material].replace('\n', head[len(head.rstrip('\r\n')):]))
+                else:
+                    texts.append(None)
+
+        elif material is not None:
+            # ӹؼ֣ *Material 滻
+            texts = [u'' if material in variant.materials else None for variant in variants]
+
+        elif keyword == '*step':
+            step = re.search(r'name=([^,\s]+)', head).group(1)
+            texts = []
+            for variant in variants:
+                controls = variant.steps.get(step)
+                if controls is None or controls[4] is None:
+                    texts.append(None)
+                    continue
+                variant.used.add(('step', step))
+                texts.append(re.sub(r'inc=\d+', 'inc=%d' % controls[4], head) + ''.join(data))
+
+        elif keyword == '*static':
+            texts = []
+            for variant in variants:
+                controls = variant.steps.get(step)
+                if controls is None or not data:
+                    texts.append(None)
+                    continue
+                variant.used.add(('step', step))
+                texts.append(head + ''.join(_static_lines(data, controls)))
+
+        elif keyword in ('*cload', '*dsload', '*dload'):
+            texts = []
+            for variant in variants:
+                if load not in variant.loads:
+                    texts.append(None)
+                    continue
+                variant.used.add(('load', load))
+                value, scale = variant.loads[load]
+                texts.append(head + ''.join(_load_lines(keyword, data, value, scale)))
+
+        original = head + ''.join(data)
+        for index, output in enumerate(outputs):
+            text = texts[index] if texts is not None else None
+            output.write(original if text is None else text)
+
+
+def stamp_inp(base, variants, path=None):
+    """
+    ɵ׸һʽдȫ
+    :param base: ׸ inp ·
+    :param variants: InpVariant б
+    :param path: Ŀ¼Ĭϵ׸Ŀ¼
+    :return: д inp ·б
+    """
+    path = path or os.path.dirname(os.path.abspath(base))
+    paths = [os.path.join(path, variant.job + '.inp') for variant in variants]
+    outputs = [io.open(p, 'w', encoding=_ENCODING, newline='') for p in paths]
+    try:
+        with io.open(base, encoding=_ENCODING, newline='') as file:
+            _stamp(file, variants, outputs)
+    finally:
+        for output in outputs:
+            output.close()
+    _check(base, variants)
+
+    print('Python:  ' + os.path.basename(base) + ' д %d ' % len(paths))
+    return paths
+
+
+def _check(base, variants):
+    """
+    дǷе׸
+    """
+    missing = []
+    for variant in variants:
+        for kind, name in sorted(variant.edits() - variant.used):
+            missing.append('%s %s %s' % (variant.job, kind, name))
+    if missing:
+        raise ValueError('׸ ' + base + ' δҵ' + '; '.join(missing))
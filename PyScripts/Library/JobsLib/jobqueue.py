@@ -0,0 +1,121 @@
+# coding=cp936
+"""
+ҵ
+
+*  "abaqus job=... input=... cpus=... interactive" ں̨ inp
+* ͬʱеҵ max_jobs ƣҵд <ҵ>.log
+* ύCAE  status Ϊ None .lck ҵӣͬһҵ
+"""
+import os
+import time
+import subprocess
+
+
+def check_unsubmitted(job):
+    """
+    齨ģص mdb.Job δύ CAE ύʱٽл
+    :param job: mdb.Job
+    :return: job
+    """
+    if getattr(job, 'status', None) is not None:
+        raise RuntimeError('ҵ %s  CAE ύstatus %sģӦ submit=False ֻҵ' % (
+            job.name, job.status))
+    return job
+
+
+class JobQueue:
+    def __init__(self, command='abaqus', max_jobs=1, cpus=1, path=None, poll=2.0):
+        """
+        ҵ
+        :param command: Ϊб [python, fakesolver.py] 
+        :param max_jobs: ͬʱеҵ
+        :param cpus: ÿҵ cpu ߳
+        :param path: Ŀ¼ĬϵǰĿ¼
+        :param poll: ѯ s
+        """
+        self.command = command
+        self.max_jobs = max_jobs
+        self.cpus = cpus
+        self.path = path or os.getcwd()
+        self.poll = poll
+        self.pending = []
+        self.results = {}
+
+    def add(self, job, inp=None, cpus=None, tag=None, oldjob=None):
+        """
+        ҵ
+        :param job: ҵ
+        :param inp: inp ·Ĭ <ҵ>.inp
+        :param cpus: cpu ߳Ĭʹö
+        :param tag: ҵǣժҪ
+        :param oldjob: ԭҵ
+        """
+        #  .lck ҵ⣨ CAE ύϴδظύ
+        if os.path.exists(os.path.join(self.path, job + '.lck')):
+            raise RuntimeError('ҵ %s  .lckϴδظύ' % job)
+        self.pending.append({'job': job,
+                             'inp': inp or os.path.join(self.path, job + '.inp'),
+                             'cpus': cpus or self.cpus,
+                             'tag': tag,
+                             'oldjob': oldjob})
+
+    def command_line(self, item):
+        """
+        
+        """
+        command = list(self.command) if isinstance(self.command, (list, tuple)) else [self.command]
+        args = command + ['job=' + item['job'], 'input=' + item['inp'], 'cpus=%d' % item['cpus']]
+        if item['cpus'] > 1:
+            args.append('mp_mode=threads')
+        if item['oldjob']:
+            args.append('oldjob=' + item['oldjob'])
+        return args + ['interactive']
+
+    def _start(self, item):
+        log = open(os.path.join(self.path, item['job'] + '.log'), 'w')
+        # Windows  abaqus Ϊ辭 shell 
+        process = subprocess.Popen(self.command_line(item), cwd=self.path, stdout=log, stderr=subprocess.STDOUT,
+                                   shell=os.name == 'nt')
+        print('Python: ύҵ ' + item['job'] + '%d ߳' % item['cpus'])
+        return process, log, time.time()
+
+    def _dispatch(self, running):
+        """
+        ȡһҵ޿ҵʱ None
+        :param running: еҵ [(item, process, log, start), ...]
+        """
+        if self.pending and len(running) < self.max_jobs:
+            return self.pending.pop(0)
+        return None
+
+    def _finish(self, item, result):
+        """
+        ҵص
+        """
+        pass
+
+    def run(self):
+        """
+        ȫҵȫ
+        :return: {ҵ: dict(returncode, wall, cpus, tag)}
+        """
+        running = []
+        while self.pending or running:
+            item = self._dispatch(running)
+            while item is not None:
+                running.append((item,) + self._start(item))
+                item = self._dispatch(running)
+
+            time.sleep(self.poll if running else 0)
+            for entry in running[:]:
+                item, process, log, start = entry
+                if process.poll() is None:
+                    continue
+                log.close()
+                running.remove(entry)
+                self.results[item['job']] = {'returncode': process.returncode, 'wall': time.time() - start,
+                                             'cpus': item['cpus'], 'tag': item['tag']}
+                print('Python: ҵ ' + item['job'] + ' ֵ %dʱ %.1f s' % (
+                    process.returncode, self.results[item['job']]['wall']))
+                self._finish(item, self.results[item['job']])
+        return self.results
@@ -0,0 +1,174 @@
+# coding=cp936
+"""
+о
+
+* ɴֵϸ̶ܱ𼶽ģ⣬ȡ-λߵķֵʼն
+* Ա仯Сݲʱǰֹͣټϸ
+* ʱٶ Richardson ƣ޹ؽ GCI
+"""
+import os
+import csv
+import math
+import numpy as np
+from jobqueue import check_unsubmitted
+
+# ָ
+METRICS = ('peak', 'stiffness')
+
+
+def curve_metrics(u, rf, fraction=0.3):
+    """
+    -λָ
+    :param u: λ
+    :param rf: 
+    :param fraction: ʼնȡز fraction * ֵ ĵ㣬ԭС
+    :return: dict(peak ֵ, stiffness ʼն)
+    """
+    u = np.abs(np.asarray(u, dtype=float))
+    rf = np.abs(np.asarray(rf, dtype=float))
+    peak = rf.max()
+    mask = (rf <= fraction * peak) & (u > 0)
+    if mask.sum() < 2:
+        # ʱȡһĸ߸ն
+        mask = np.zeros_like(mask)
+        mask[np.flatnonzero(u > 0)[:1]] = True
+    stiffness = (u[mask] * rf[mask]).sum() / (u[mask] ** 2).sum()
+    return {'peak': peak, 'stiffness': stiffness}
+
+
+def richardson(values, ratio, order=1.0):
+    """
+    Richardson 
+    :param values: ɴֵϸֵָ 2 
+    :param ratio: ܱ h_ / h_ϸ
+    :param order: ٶףʱʹ
+    :return: dict(estimate ֵ, order , gci ϸָ)
+    """
+    values = [float(value) for value in values]
+    f2, f3 = values[-2:]
+    p = order
+    if len(values) >= 3:
+        f1 = values[-3]
+        if (f1 - f2) * (f2 - f3) > 0 and f1 != f2 and f2 != f3:
+            p = math.log(abs((f1 - f2) / (f2 - f3))) / math.log(ratio)
+    denominator = ratio ** p - 1
+    estimate = f3 + (f3 - f2) / denominator
+    gci = 1.25 * abs((f3 - f2) / f3) / denominator if f3 != 0 else float('nan')
+    return {'estimate': estimate, 'order': p, 'gci': gci}
+
+
+class MeshStudy:
+    def __init__(self, name, builder, extract, sizes, start=100.0, ratio=1.5, max_levels=5, tol=0.01,
+                 params=None, queue=None, path=None):
+        """
+        о
+        :param name: оģΪ <о>-L<>
+        :param builder: ģ builder(model_name, submit=False, **params)δύ mdb.Job
+                        submit=False  solve 루params Ѹʱǣύҵ
+        :param extract: ȡ extract(job_name) (λ, )
+        :param sizes: ߴ sizes(h) dict dict(beam_mesh_size=h, pad_mesh_size=h / 2)
+        :param start: ߴ
+        :param ratio: 𼶼ܱ h_ / h_ϸ
+        :param max_levels: ༶
+        :param tol: ָԱ仯ݲ
+        :param params: ཨģ
+        :param queue: ҵ JobQueue / Scheduler
+        :param path: Ŀ¼ĬϵǰĿ¼
+        """
+        self.name = name
+        self.builder = builder
+        self.extract = extract
+        self.sizes = sizes
+        self.start = start
+        self.ratio = ratio
+        self.max_levels = max_levels
+        self.tol = tol
+        self.params = params or {}
+        self.queue = queue
+        self.path = path or os.getcwd()
+        self.levels = []
+        self.estimates = {}
+
+    def size(self, level):
+        return self.start / self.ratio ** level
+
+    def solve(self, level):
+        """
+        ģⲢȡһָ
+        :param level: 0 Ϊ
+        :return: ü¼
+        """
+        h = self.size(level)
+        params = dict(self.params)
+        params.setdefault('submit', False)
+        params.update(self.sizes(h))
+        job = check_unsubmitted(self.builder('%s-L%d' % (self.name, level), **params))
+        job.writeInput(consistencyChecking=False)
+        self.queue.add(job.name)
+        result = self.queue.run()[job.name]
+        if result['returncode'] != 0:
+            raise RuntimeError('ҵ ' + job.name + ' ʧܣֵ %d' % result['returncode'])
+
+        u, rf = self.extract(job.name)
+        record = {'level': level, 'size': h, 'job': job.name, 'wall': result['wall']}
+        record.update(curve_metrics(u, rf))
+        return record
+
+    def changes(self):
+        """
+        ָԱ仯
+        """
+        if len(self.levels) < 2:
+            return None
+        fine, coarse = self.levels[-1], self.levels[-2]
+        return dict((name, abs(fine[name] - coarse[name]) / abs(fine[name])) for name in METRICS)
+
+    def run(self):
+        """
+        𼶼ﵽ༶
+        :return: dict(ָ: Richardson ƽ)
+        """
+        for level in range(self.max_levels):
+            record = self.solve(level)
+            self.levels.append(record)
+            changes = self.changes()
+            record.update(dict(('d_' + name, changes[name] if changes else float('nan')) for name in METRICS))
+            print('Python:  %d ߴ %.4g ֵ %.6g ʼն %.6g' % (
+                level, record['size'], record['peak'], record['stiffness']))
+            if changes is not None and max(changes.values()) < self.tol:
+                print('Python: Ա仯 ' +
+                      ''.join('%s %.3g%%' % (name, changes[name] * 100) for name in METRICS))
+                break
+
+        if len(self.levels) >= 2:
+            for name in METRICS:
+                self.estimates[name] = richardson([record[name] for record in self.levels], self.ratio)
+                print('Python: %s ֵ %.6g %.3gGCI %.3g%%' % (
+                    name, self.estimates[name]['estimate'], self.estimates[name]['order'],
+                    self.estimates[name]['gci'] * 100))
+        self.save()
+        return self.estimates
+
+    @property
+    def converged_size(self):
+        """
+        ݲߴ磨δʱΪ None
+        """
+        changes = self.changes()
+        if changes is not None and max(changes.values()) < self.tol:
+            return self.levels[-2]['size']
+        return None
+
+    def save(self):
+        """
+        д MeshStudy-<о>.csvĩΪֵ
+        """
+        columns = ['level', 'size', 'job', 'wall'] + list(METRICS) + ['d_' + name for name in METRICS]
+        with open(os.path.join(self.path, 'MeshStudy-' + self.name + '.csv'), 'w') as file:
+            writer = csv.writer(file, lineterminator='\n')
+            writer.writerow(columns)
+            for record in self.levels:
+                writer.writerow([record[column] for column in columns])
+            if self.estimates:
+                writer.writerow(['richardson', 0.0, '', ''] +
+                                [self.estimates[name]['estimate'] for name in METRICS] + ['', ''])
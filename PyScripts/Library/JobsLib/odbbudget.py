@@ -0,0 +1,175 @@
+# coding=cp936
+"""
+ODB Ԥ
+
+* ÿ֡עɰ򡢰ʱ (numIntervals) ĳ
+* ȫģֻĬ UӦӦ䡢ֻڹעжΡֽ
+* ԪڵԤ ODB Сʱ𲽼֡
+"""
+import os
+from stafile import read_sta, converged
+
+# (ʵ嵥Ԫ, ܵԪ)0 Ϊ൥Ԫ޴
+FIELD_COMPONENTS = {'S': (6, 1), 'E': (6, 1), 'LE': (6, 1), 'PE': (6, 1), 'PEEQ': (1, 1),
+                    'DAMAGEC': (1, 0), 'DAMAGET': (1, 0), 'SDEG': (1, 0),
+                    'U': (3, 3), 'RF': (3, 3), 'CF': (3, 3), 'COORD': (3, 3)}
+# ڵఴԪֵ
+NODAL_VARIABLES = ('U', 'RF', 'CF', 'COORD')
+# ԭȫ
+FULL_VARIABLES = ('E', 'S', 'U', 'DAMAGEC', 'DAMAGET')
+# ĬϹע
+REGION_VARIABLES = {'Midspan': ('E', 'S', 'DAMAGEC', 'DAMAGET'),
+                    'Rein': ('E', 'S')}
+
+# ֽڹ㣺ֵÿ֡ÿ鿪ڵ뵥Ԫ塢ݵ (ʱ, ֵ)
+_VALUE = 4
+_BLOCK = 2048
+_NODE = 16
+_ELEMENT = 40
+_HISTORY = 8
+_MB = 1024.0 ** 2
+
+
+def region_counts(region):
+    """
+    Ԫڵ뵥Ԫ
+    :param region: ϻʵ elementsnodes
+    :return: dict(elements, nodes, solid)solid Ϊ False ʾ/Ԫ
+    """
+    elements = region.elements
+    solid = not len(elements) or not str(elements[0].type).startswith(('T', 'B'))
+    return {'elements': len(elements), 'nodes': len(region.nodes), 'solid': solid}
+
+
+def field_size(counts, variables):
+    """
+    ֽ֡
+    :param counts: region_counts ֵ
+    :param variables: 
+    """
+    size = 0
+    for name in variables:
+        solid, truss = FIELD_COMPONENTS.get(name, (1, 1))
+        components = solid if counts['solid'] else truss
+        if components:
+            number = counts['nodes'] if name in NODAL_VARIABLES else counts['elements']
+            size += number * components * _VALUE + _BLOCK
+    return size
+
+
+def predict_odb_size(model, requests, frames, increments, history_outputs=0):
+    """
+     ODB С
+    :param model: ȫģ region_counts
+    :param requests: [(region_counts, ), ...]
+    :param frames: ֡
+    :param increments: 
+    :param history_outputs: ÿдݵ
+    :return: ֽ
+    """
+    size = model['nodes'] * _NODE + model['elements'] * _ELEMENT
+    frame = sum(field_size(counts, variables) for counts, variables in requests)
+    for num, inc in zip(frames, increments):
+        size += (min(num, inc) + 1) * frame + inc * history_outputs * _HISTORY
+    return size
+
+
+def expected_increments(sta_path):
+    """
+    һͬģҵ .sta ȡ
+    :param sta_path: .sta ·
+    :return: {( 1 ʼ): } .sta ʱΪ {}
+    """
+    if not os.path.exists(sta_path):
+        return {}
+    table = converged(read_sta(sta_path))
+    steps = table[:, 0].astype(int)
+    return dict((step, int((steps == step).sum())) for step in set(steps.tolist()))
+
+
+class OutputBudget:
+    def __init__(self,
+                 frames=10,
+                 regions=None,
+                 global_variables=('U',),
+                 history_outputs=4,
+                 limit=None,
+                 increments=100):
+        """
+        ODB Ԥ
+        :param frames: ÿ֡int  {: ֡}
+        :param regions: {: }Ĭ REGION_VARIABLESжΡֽ
+        :param global_variables: ȫģͳ
+        :param history_outputs: ÿݵ
+        :param limit: ODB С MBΪ None ʱƣʱ𲽼֡ÿ 1 ֡
+        :param increments: ÿԤint{: } һҵ .sta ·
+        """
+        self.frames = frames
+        self.regions = REGION_VARIABLES if regions is None else regions
+        self.global_variables = tuple(global_variables)
+        self.history_outputs = history_outputs
+        self.limit = limit
+        self.increments = increments
+        self.size = None
+        self.full_size = None
+
+    def step_values(self, value, steps, default):
+        """
+        չ int / dict 
+        """
+        if isinstance(value, dict):
+            return [value.get(step, default) for step in steps]
+        return [value] * len(steps)
+
+    def step_increments(self, steps, default=100):
+        if isinstance(self.increments, str):
+            found = expected_increments(self.increments)
+            return [found.get(i + 1, default) for i in range(len(steps))]
+        return self.step_values(self.increments, steps, default)
+
+    def apply(self, model, steps, regions):
+        """
+        󲢹 ODB С
+        :param model: ģ
+        :param steps: ڵһ֡޸
+        :param regions: {: }ֻ self.regions г
+        :return: ԤС MB
+        """
+        counts = {'elements': 0, 'nodes': 0, 'solid': True}
+        for instance in model.rootAssembly.instances.values():
+            counts['elements'] += len(instance.elements)
+            counts['nodes'] += len(instance.nodes)
+
+        names = [name for name in sorted(self.regions) if name in regions]
+        requests = [(counts, self.global_variables)] + \
+                   [(region_counts(regions[name]), self.regions[name]) for name in names]
+        increments = self.step_increments(steps)
+        frames = self.step_values(self.frames, steps, 10)
+
+        size = predict_odb_size(counts, requests, frames, increments, self.history_outputs)
+        while self.limit is not None and size / _MB > self.limit and max(frames) > 1:
+            frames = [max(1, min(num - 1, int(num * 0.9))) for num in frames]
+            size = predict_odb_size(counts, requests, frames, increments, self.history_outputs)
+        self.size = size / _MB
+        self.full_size = predict_odb_size(counts, [(counts, FULL_VARIABLES)], increments, increments,
+                                          self.history_outputs) / _MB
+
+        # 
+        outputs = [('F-Output-1', self.global_variables, None)] + \
+                  [('F-Output-' + name, self.regions[name], regions[name]) for name in names]
+        for name, variables, region in outputs:
+            kwargs = {} if region is None else {'region': region}
+            model.FieldOutputRequest(name=name,
+                                     createStepName=steps[0],
+                                     variables=tuple(variables),
+                                     numIntervals=frames[0],
+                                     **kwargs)
+            for step, num in zip(steps[1:], frames[1:]):
+                if num != frames[0]:
+                    model.fieldOutputRequests[name].setValuesInStep(stepName=step, numIntervals=num)
+
+        print('Python: ODB Ԥ %.1f MBÿ֡ %sע %sȫԼ %.1f MB' % (
+            self.size, '/'.join(str(num) for num in frames), ''.join(names) or '', self.full_size))
+        if self.limit is not None and self.size > self.limit:
+            print('Python: 棬ÿ 1 ֡Գ %.1f MB' % self.limit)
+        return self.size
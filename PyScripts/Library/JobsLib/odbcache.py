@@ -0,0 +1,281 @@
+# coding=cp936
+"""
+ODB ȡ
+
+*  (ODB ·, ȡ) Ϊ¼ ODB ļС޸ʱ֡
+* ļС޸ʱ䲻ʱֱӷػ棬 ODB
+* ODB еҵ֡ԭ֡ʱֻ֡׷ӣ
+  ֻضһѻķODB Сύͬҵʱȫض
+* ڴ +  .npz 棬ļдʱļٸɶ̹
+"""
+import os
+import json
+import tempfile
+from collections import OrderedDict
+import numpy as np
+from ..ToolsLib.lazy import LazyModule
+from ..MaterialsLib.tablecache import table_key
+from odbfield import FieldData, frame_counts, extract_fields
+from odbhistory import HistoryTable, extract_history
+
+_odbAccess = LazyModule('odbAccess')
+
+
+def odb_identity(path):
+    """
+    ODB ļʶ
+    :return: (ֽ, ޸ʱ)
+    """
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime
+
+
+def odb_region(odb, region):
+    """
+    ȡ ODB 
+    :param odb: ODB 
+    :param region: '<ʵ>.<>' װ伯Ȳڵ㼯ٲ鵥ԪΪ None ʱ None
+    """
+    if region is None:
+        return None
+    owner = odb.rootAssembly
+    if '.' in region:
+        instance, region = region.split('.', 1)
+        owner = owner.instances[instance]
+    if region in owner.nodeSets.keys():
+        return owner.nodeSets[region]
+    return owner.elementSets[region]
+
+
+def kept_frames(cached, counts):
+    """
+    ֡Ƿ ODB ǰ׺
+    :param cached: ʱ [(, ֡), ...]
+    :param counts: ǰ [(, ֡), ...]
+    :return: ɱ֡ʱΪ None
+    """
+    if len(cached) > len(counts):
+        return None
+    for i, ((name, count), (new_name, new_count)) in enumerate(zip(cached, counts)):
+        if name != new_name or count > new_count or (count < new_count and i != len(cached) - 1):
+            return None
+    return sum(count for name, count in cached)
+
+
+class OdbCache:
+    def __init__(self, path=None):
+        """
+        ODB ȡ
+        :param path: ̻Ŀ¼Ϊ None ʱʹڴ滺
+        """
+        self.path = path
+        self.hits = 0
+        self.appends = 0
+        self.misses = 0
+        self._memory = {}
+
+    def __getstate__(self):
+        # ̳ʱֻĿ¼
+        state = self.__dict__.copy()
+        state['_memory'] = {}
+        return state
+
+    def _file(self, key):
+        return os.path.join(self.path, key + '.npz')
+
+    def _load(self, key):
+        """
+        ȡ棬ļڻʱΪ None
+        :return: (meta, {: })
+        """
+        if key in self._memory:
+            return self._memory[key]
+        if self.path is None or not os.path.exists(self._file(key)):
+            return None
+        try:
+            with np.load(self._file(key)) as data:
+                arrays = dict((name, data[name]) for name in data.files)
+        except (IOError, OSError, ValueError, KeyError):
+            return None
+        entry = json.loads(str(arrays.pop('meta'))), arrays
+        self._memory[key] = entry
+        return entry
+
+    def _dump(self, key, meta, arrays):
+        """
+        д뻺
+        """
+        self._memory[key] = meta, arrays
+        if self.path is None:
+            return
+        if not os.path.exists(self.path):
+            os.makedirs(self.path)
+        fd, temp_path = tempfile.mkstemp(suffix='.tmp', dir=self.path)
+        with os.fdopen(fd, 'wb') as file:
+            np.savez(file, meta=np.array(json.dumps(meta)), **arrays)
+        if os.path.exists(self._file(key)):
+            os.remove(self._file(key))
+        os.rename(temp_path, self._file(key))
+
+    def _lookup(self, key, path):
+        """
+        ļʶһ
+        :return: ( None, ļǷδ)
+        """
+        entry = self._load(key)
+        if entry is None:
+            return None, False
+        return entry, list(entry[0]['identity']) == list(odb_identity(path))
+
+    @staticmethod
+    def _grown(entry, identity):
+        """
+        ODB ǷɻʱļļСΪύҵȫض
+        """
+        return entry is not None and identity[0] >= entry[0]['identity'][0]
+
+    def fields(self, path, variables, region=None, invariants=(), steps=None):
+        """
+         extract_fields
+        :param path: ODB ·
+        :param variables: 
+        :param region:  odb_region
+        :param invariants: ͬ extract_fields
+        :param steps: УΪ None ʱȡȫ
+        :return: ͬ extract_fields
+        """
+        if isinstance(invariants, dict):
+            request = repr(sorted((name, tuple(values)) for name, values in invariants.items()))
+        else:
+            request = repr(tuple(invariants))
+        key = table_key('fields', os.path.abspath(path), repr(tuple(variables)), region, request, repr(steps))
+        entry, unchanged = self._lookup(key, path)
+        if unchanged:
+            self.hits += 1
+            return _unpack_fields(entry)
+
+        identity = odb_identity(path)
+        odb = _odbAccess.openOdb(path, readOnly=True)
+        try:
+            counts = frame_counts(odb, steps)
+            start = kept_frames(entry[0]['counts'], counts) if self._grown(entry, identity) else None
+            result = None
+            if start and start == sum(count for name, count in counts):
+                # ֡
+                result = _unpack_fields(entry)
+            elif start:
+                result = _append_fields(_unpack_fields(entry),
+                                        extract_fields(odb, variables, odb_region(odb, region), invariants, steps,
+                                                       start))
+            if result is None:
+                self.misses += 1
+                result = extract_fields(odb, variables, odb_region(odb, region), invariants, steps)
+            else:
+                self.appends += 1
+        finally:
+            odb.close()
+
+        times, fields = result
+        meta = {'identity': identity, 'counts': counts,
+                'names': list(fields), 'components': [list(field.components) for field in fields.values()]}
+        arrays = {'times': times}
+        for i, field in enumerate(fields.values()):
+            arrays['v%d' % i] = field.values
+            arrays['l%d' % i] = field.labels
+        self._dump(key, meta, arrays)
+        return times, fields
+
+    def history(self, path, steps=None):
+        """
+         extract_history
+        :param path: ODB ·
+        :param steps: УΪ None ʱȡȫ
+        :return: HistoryTable
+        """
+        key = table_key('history', os.path.abspath(path), repr(steps))
+        entry, unchanged = self._lookup(key, path)
+        if unchanged:
+            self.hits += 1
+            return _unpack_history(entry)
+
+        identity = odb_identity(path)
+        odb = _odbAccess.openOdb(path, readOnly=True)
+        try:
+            names = list(odb.steps.keys() if steps is None else steps)
+            cached = entry[0]['steps'] if self._grown(entry, identity) else []
+            if cached and names[:len(cached)] == cached:
+                # һѻڼ㣬ͬķض
+                self.appends += 1
+                table = _join_history(_unpack_history(entry), extract_history(odb, names[len(cached) - 1:]))
+            else:
+                self.misses += 1
+                table = extract_history(odb, names)
+        finally:
+            odb.close()
+
+        meta = {'identity': identity, 'steps': table.step_names, 'names': list(table.columns)}
+        arrays = {'offsets': table.offsets, 'time': table.time, 'total_time': table.total_time}
+        for i, values in enumerate(table.columns.values()):
+            arrays['c%d' % i] = values
+        self._dump(key, meta, arrays)
+        return table
+
+    def report(self):
+        """
+        ӡͳ
+        :return: (, , δ)
+        """
+        print('Python: ODB ȡ  %d Σ %d Σδ %d ' % (self.hits, self.appends, self.misses))
+        return self.hits, self.appends, self.misses
+
+
+def _unpack_fields(entry):
+    meta, arrays = entry
+    fields = OrderedDict((name, FieldData(arrays['v%d' % i], arrays['l%d' % i], tuple(meta['components'][i])))
+                         for i, name in enumerate(meta['names']))
+    return arrays['times'], fields
+
+
+def _append_fields(old, new):
+    """
+    ׷֡ݸ뻺治ͬʱ None
+    """
+    old_times, old_fields = old
+    times, fields = new
+    if not len(times):
+        return old
+    if list(old_fields) != list(fields):
+        return None
+    joined = OrderedDict()
+    for name, field in fields.items():
+        previous = old_fields[name]
+        if previous.values.shape[1:] != field.values.shape[1:]:
+            return None
+        joined[name] = FieldData(np.concatenate([previous.values, field.values]), previous.labels,
+                                 previous.components)
+    return np.concatenate([old_times, times]), joined
+
+
+def _unpack_history(entry):
+    meta, arrays = entry
+    columns = OrderedDict((name, arrays['c%d' % i]) for i, name in enumerate(meta['names']))
+    return HistoryTable(list(meta['steps']), arrays['offsets'], arrays['time'], arrays['total_time'], columns)
+
+
+def _join_history(old, new):
+    """
+     new 滻 old һ
+    """
+    keep = old.offsets[len(old.step_names) - 1]
+    offsets = np.concatenate([old.offsets[:-1], new.offsets[1:] + keep])
+    columns = OrderedDict()
+    for name in list(old.columns) + [name for name in new.columns if name not in old.columns]:
+        values = np.full(offsets[-1], np.nan)
+        if name in old.columns:
+            values[:keep] = old.columns[name][:keep]
+        if name in new.columns:
+            values[keep:] = new.columns[name]
+        columns[name] = values
+    return HistoryTable(old.step_names[:-1] + new.step_names, offsets,
+                        np.concatenate([old.time[:keep], new.time]),
+                        np.concatenate([old.total_time[:keep], new.total_time]), columns)
@@ -0,0 +1,148 @@
+# coding=cp936
+"""
+ODB ȡ
+
+* ÿֻ֡ȡһγ bulkDataBlocks ȡ FieldValue
+* ֡֡Ԥ float32 飬֡д룬֡ظ
+* maxPrincipalmises ȣ getScalarField ͬȡ
+"""
+from collections import namedtuple, OrderedDict
+import numpy as np
+from ..ToolsLib.lazy import LazyModule
+
+# FieldValue -> abaqusConstants 
+INVARIANTS = {'mises': 'MISES',
+              'tresca': 'TRESCA',
+              'press': 'PRESS',
+              'inv3': 'INV3',
+              'magnitude': 'MAGNITUDE',
+              'maxPrincipal': 'MAX_PRINCIPAL',
+              'midPrincipal': 'MID_PRINCIPAL',
+              'minPrincipal': 'MIN_PRINCIPAL',
+              'maxInPlanePrincipal': 'MAX_INPLANE_PRINCIPAL',
+              'minInPlanePrincipal': 'MIN_INPLANE_PRINCIPAL',
+              'outOfPlanePrincipal': 'OUTOFPLANE_PRINCIPAL'}
+
+# ȡ
+# values: (֡, ݸ, )벻Ϊ (֡, ݸ)֡ȱٸñʱΪ nan
+# labels: ݵĽڵŻԪ
+# components: 벻Ϊ ()
+FieldData = namedtuple('FieldData', ['values', 'labels', 'components'])
+
+_constants = LazyModule('abaqusConstants')
+
+
+def frame_counts(odb, steps=None):
+    """
+    ֡
+    :param odb: ODB 
+    :param steps: УΪ None ʱȡȫ
+    :return: [(, ֡), ...]
+    """
+    if steps is None:
+        steps = odb.steps.keys()
+    return [(name, len(odb.steps[name].frames)) for name in steps]
+
+
+def odb_frames(odb, steps=None):
+    """
+    ˳г֡
+    :param odb: ODB 
+    :param steps: УΪ None ʱȡȫ
+    :return: [(, ֡), ...]
+    """
+    return [(odb.steps[name], i) for name, count in frame_counts(odb, steps) for i in range(count)]
+
+
+def field_invariants(invariants, name):
+    """
+     name ȡĲ
+    :param invariants: Уг {: }
+    :param name: 
+    """
+    if isinstance(invariants, dict):
+        return tuple(invariants.get(name, ()))
+    return tuple(invariants)
+
+
+def _blocks(field):
+    """
+    ϲݿ
+    :return: ( (n, ),  (n,))
+    """
+    data = []
+    labels = []
+    for block in field.bulkDataBlocks:
+        values = np.asarray(block.data)
+        if not len(values):
+            continue
+        data.append(values.reshape(len(values), -1))
+        nodes = block.nodeLabels
+        labels.append(np.asarray(nodes if nodes is not None and len(nodes) else block.elementLabels))
+    if not data:
+        return np.zeros((0, 1), dtype=np.float32), np.zeros(0, dtype=int)
+    return np.concatenate(data), np.concatenate(labels)
+
+
+def _sources(field, name, invariants):
+    """
+    ֡еĴȡԴ
+    :return: [(, , ), ...]
+    """
+    sources = [(name, field, tuple(field.componentLabels))]
+    valid = set(str(invariant) for invariant in field.validInvariants)
+    for invariant in field_invariants(invariants, name):
+        constant = INVARIANTS[invariant]
+        if constant in valid:
+            scalar = field.getScalarField(invariant=getattr(_constants, constant))
+            sources.append((name + '.' + invariant, scalar, ()))
+    return sources
+
+
+def extract_fields(odb, variables, region=None, invariants=(), steps=None, start=0):
+    """
+    ȡ
+    :param odb: ODB 
+    :param variables: У ('S', 'E', 'U', 'DAMAGET')
+    :param region: OdbSet  OdbInstanceΪ None ʱȡģ
+    :param invariants: Уָ֧òĳ {: }
+                       ͬ FieldValue ԣ 'maxPrincipal''mises'
+    :param steps: УΪ None ʱȡȫ
+    :param start: ʼ֡ odb_frames ˳ƣֻȡ֡
+    :return: (ʱ (֡,), OrderedDict{: FieldData})ĽΪ '<>.<>' 'S.mises'
+    """
+    frames = odb_frames(odb, steps)[start:]
+    times = np.zeros(len(frames))
+    fields = OrderedDict()
+
+    for index, (step, number) in enumerate(frames):
+        frame = step.frames[number]
+        times[index] = step.totalTime + frame.frameValue
+        outputs = frame.fieldOutputs
+
+        for name in variables:
+            if name not in outputs.keys():
+                continue
+            field = outputs[name]
+            if region is not None:
+                field = field.getSubset(region=region)
+
+            for key, source, components in _sources(field, name, invariants):
+                data, labels = _blocks(source)
+
+                # ״γʱԤ
+                if key not in fields:
+                    shape = (len(frames), len(data)) + ((data.shape[1],) if components else ())
+                    values = np.full(shape, np.nan, dtype=np.float32)
+                    fields[key] = FieldData(values, labels, components)
+
+                values = fields[key].values
+                if len(data) != values.shape[1]:
+                    raise ValueError('%s  %d ֡ݸ %d ֡ %d ͬ' % (
+                        key, start + index, len(data), values.shape[1]))
+                values[index] = data if components else data[:, 0]
+
+    missing = [name for name in variables if name not in fields]
+    if missing:
+        print('Python: δҵ ' + ''.join(missing))
+    return times, fields
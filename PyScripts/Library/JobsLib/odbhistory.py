@@ -0,0 +1,173 @@
+# coding=cp936
+"""
+ODB ʽȡ
+
+* һαȫ򣬶ȡÿȫ²
+* ݶһд붨飬Ϊݵ㣬šʱʼ
+* ֧ӶȵԹӴѡУ / ȡеȺϵ
+"""
+import csv
+from collections import namedtuple, OrderedDict
+import numpy as np
+
+# 
+# name: 
+# outputs:  ('RF3',)
+# regions: ӴΪʱ
+# op: ϲʽ RULE_OPS
+# scale: ϵ
+HistoryRule = namedtuple('HistoryRule', ['name', 'outputs', 'regions', 'op', 'scale'])
+
+RULE_OPS = {'sum': lambda values: values.sum(axis=0),
+            'mean': lambda values: values.mean(axis=0),
+            'max': lambda values: values.max(axis=0),
+            'min': lambda values: values.min(axis=0),
+            'first': lambda values: values[0]}
+
+
+def history_rule(name, outputs, regions=(), op='sum', scale=1.0):
+    """
+    
+    :param name: 
+    :param outputs: 
+    :param regions: ӴУΪʱ
+    :param op: ϲʽ 'sum''mean''max''min''first'
+    :param scale: ϵԳģ͵ 2 ** symmetryӶȡ -1
+    """
+    if op not in RULE_OPS:
+        raise ValueError('δ֪ϲʽ ' + op)
+    return HistoryRule(name, tuple(outputs), tuple(regions), op, scale)
+
+
+class HistoryTable:
+    def __init__(self, step_names, offsets, time, total_time, columns):
+        """
+        ʽ extract_history 
+        :param step_names: 
+        :param offsets: ʼУΪ + 1
+        :param time: ʱ (,)
+        :param total_time: ʱ (,)
+        :param columns: OrderedDict{'<>:<>': (,)}޸ʱΪ nan
+        """
+        self.step_names = step_names
+        self.offsets = offsets
+        self.time = time
+        self.total_time = total_time
+        self.columns = columns
+        self.derived = OrderedDict()
+
+        # ÿеķţ 0 ʼ벽
+        counts = np.diff(offsets)
+        self.step = np.repeat(np.arange(len(counts)), counts)
+        self.increment = np.arange(len(time)) - offsets[self.step]
+
+    def __len__(self):
+        return len(self.time)
+
+    def __getitem__(self, name):
+        if name in self.derived:
+            return self.derived[name]
+        return self.columns[name]
+
+    def step_rows(self, step):
+        """
+        зΧ
+        :param step: 
+        :return: slice
+        """
+        if not isinstance(step, int):
+            step = self.step_names.index(step)
+        return slice(self.offsets[step], self.offsets[step + 1])
+
+    def select(self, outputs=(), regions=()):
+        """
+        Ӵѡ
+        :return: бд˳
+        """
+        names = []
+        for name in self.columns:
+            region, output = name.rsplit(':', 1)
+            if outputs and output not in outputs:
+                continue
+            if regions and not any(part in region for part in regions):
+                continue
+            names.append(name)
+        return names
+
+    def derive(self, rules):
+        """
+        Թ derived
+        :param rules: HistoryRule 
+        :return: 飬˳ͬ rules
+        """
+        results = []
+        for rule in rules:
+            names = self.select(rule.outputs, rule.regions)
+            if not names:
+                raise KeyError(' %s ƥ %s' % (rule.name, ''.join(rule.outputs)))
+            values = RULE_OPS[rule.op](np.array([self.columns[name] for name in names])) * rule.scale
+            self.derived[rule.name] = values
+            results.append(values)
+        return results
+
+    def to_csv(self, path, names, headers=None):
+        """
+        д csv
+        :param path: csv ·
+        :param names: 
+        :param headers: ͷĬͬ
+        """
+        with open(path, mode='w') as file:
+            writer = csv.writer(file, lineterminator='\n')
+            writer.writerow(list(headers or names))
+            writer.writerows(np.column_stack([self[name] for name in names]))
+
+
+def extract_history(odb, steps=None):
+    """
+    һαȡȫ
+    ͬһݵͬʱֵòݵʱ
+    :param odb: ODB 
+    :param steps: УΪ None ʱȡȫ
+    :return: HistoryTable
+    """
+    if steps is None:
+        steps = odb.steps.keys()
+
+    # 𲽶ȡ¼ʱ
+    step_times = []
+    step_data = []
+    columns = OrderedDict()
+    for name in steps:
+        step = odb.steps[name]
+        outputs = []
+        for region_name, region in step.historyRegions.items():
+            for output_name, output in region.historyOutputs.items():
+                outputs.append((region_name + ':' + output_name,
+                                np.asarray(output.data, dtype=float).reshape(-1, 2)))
+                columns.setdefault(outputs[-1][0], None)
+
+        time = max([values[:, 0] for key, values in outputs], key=len) if outputs else np.zeros(0)
+        data = {}
+        for key, values in outputs:
+            if len(values) == len(time):
+                data[key] = values[:, 1]
+            else:
+                data[key] = np.interp(time, values[:, 0], values[:, 1])
+        step_times.append((step.totalTime, time))
+        step_data.append(data)
+
+    # һд붨
+    offsets = np.concatenate([[0], np.cumsum([len(times) for start, times in step_times])]).astype(int)
+    rows = offsets[-1]
+    time = np.zeros(rows)
+    total_time = np.zeros(rows)
+    table = OrderedDict((key, np.full(rows, np.nan)) for key in columns)
+    for i, ((total, times), data) in enumerate(zip(step_times, step_data)):
+        block = slice(offsets[i], offsets[i + 1])
+        time[block] = times
+        total_time[block] = total + times
+        for key, values in data.items():
+            table[key][block] = values
+
+    return HistoryTable(list(steps), offsets, time, total_time, table)
@@ -0,0 +1,169 @@
+# coding=cp936
+"""
+ ODB 
+
+*  abaqus python УCAE ں˽̲ӽ̣ÿڶд򿪡ȡرһ ODB
+  ˳ͷ odbAccess ռõڴ
+* ͬʱеĽ processes ƣÿԽʱ timeout ֹ
+*  .lck ҵУ running=Trueȱ .odb ҵύȡʱ̱𻵵
+  ODBҵ¼ԭ
+* ҵҵ˳Ϊһ csv
+"""
+import os
+import csv
+import time
+import traceback
+import multiprocessing
+from collections import OrderedDict
+import numpy as np
+
+
+def _extract_task(args):
+    """
+    ̳񣺵 extract(job, context, **kwargs)쳣
+    :return: (ҵ, ״̬, , Ϣ, ʱ s)
+    """
+    extract, job, context, kwargs = args
+    start = time.time()
+    try:
+        return job, 'done', extract(job, context, **kwargs), None, time.time() - start
+    except Exception:
+        return job, 'error', None, traceback.format_exc().strip().splitlines()[-1], time.time() - start
+
+
+def _extract_worker(conn, task):
+    """
+    ӽڣִ񲢾ܵͻؽ
+    """
+    conn.send(_extract_task(task))
+    conn.close()
+
+
+class PostPool:
+    def __init__(self, extract, context, processes=None, timeout=3600.0, running=False, poll=0.1, **kwargs):
+        """
+         ODB 
+        :param extract: ȡ extract(ҵ, context, **kwargs)Ϊģ鼶 after.extract_urf
+                        ɵȳ飨 {: }ڻ
+        :param context:  RunContextODB λ乤Ŀ¼
+        :param processes: Ĭ cpu ҵеĽСֵ
+        :param timeout: ҵԽʱ sʱֹ̣Ϊ None ʱ
+        :param running: ǷȡУ .lckҵ OdbCache ڼ䷴ˢ
+        :param poll: ״̬ļ s
+        :param kwargs:  extract cache=OdbCache(...)
+        """
+        self.extract = extract
+        self.context = context
+        self.processes = processes
+        self.timeout = timeout
+        self.running = running
+        self.poll = poll
+        self.kwargs = kwargs
+        self.results = OrderedDict()
+
+    def check(self, job):
+        """
+        ύǰ ODB
+        :return: ύʱΪ NoneΪ״̬ 'locked' / 'missing'
+        """
+        if not self.running and os.path.exists(self.context.work(job + '.lck')):
+            return 'locked'
+        if not os.path.exists(self.context.work(job + '.odb')):
+            return 'missing'
+        return None
+
+    def _record(self, job, status, result=None, error=None, wall=0.0):
+        self.results[job] = {'status': status, 'result': result, 'error': error, 'wall': wall}
+        if status == 'done':
+            print('Python: ȡ %s ɣʱ %.1f s' % (job, wall))
+        else:
+            print('Python: ȡ %s δ (%s)%s' % (job, status, '' + error if error else ''))
+
+    def run(self, jobs):
+        """
+        ȡȫҵȫ
+        :param jobs: ҵ
+        :return: OrderedDict{ҵ: dict(status, result, error, wall)}
+                 status Ϊ done/error/timeout/crashed/locked/missing
+        """
+        tasks = []
+        for job in jobs:
+            status = self.check(job)
+            if status is None:
+                tasks.append((self.extract, job, self.context, self.kwargs))
+            else:
+                self._record(job, status)
+
+        processes = self.processes or min(multiprocessing.cpu_count(), max(len(tasks), 1))
+        running = []
+        while tasks or running:
+            while tasks and len(running) < processes:
+                task = tasks.pop(0)
+                receiver, sender = multiprocessing.Pipe(duplex=False)
+                process = multiprocessing.Process(target=_extract_worker, args=(sender, task))
+                process.start()
+                sender.close()
+                running.append((task[1], process, receiver, time.time()))
+
+            time.sleep(self.poll)
+            for item in list(running):
+                job, process, receiver, start = item
+                # Ȳٲ̣ͻؽ˳Ľ̲Ϊ
+                if receiver.poll() or not process.is_alive():
+                    try:
+                        self._record(*receiver.recv())
+                    except (EOFError, IOError):
+                        process.join()
+                        self._record(job, 'crashed', error='̷ֵ %s' % process.exitcode,
+                                     wall=time.time() - start)
+                elif self.timeout is not None and time.time() - start > self.timeout:
+                    process.terminate()
+                    self._record(job, 'timeout', wall=time.time() - start)
+                else:
+                    continue
+                process.join()
+                receiver.close()
+                running.remove(item)
+
+        # ˳
+        self.results = OrderedDict((job, self.results[job]) for job in jobs)
+        self.report()
+        return self.results
+
+    def report(self):
+        """
+        ӡ״̬ҵ
+        :return: {״̬: ҵ}
+        """
+        counts = {}
+        for result in self.results.values():
+            counts[result['status']] = counts.get(result['status'], 0) + 1
+        print('Python:  %d ҵ' % len(self.results) +
+              ''.join('%s %d' % (status, counts[status]) for status in sorted(counts)))
+        return counts
+
+    def save(self, path, headers=None):
+        """
+        ҵƴдһ csvΪҵ
+        :param path: csv ·
+        :param headers: Ϊ dict ʱĬȡ
+        :return: д
+        """
+        rows = 0
+        with open(path, mode='w') as file:
+            writer = csv.writer(file, lineterminator='\n')
+            for job, result in self.results.items():
+                if result['status'] != 'done' or result['result'] is None:
+                    continue
+                columns = result['result']
+                if isinstance(columns, dict):
+                    headers = headers or list(columns.keys())
+                    columns = [columns[name] for name in headers]
+                columns = np.column_stack(columns)
+                if not rows:
+                    writer.writerow(['Job'] + list(headers or ['V%d' % i for i in range(columns.shape[1])]))
+                for row in columns:
+                    writer.writerow([job] + list(row))
+                rows += len(columns)
+        print('Python:  %d д %s' % (rows, path))
+        return rows
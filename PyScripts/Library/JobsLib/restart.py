@@ -0,0 +1,143 @@
+# coding=cp936
+"""
+
+
+* ԭҵ inp  .sta ҵһдݵ
+*  inp*Restart, read Ӹ룬 end step ԭ
+  ԸƵķɸĲơߺأ̲ظ
+* ҵ "abaqus job=<ҵ> oldjob=<ԭҵ>" ύԭҵ .res/.mdl/.stt/.prt/.odb
+"""
+import io
+import os
+import re
+from stafile import read_sta, converged
+from inpstamp import InpVariant, _stamp, _check, _ENCODING
+
+# ԭҵļ
+RESTART_FILES = ('.res', '.mdl', '.stt', '.prt', '.odb')
+
+
+def check_restart_files(job, path=None):
+    """
+    ԭҵļ
+    :param job: ԭҵ
+    :param path: Ŀ¼ĬϵǰĿ¼
+    """
+    path = path or os.getcwd()
+    missing = [job + ext for ext in RESTART_FILES if not os.path.exists(os.path.join(path, job + ext))]
+    if missing:
+        raise IOError('ȱļ' + ', '.join(missing))
+
+
+def _steps(lines):
+    """
+    λ
+    :return: [(, ʼ, *End Step ), ...]
+    """
+    steps = []
+    for index, line in enumerate(lines):
+        lower = line.lower()
+        if lower.startswith('*step'):
+            steps.append([re.search(r'name=([^,\s]+)', line, re.I).group(1), index, None])
+        elif lower.startswith('*end step'):
+            steps[-1][2] = index
+    return [tuple(step) for step in steps]
+
+
+def restart_frequency(lines):
+    """
+     *Restart, write дƵʣδдʱΪ 0
+    """
+    for line in lines:
+        if line.lower().startswith('*restart') and 'write' in line.lower():
+            match = re.search(r'frequency\s*=\s*(\d+)', line, re.I)
+            return int(match.group(1)) if match else 0
+    return 0
+
+
+def last_restart_increment(sta_path, step, frequency):
+    """
+    һдݵ
+    :param sta_path: ԭҵ .sta ·
+    :param step: ţ 1 ʼ
+    :param frequency: дƵ
+    :return: ţ޿ʱΪ 0
+    """
+    table = converged(read_sta(sta_path))
+    incs = table[table[:, 0] == step, 1].astype(int)
+    if not len(incs) or frequency <= 0:
+        return 0
+    # ʱĩܻд
+    if (table[:, 0] > step).any():
+        return int(incs.max())
+    incs = incs[incs % frequency == 0]
+    return int(incs.max()) if len(incs) else 0
+
+
+def restart_inp(base, job, step='Step-2', inc=None, end_step=True, new_step=None, variant=None,
+                frequency=None, oldjob=None, path=None, check=True):
+    """
+     inp
+    :param base: ԭҵ inp ·
+    :param job: ҵ
+    :param step: ķ
+    :param inc: Ϊ None ʱȡ .sta һдݵ
+    :param end_step: Ƿڶ봦ԭԸƵ·ɸĲأ
+                     Ϊ False ʱֻԭüʣķ
+    :param new_step: ·Ĭ <ԭ>-R
+    :param variant: InpVariant·ĸд .static('Step-2-R', maximum=0.05).load('Load-CF', -150e3)
+    :param frequency: ·дƵʣĬͬԭ
+    :param oldjob: ԭҵĬ base ļ
+    :param path: Ŀ¼Ĭ base Ŀ¼
+    :param check: Ƿԭҵļ
+    :return: ( inp ·, ԭҵ)
+    """
+    directory = os.path.dirname(os.path.abspath(base))
+    path = path or directory
+    oldjob = oldjob or os.path.splitext(os.path.basename(base))[0]
+    if check:
+        check_restart_files(oldjob, directory)
+
+    with io.open(base, encoding=_ENCODING, newline='') as file:
+        lines = file.readlines()
+    steps = _steps(lines)
+    names = [name for name, start, end in steps]
+    if step not in names:
+        raise ValueError(base + ' ûз ' + step)
+    number = names.index(step) + 1
+    name, start, end = steps[number - 1]
+    block = lines[start:end + 1]
+
+    old_frequency = restart_frequency(block)
+    if old_frequency <= 0:
+        raise ValueError(oldjob + ' ķ ' + step + ' δдݣ*Restart, write, frequency=0')
+    if inc is None:
+        inc = last_restart_increment(os.path.join(directory, oldjob + '.sta'), number, old_frequency)
+        if inc <= 0:
+            raise ValueError(oldjob + ' ķ ' + step + ' дݵ')
+
+    eol = lines[0][len(lines[0].rstrip('\r\n')):]
+    text = ['*Heading' + eol,
+            '** Job name: %s Model name: %s%s' % (job, re.sub(r'^Job-', '', job), eol),
+            '** Restart from %s, step %d, increment %d%s' % (oldjob, number, inc, eol),
+            '*Restart, read, step=%d, inc=%d%s%s' % (number, inc, ', end step' if end_step else '', eol)]
+
+    if end_step:
+        new_step = new_step or step + '-R'
+        frequency = old_frequency if frequency is None else frequency
+        for line in block:
+            lower = line.lower()
+            if lower.startswith('*step'):
+                line = re.sub(r'name=[^,\s]+', 'name=' + new_step, line, flags=re.I)
+            elif lower.startswith('*restart') and 'write' in lower:
+                line = re.sub(r'frequency\s*=\s*\d+', 'frequency=%d' % frequency, line, flags=re.I)
+            text.append(line)
+
+    variant = variant or InpVariant(job)
+    inp = os.path.join(path, job + '.inp')
+    with io.open(inp, 'w', encoding=_ENCODING, newline='') as output:
+        _stamp(text, [variant], [output])
+    _check(base, [variant])
+
+    print('Python:  ' + job + '  ' + oldjob + '  %d  %d' % (number, inc))
+    return inp, oldjob
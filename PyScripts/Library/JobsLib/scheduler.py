@@ -0,0 +1,253 @@
+# coding=cp936
+"""
+ cpu ֤Ƶȵıҵ
+
+* ҵ .msg  JOB TIME SUMMARY ȡ߳ǽʱ䡢cpu ʱ䣬 Amdahl ϲб
+* ÿҵ߳λԴļٱȡѡȡԴȡ cpu иһʹ
+* ҵƴʱӳĩβҵڿкʱӴ߳ʱ
+"""
+import io
+import os
+import re
+import multiprocessing
+from jobqueue import JobQueue
+
+# δ֪ҵĬϴб
+DEFAULT_SERIAL = 0.1
+
+
+def license_tokens(cpus):
+    """
+    Abaqus  int(5 * N^0.422)
+    :param cpus: cpu 
+    """
+    return int(5 * cpus ** 0.422)
+
+
+def job_family(job):
+    """
+    ҵȥĩβţ Job-SB-003 -> Job-SBͬҵòģ
+    """
+    return re.sub(r'[-_]?\d+$', '', job)
+
+
+def read_msg_times(path):
+    """
+    ȡ .msg ߳ JOB TIME SUMMARY
+    :param path: .msg ·
+    :return: dict(cpus, wall, cpu_time)δɵҵ None
+    """
+    cpus = 1
+    wall = None
+    cpu_time = None
+    summary = False
+    with io.open(path, encoding='cp936', errors='replace') as file:
+        for line in file:
+            match = re.search(r'(?:USING|x)\s+(\d+)\s+THREADS', line)
+            if match:
+                cpus = max(cpus, int(match.group(1)))
+            if 'JOB TIME SUMMARY' in line:
+                summary = True
+            elif summary and 'TOTAL CPU TIME' in line:
+                cpu_time = float(line.split('=')[1])
+            elif summary and 'WALLCLOCK TIME' in line:
+                wall = float(line.split('=')[1])
+    if wall is None:
+        return None
+    return {'cpus': cpus, 'wall': max(wall, 1.0), 'cpu_time': cpu_time}
+
+
+class ScalingModel:
+    def __init__(self, samples=()):
+        """
+        Amdahl ģ wall(n) = T1 * (s + (1 - s) / n)
+        :param samples: ʵ [dict(cpus, wall, cpu_time), ...]
+        """
+        self.samples = list(samples)
+        self.serial_time = None
+        self.serial = DEFAULT_SERIAL
+        self.fit()
+
+    def fit(self):
+        samples = self.samples
+        if not samples:
+            return
+        counts = set(sample['cpus'] for sample in samples)
+        if len(counts) > 1:
+            # С wall = a + b / nT1 = a + bs = a / T1
+            n = len(samples)
+            xs = [1.0 / sample['cpus'] for sample in samples]
+            ys = [sample['wall'] for sample in samples]
+            mx = sum(xs) / n
+            my = sum(ys) / n
+            b = sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / sum((x - mx) ** 2 for x in xs)
+            a = my - b * mx
+            if b > 0:
+                self.serial_time = a + b
+                self.serial = min(max(a / (a + b), 0.0), 1.0)
+                return
+
+        # һ߳ cpu ʱ / ǽʱ ʵʼٱ
+        serials = []
+        times = []
+        for sample in samples:
+            n = sample['cpus']
+            if n > 1 and sample['cpu_time']:
+                speedup = min(max(sample['cpu_time'] / sample['wall'], 1.0), n)
+                serials.append((n / speedup - 1) / (n - 1))
+        if serials:
+            self.serial = sum(serials) / len(serials)
+        for sample in samples:
+            times.append(sample['wall'] / self.fraction(sample['cpus']))
+        self.serial_time = sum(times) / len(times)
+
+    def fraction(self, cpus):
+        """
+        ǽʱռʱı s + (1 - s) / n
+        """
+        return self.serial + (1 - self.serial) / cpus
+
+    def speedup(self, cpus):
+        return 1 / self.fraction(cpus)
+
+    def wall(self, cpus):
+        """
+        ǽʱ䣬ʱδ֪ʱΪ None
+        """
+        if self.serial_time is None:
+            return None
+        return self.serial_time * self.fraction(cpus)
+
+
+class Scheduler(JobQueue):
+    def __init__(self, command='abaqus', cores=None, tokens=None, cpu_options=(1, 2, 4, 8), path=None,
+                 history=None, poll=2.0):
+        """
+         cpu ֤ƴҵĵ
+        :param command: Ϊб
+        :param cores:  cpu Ĭϱ
+        :param tokens: ֤Ϊ None ʱ
+        :param cpu_options: ҵѡ߳
+        :param path: Ŀ¼ĬϵǰĿ¼
+        :param history: ҵ .msg Ŀ¼Ĭͬ path
+        :param poll: ѯ s
+        """
+        JobQueue.__init__(self, command, max_jobs=None, cpus=None, path=path, poll=poll)
+        self.cores = cores or multiprocessing.cpu_count()
+        self.tokens = tokens
+        self.cpu_options = sorted(n for n in cpu_options if n <= self.cores) or [1]
+        self.models = {}
+        self.load_history(history or self.path)
+
+    def load_history(self, path):
+        """
+        ȡĿ¼ȫ .msgҵ彨ģ
+        :param path: Ŀ¼
+        """
+        samples = {}
+        for name in sorted(os.listdir(path)):
+            if not name.endswith('.msg'):
+                continue
+            times = read_msg_times(os.path.join(path, name))
+            if times is not None:
+                samples.setdefault(job_family(name[:-4]), []).append(times)
+        for family, items in samples.items():
+            self.models[family] = ScalingModel(items)
+
+    def model(self, job):
+        """
+        ҵĲģͣͬ¼ʱʹĬϴб
+        """
+        return self.models.get(job_family(job)) or ScalingModel()
+
+    def estimate(self, job):
+        """
+        ƴʱ䣬޼¼ʱȡ֪ҵƽֵ
+        """
+        model = self.model(job)
+        if model.serial_time is not None:
+            return model.serial_time
+        known = [m.serial_time for m in self.models.values() if m.serial_time is not None]
+        return sum(known) / len(known) if known else 1.0
+
+    def choose_cpus(self, job, free_cores, free_tokens, waiting):
+        """
+        ѡȡ߳
+        :param job: ҵ
+        :param free_cores: к
+        :param free_tokens: None Ϊ
+        :param waiting: ҵڵĴҵ
+        :return: ߳ԴʱΪ None
+        """
+        options = [n for n in self.cpu_options
+                   if n <= free_cores and (free_tokens is None or license_tokens(n) <= free_tokens)]
+        if not options:
+            return None
+        model = self.model(job)
+
+        # λԴݶļٱȣԴȡ cpu иһ
+        def rate(n):
+            share = float(n) / self.cores
+            if self.tokens is not None:
+                share = max(share, float(license_tokens(n)) / self.tokens)
+            return model.speedup(n) / share
+
+        best = max(options, key=rate)
+
+        # ĩβк˶ڴҵʱֿк
+        spread = [n for n in options if n * waiting <= free_cores]
+        if spread and max(spread) > best:
+            best = max(spread)
+        return best
+
+    def add(self, job, inp=None, cpus=None, tag=None, oldjob=None):
+        JobQueue.add(self, job, inp, cpus, tag, oldjob)
+        # ƴʱ䳤ҵ
+        self.pending.sort(key=lambda item: -self.estimate(item['job']))
+
+    def _dispatch(self, running):
+        if not self.pending:
+            return None
+        free_cores = self.cores - sum(entry[0]['cpus'] for entry in running)
+        free_tokens = None
+        if self.tokens is not None:
+            free_tokens = self.tokens - sum(license_tokens(entry[0]['cpus']) for entry in running)
+
+        item = self.pending[0]
+        cpus = item['cpus']
+        if cpus is None:
+            cpus = self.choose_cpus(item['job'], free_cores, free_tokens, len(self.pending))
+        elif cpus > free_cores or (free_tokens is not None and license_tokens(cpus) > free_tokens):
+            cpus = None
+        if cpus is None:
+            if running:
+                return None
+            # ʱԴԲ㣬С߳
+            cpus = self.cpu_options[0]
+
+        self.pending.pop(0)
+        item['cpus'] = cpus
+        return item
+
+    def _finish(self, item, result):
+        """
+        ҵȡ .msg߸²ģ
+        """
+        path = os.path.join(self.path, item['job'] + '.msg')
+        times = read_msg_times(path) if os.path.exists(path) else None
+        if result['returncode'] != 0 or times is None:
+            return
+        family = job_family(item['job'])
+        samples = self.models[family].samples if family in self.models else []
+        self.models[family] = ScalingModel(samples + [times])
+
+    def report(self):
+        """
+        ӡҵĲģ
+        """
+        for family, model in sorted(self.models.items()):
+            text = '%.0f s' % model.serial_time if model.serial_time is not None else 'δ֪'
+            print('Python: ҵ %s ʱ %sб %.3f߳ %s ٱ %s' % (
+                family, text, model.serial,
+                '/'.join('%d' % n for n in self.cpu_options),
+                '/'.join('%.2f' % model.speedup(n) for n in self.cpu_options)))
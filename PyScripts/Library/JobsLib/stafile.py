@@ -0,0 +1,354 @@
+# coding=cp936
+"""
+Abaqus/Standard ״̬ļ (.sta) Ϣļ (.msg) ȡ
+
+* ÿһУATT д U Ϊˣδ
+* StaTail / MsgTail ¼Ѷλãÿ update ֻļУ׷ӵݵ
+* StaTail.progress ʱȡƵʣʱ䡢ÿ
+  ɵͿѯеҵ
+"""
+import io
+import os
+import re
+import time
+import numpy as np
+from inpstamp import _blocks, _split, _ENCODING
+
+# УԺšǷˡزƽܵʱ䡢ʱ䡢
+STA_COLUMNS = ('step', 'inc', 'att', 'cutback', 'severe', 'equil', 'iters', 'total_time', 'step_time', 'inc_size')
+
+
+def parse_sta_line(line):
+    """
+    һгԼ¼
+    :param line: .sta ı
+    :return:  10 б STA_COLUMNSǼ¼з None
+    """
+    fields = line.split()
+    if len(fields) < 9 or not fields[0].isdigit() or not fields[1].isdigit():
+        return None
+    att = fields[2]
+    cutback = att.endswith('U')
+    try:
+        return [int(fields[0]), int(fields[1]), int(att.rstrip('U')), int(cutback),
+                int(fields[3]), int(fields[4]), int(fields[5]),
+                float(fields[6]), float(fields[7]), float(fields[8])]
+    except ValueError:
+        return None
+
+
+def read_sta(path):
+    """
+    ȡ .sta ȫԼ¼
+    :param path: .sta ·
+    :return:  (n, 10)м STA_COLUMNS
+    """
+    rows = []
+    with io.open(path, encoding='cp936', errors='replace') as file:
+        for line in file:
+            row = parse_sta_line(line)
+            if row is not None:
+                rows.append(row)
+    return np.array(rows, dtype=float).reshape(-1, len(STA_COLUMNS))
+
+
+def converged(table):
+    """
+    ¼ȥ˳ԣ
+    :param table: read_sta ֵ
+    """
+    return table[table[:, 3] == 0]
+
+
+# .msg ¼УԺššǷزʱƽڵ㡢ɶ
+MSG_COLUMNS = ('step', 'inc', 'att', 'iter', 'severe', 'residual', 'average', 'node', 'dof')
+
+# ʱεķؼ֣е 2 Ϊʱ
+_PERIOD_KEYWORDS = ('*static', '*visco', '*dynamic', '*heat transfer', '*coupled temperature-displacement')
+_NUMBER = r'([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)'
+
+
+def inp_periods(path):
+    """
+    ȡ inp иʱΣڼ
+    :param path: inp ·
+    :return: [ʱ, ...]˳
+    """
+    periods = []
+    with io.open(path, encoding=_ENCODING, errors='replace') as file:
+        for keyword, line, data in _blocks(file):
+            if keyword in _PERIOD_KEYWORDS and 'riks' not in line.lower():
+                fields = _split(data[0]) if data else []
+                periods.append(float(fields[1]) if len(fields) > 1 and fields[1] else 1.0)
+    return periods
+
+
+class _Tail:
+    def __init__(self, path, columns):
+        """
+        еıļ
+        :param path: ļ·
+        :param columns: ¼
+        """
+        self.path = path
+        self.offset = 0
+        self.rows = 0
+        self._buffer = np.zeros((64, columns))
+        self._rest = b''
+
+    @property
+    def table(self):
+        """
+        Ѷ¼ (, )
+        """
+        return self._buffer[:self.rows]
+
+    def _append(self, rows):
+        if not rows:
+            return
+        need = self.rows + len(rows)
+        if need > len(self._buffer):
+            buffer = np.zeros((max(need, 2 * len(self._buffer)), self._buffer.shape[1]))
+            buffer[:self.rows] = self.table
+            self._buffer = buffer
+        self._buffer[self.rows:need] = rows
+        self.rows = need
+
+    def _read_lines(self):
+        """
+        ȡУļСύҵʱͷ
+        :return: ıб
+        """
+        if not os.path.exists(self.path):
+            return []
+        if os.path.getsize(self.path) < self.offset:
+            self.reset()
+        with io.open(self.path, 'rb') as file:
+            file.seek(self.offset)
+            data = file.read()
+        self.offset += len(data)
+        data = self._rest + data
+        end = data.rfind(b'\n') + 1
+        self._rest = data[end:]
+        return data[:end].decode(_ENCODING, 'replace').splitlines()
+
+    def reset(self):
+        self.offset = 0
+        self.rows = 0
+        self._rest = b''
+
+
+class StaTail(_Tail):
+    def __init__(self, path, total=None, window=10):
+        """
+         .sta ļ
+        :param path: .sta ·
+        :param total: Ŀʱ䣨ʱ֮ͣ inp_periodsΪ None ʱȱʣʱ
+        :param window: õ
+        """
+        _Tail.__init__(self, path, len(STA_COLUMNS))
+        self.total = total
+        self.window = window
+        self.status = 'waiting'
+        self.start = None
+        self._samples = []
+
+    def reset(self):
+        _Tail.reset(self)
+        self.status = 'waiting'
+        self.start = None
+        self._samples = []
+
+    def update(self):
+        """
+        ȡ¼
+        :return: 
+        """
+        rows = []
+        for line in self._read_lines():
+            row = parse_sta_line(line)
+            if row is not None:
+                rows.append(row)
+            elif 'COMPLETED SUCCESSFULLY' in line:
+                self.status = 'completed'
+            elif 'HAS NOT BEEN COMPLETED' in line:
+                self.status = 'failed'
+            elif self.start is None and 'DATE' in line and 'TIME' in line:
+                self.start = _sta_start(line)
+        if self.offset and self.status == 'waiting':
+            self.status = 'running'
+        self._append(rows)
+
+        # ʲ (ǽʱ, ʱ)ҵʼʱΪ׸
+        if rows:
+            if not self._samples and self.start is not None:
+                self._samples.append((self.start, 0.0))
+            self._samples.append((time.time(), self.table[-1, 7]))
+            del self._samples[:-self.window - 1]
+        return len(rows)
+
+    def rate(self):
+        """
+        ʱƽʣÿ룩ʱΪ None
+        """
+        if len(self._samples) < 2:
+            return None
+        (wall0, total0), (wall1, total1) = self._samples[0], self._samples[-1]
+        if wall1 <= wall0 or total1 <= total0:
+            return None
+        return (total1 - total0) / (wall1 - wall0)
+
+    def progress(self):
+        """
+        ǰ
+        :return: dict(status, step, inc, total_time, fraction, eta, increments, attempts, cutback_rate,
+                 iterations)fractionetaʣ޷ʱΪ None
+        """
+        table = self.table
+        done = table[table[:, 3] == 0]
+        total_time = float(table[-1, 7]) if len(table) else 0.0
+        fraction = None
+        eta = None
+        if self.total:
+            fraction = min(total_time / self.total, 1.0)
+            rate = self.rate()
+            if self.status == 'completed':
+                eta = 0.0
+            elif rate:
+                eta = (self.total - total_time) / rate
+        return {'status': self.status,
+                'step': int(table[-1, 0]) if len(table) else 0,
+                'inc': int(table[-1, 1]) if len(table) else 0,
+                'total_time': total_time,
+                'fraction': fraction,
+                'eta': eta,
+                'increments': len(done),
+                'attempts': len(table),
+                'cutback_rate': float(table[:, 3].mean()) if len(table) else 0.0,
+                'iterations': float(table[:, 6].sum()) / len(done) if len(done) else 0.0}
+
+
+def _sta_start(line):
+    """
+    .sta еҵʼʱ̣ DATE 18-Oct-2026 TIME 13:48:59
+    :return: ʱ޷ʱΪ None
+    """
+    match = re.search(r'DATE\s+(\S+)\s+TIME\s+(\S+)', line)
+    if match:
+        for pattern in ('%d-%b-%Y %H:%M:%S', '%d-%m-%Y %H:%M:%S'):
+            try:
+                return time.mktime(time.strptime(match.group(1) + ' ' + match.group(2), pattern))
+            except ValueError:
+                pass
+    return None
+
+
+class MsgTail(_Tail):
+    def __init__(self, path):
+        """
+         .msg ļ¼ÿƽ / زм MSG_COLUMNS
+        skipped ΪδĵӦΪ 0
+        :param path: .msg ·
+        """
+        _Tail.__init__(self, path, len(MSG_COLUMNS))
+        self.reset()
+
+    def reset(self):
+        _Tail.reset(self)
+        self.skipped = 0
+        self._state = [0, 0, 0, 0, 0]
+        self._average = np.nan
+        self._pending = False
+
+    def update(self):
+        """
+        ȡ¼
+        :return: 
+        """
+        rows = []
+        state = self._state
+        for line in self._read_lines():
+            match = re.search(r'S T E P\s+(\d+)', line)
+            if match:
+                state[0] = int(match.group(1))
+                continue
+            match = re.search(r'INCREMENT\s+(\d+)\s+STARTS\. ATTEMPT NUMBER\s+(\d+)', line)
+            if match:
+                state[1:3] = int(match.group(1)), int(match.group(2))
+                continue
+            match = re.search(r'CONVERGENCE CHECKS FOR (SEVERE DISCONTINUITY|EQUILIBRIUM) ITERATION\s+(\d+)', line)
+            if match:
+                self._check()
+                state[3:5] = int(match.group(2)), int(match.group(1) != 'EQUILIBRIUM')
+                self._pending = True
+                continue
+            match = re.search(r'TIME AVG\. FORCE\s+' + _NUMBER, line)
+            if match:
+                self._average = float(match.group(1))
+                continue
+            match = re.search(r'LARGEST RESIDUAL FORCE\s+' + _NUMBER + r'\s+AT NODE\s+(\d+)\s+DOF\s+(\d+)', line)
+            if match:
+                rows.append(state[:3] + [state[3], state[4], float(match.group(1)), self._average,
+                                         int(match.group(2)), int(match.group(3))])
+                self._pending = False
+        self._append(rows)
+        return len(rows)
+
+    def _check(self):
+        """
+        һεδ¼ʱ״γʱʾ
+        """
+        if self._pending:
+            if not self.skipped:
+                print('Python: %s  %d  %d  %d δܽ' % ((self.path,) + tuple(
+                    self._state[:2]) + (self._state[3],)))
+            self.skipped += 1
+            self._pending = False
+
+    def residual_ratio(self):
+        """
+         || / ʱƽ׼ R  0.005 q Ƚ
+        """
+        table = self.table
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.abs(table[:, 5]) / table[:, 6]
+
+
+def format_progress(job, progress):
+    """
+    ȵĵı
+    """
+    fraction = '  -  ' if progress['fraction'] is None else '%4.0f%%' % (100 * progress['fraction'])
+    eta = '-' if progress['eta'] is None else '%.0f s' % progress['eta']
+    return '%-24s %-9s %s   %d  %d  ʱ %.4g  ʣ %s   %.2f  / %.1f' % (
+        job, progress['status'], fraction, progress['step'], progress['inc'], progress['total_time'], eta,
+        progress['cutback_rate'], progress['iterations'])
+
+
+def watch_jobs(jobs, path=None, interval=10.0, totals=None, until_done=True):
+    """
+    ѯҵ .sta ӡ
+    :param jobs: ҵ
+    :param path: ҵĿ¼ĬϵǰĿ¼
+    :param interval: ѯ s
+    :param totals: {ҵ: Ŀʱ}ȱʡʱͬ .inp ķʱ
+    :param until_done: Ϊ True ʱѯȫҵֻȡһ
+    :return: {ҵ: StaTail}
+    """
+    path = path or os.getcwd()
+    totals = totals or {}
+    tails = {}
+    for job in jobs:
+        total = totals.get(job)
+        inp = os.path.join(path, job + '.inp')
+        if total is None and os.path.exists(inp):
+            total = sum(inp_periods(inp)) or None
+        tails[job] = StaTail(os.path.join(path, job + '.sta'), total)
+
+    while True:
+        for job in jobs:
+            tails[job].update()
+            print('Python: ' + format_progress(job, tails[job].progress()))
+        if not until_done or all(tail.status in ('completed', 'failed') for tail in tails.values()):
+            return tails
+        time.sleep(interval)
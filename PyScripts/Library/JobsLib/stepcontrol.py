@@ -0,0 +1,128 @@
+# coding=cp936
+"""
+Ƶ
+
+* ȡģҵ .staضϣcutback
+*  maxInc Ϊܵ޵ΪС
+  ޵ĽضϳΪɱ⣬ȡܵٵ
+* ʼȡ׸СȡС 1/10
+  ضϻزƵʱ鿪 (discontinuous)
+"""
+import os
+import numpy as np
+from stafile import read_sta
+
+# StaticStep.setValues
+STEP_KEYS = ('initialInc', 'maxInc', 'minInc', 'maxNumInc')
+
+
+def step_attempts(table, step):
+    """
+    һضϳ
+    :param table: read_sta ֵ
+    :param step: ţ 1 ʼ
+    :return: ( (n, 2)ض (m, 2))Ϊ (С, ܵ)
+    """
+    rows = table[table[:, 0] == step]
+    cut = rows[:, 3] == 1
+    return rows[~cut][:, [9, 6]], rows[cut][:, [9, 6]]
+
+
+def iteration_cost(done, cutback, cap):
+    """
+    ʱԤܵ
+    :param done:  (n, 2)
+    :param cutback: ضϳ (m, 2)
+    :param cap: 
+    """
+    if not len(done):
+        return 0.0
+    split = np.ceil(done[:, 0] / cap - 1e-9)
+    typical = max(1.0, float(np.median(done[:, 1])))
+    cost = np.where(split > 1, split * typical, done[:, 1]).sum()
+    return cost + cutback[cutback[:, 0] <= cap, 1].sum()
+
+
+class StepTuner:
+    def __init__(self, count=3, cutback_ratio=0.1, severe_ratio=0.2, min_num_inc=100):
+        """
+        Ƶ
+        :param count: ɨвɱ
+        :param cutback_ratio: ضϳ /  ֵʱ discontinuous
+        :param severe_ratio: زֵʱ discontinuous
+        :param min_num_inc: maxNumInc 
+        """
+        self.count = count
+        self.cutback_ratio = cutback_ratio
+        self.severe_ratio = severe_ratio
+        self.min_num_inc = min_num_inc
+
+    def tune_step(self, tables, step):
+        """
+        һ
+        :param tables: ҵ read_sta ֵ
+        :param step: 
+        :return: dict(initialInc, maxInc, minInc, maxNumInc, discontinuous, iterations, tuned_iterations)
+                 ¼ʱΪ None
+        """
+        runs = [step_attempts(table, step) for table in tables]
+        runs = [(done, cutback) for done, cutback in runs if len(done)]
+        if not runs:
+            return None
+
+        # ѡޣֹȫС
+        sizes = np.unique(np.concatenate([np.concatenate([done[:, 0], cutback[:, 0]]) for done, cutback in runs]))
+        largest = max(done[:, 0].max() for done, cutback in runs)
+        sizes = sizes[(sizes > 0) & (sizes <= largest)]
+        costs = [sum(iteration_cost(done, cutback, cap) for done, cutback in runs) for cap in sizes]
+        best = min(range(len(sizes)), key=lambda i: (costs[i], -sizes[i]))
+        cap = float(sizes[best])
+
+        initial = min(cap, min(float(done[0, 0]) for done, cutback in runs))
+        smallest = min(float(done[:, 0].min()) for done, cutback in runs)
+        increments = max(int(np.ceil(done[:, 0] / cap - 1e-9).sum()) for done, cutback in runs)
+
+        rows = [table[table[:, 0] == step] for table in tables]
+        done = sum(int((r[:, 3] == 0).sum()) for r in rows)
+        cutbacks = sum(int((r[:, 3] == 1).sum()) for r in rows)
+        severe = sum(int(((r[:, 3] == 0) & (r[:, 4] > 0)).sum()) for r in rows)
+
+        return {'initialInc': initial,
+                'maxInc': cap,
+                'minInc': min(initial, smallest / 10),
+                'maxNumInc': max(self.min_num_inc, 2 * increments),
+                'discontinuous': cutbacks > self.cutback_ratio * done or severe > self.severe_ratio * done,
+                'iterations': sum(iteration_cost(d, c, largest) for d, c in runs) / len(runs),
+                'tuned_iterations': costs[best] / len(runs)}
+
+    def propose(self, sta_paths):
+        """
+         .sta ʷ
+        :param sta_paths: .sta ·ڵĺ
+        :return: {: dict(...)} tune_stepʷʱΪ {}
+        """
+        tables = [read_sta(path) for path in sta_paths if os.path.exists(path)]
+        tables = [table for table in tables if len(table)]
+        if not tables:
+            return {}
+
+        steps = sorted(set(int(step) for table in tables for step in table[:, 0]))
+        controls = {}
+        for step in steps:
+            control = self.tune_step(tables, step)
+            if control is None:
+                continue
+            controls[step] = control
+            print('Python:  %d  ʼ %.3g  %.3g С %.3g%sԤƵ %d -> %d' % (
+                step, control['initialInc'], control['maxInc'], control['minInc'],
+                'discontinuous' if control['discontinuous'] else '',
+                control['iterations'], control['tuned_iterations']))
+        return controls
+
+
+def step_values(control):
+    """
+    StaticStep.setValues 
+    :param control: tune_step ֵ
+    """
+    return dict((key, control[key]) for key in STEP_KEYS if key in control)
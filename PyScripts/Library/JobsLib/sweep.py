@@ -0,0 +1,264 @@
+# coding=cp936
+"""
+ɨ
+
+* Բ񣨵ѿֵб
+* ýģwriteInput д inpٽҵ
+* ÿԲժҪǣ嵥д Sweep-<ɨ>.json / .csvдͬα
+* Ƶʱģ⣺壬ɵ .sta ģ͵ƣ
+  дδıõµʱ½ģ
+"""
+import os
+import csv
+import json
+import hashlib
+import itertools
+from jobqueue import check_unsubmitted
+
+
+def param_grid(base=None, **axes):
+    """
+    񣬸ȡѿ
+    ȡֵΪֵʱϲڳ仯Ĳ load=[dict(load_mode=0, load_force=320e3), ...]
+    :param base: 
+    :param axes:  = ȡֵб
+    :return: ֵб
+    """
+    names = sorted(axes)
+    variants = []
+    for values in itertools.product(*[axes[name] for name in names]):
+        params = dict(base or {})
+        for name, value in zip(names, values):
+            if isinstance(value, dict):
+                params.update(value)
+            else:
+                params[name] = value
+        variants.append(params)
+    return variants
+
+
+def param_list(base=None, variants=()):
+    """
+    б빫ϲ
+    :param base: 
+    :param variants: ֵ
+    :return: ֵб
+    """
+    result = []
+    for variant in variants:
+        params = dict(base or {})
+        params.update(variant)
+        result.append(params)
+    return result
+
+
+def _plain(value):
+    """
+    תΪ JSON лֵ
+    """
+    if isinstance(value, (list, tuple)):
+        return [_plain(item) for item in value]
+    if isinstance(value, dict):
+        return dict((str(k), _plain(v)) for k, v in value.items())
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if hasattr(value, 'encode'):
+        # Python 2  unicode json.load ص嵥
+        return value.encode('utf-8')
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return repr(value)
+
+
+def param_key(params):
+    """
+    ժҪΪ
+    :param params: ֵ
+    :return: 10 λʮַ
+    """
+    text = json.dumps(_plain(params), sort_keys=True)
+    return hashlib.md5(text.encode('utf-8')).hexdigest()[:10]
+
+
+class Sweep:
+    def __init__(self, name, builder, variants, path=None, queue=None, cleanup=None, tuner=None):
+        """
+        ɨ
+        :param name: ɨģΪ <ɨ>-<>ҵΪ Job-<ģ>
+        :param builder: ģ builder(model_name, submit=False, **params)δύ mdb.Job
+                        submit=False  build 루Ѹʱǣύҵ
+        :param variants: ֵбparam_grid / param_list
+        :param path: Ŀ¼ĬϵǰĿ¼inp  writeInput дǰĿ¼
+        :param queue: ҵ JobQueueΪ None ʱֻд inp
+        :param cleanup: д cleanup(model_name)ɾģͷڴ
+        :param tuner: Ƶ StepTunerΪ None ʱ step_controls ģ
+        """
+        self.name = name
+        self.builder = builder
+        self.variants = list(variants)
+        self.path = path or os.getcwd()
+        self.queue = queue
+        self.cleanup = cleanup
+        self.tuner = tuner
+        self.records = self._load()
+
+    @property
+    def manifest(self):
+        return os.path.join(self.path, 'Sweep-' + self.name + '.json')
+
+    def _load(self):
+        if os.path.exists(self.manifest):
+            with open(self.manifest) as file:
+                return _plain(json.load(file))
+        return []
+
+    def _save(self):
+        with open(self.manifest, 'w') as file:
+            json.dump(self.records, file, indent=1, sort_keys=True)
+
+        # ƽ̲ csv 嵥Ǳ JSON ı
+        names = sorted(set(name for record in self.records for name in record['params']))
+        with open(os.path.splitext(self.manifest)[0] + '.csv', 'w') as file:
+            writer = csv.writer(file, lineterminator='\n')
+            writer.writerow(['index', 'job', 'key', 'status'] + names)
+            for record in self.records:
+                row = [record['index'], record['job'], record['key'], record['status']]
+                for name in names:
+                    value = record['params'].get(name, '')
+                    row.append(json.dumps(value) if isinstance(value, (list, dict)) else value)
+                writer.writerow(row)
+
+    def model_name(self, index):
+        return '%s-%03d' % (self.name, index)
+
+    def find(self, key):
+        """
+        ժҪ嵥¼
+        """
+        for record in self.records:
+            if record['key'] == key:
+                return record
+        return None
+
+    def similar(self, params):
+        """
+        Ҳࣩͬı .sta tuner.count 
+        :param params: ֵ
+        """
+        params = _plain(params)
+        done = [record for record in self.records if record.get('status') == 'done' and
+                os.path.exists(os.path.join(self.path, record['job'] + '.sta'))]
+        done.sort(key=lambda record: -sum(record['params'].get(name) == value for name, value in params.items()))
+        return [os.path.join(self.path, record['job'] + '.sta') for record in done[:self.tuner.count]]
+
+    def propose(self, params):
+        """
+        ɱƣ޵޿ü¼ʱΪ None
+        """
+        if self.tuner is None:
+            return None
+        return self.tuner.propose(self.similar(params)) or None
+
+    def build(self, skip_existing=True, variants=None):
+        """
+        ģд inp
+        :param skip_existing: 嵥д inp Դڵͬα壻δıõдʱͬʱ½ģ
+        :param variants: ֵбĬȫ
+        :return: 漰嵥¼
+        """
+        records = []
+        for params in self.variants if variants is None else variants:
+            key = param_key(params)
+            record = self.find(key)
+            controls = None
+            if record is not None and record.get('status') != 'done':
+                controls = self.propose(params)
+            if record is not None and skip_existing and os.path.exists(record['inp']) and (
+                    controls is None or _step_controls(controls) == record.get('step_controls')):
+                print('Python: д ' + record['job'])
+                records.append(record)
+                continue
+
+            # ±дɹż嵥ģʧʱ嵥¼
+            new = record is None
+            if new:
+                index = len(self.records)
+                model_name = self.model_name(index)
+                record = {'index': index, 'key': key, 'job': 'Job-' + model_name, 'model': model_name,
+                          'params': _plain(params)}
+
+            kwargs = dict(params)
+            kwargs.setdefault('submit', False)
+            if controls is None:
+                controls = self.propose(params)
+            if controls:
+                kwargs['step_controls'] = controls
+
+            job = check_unsubmitted(self.builder(record['model'], **kwargs))
+            job.writeInput(consistencyChecking=False)
+            if new:
+                self.records.append(record)
+            if controls:
+                record['step_controls'] = _step_controls(controls)
+            record['job'] = job.name
+            record['inp'] = os.path.join(self.path, job.name + '.inp')
+            record['status'] = 'written'
+            self._save()
+            print('Python: д ' + record['job'] + ' [' + key + ']')
+
+            if self.cleanup is not None:
+                self.cleanup(record['model'])
+            records.append(record)
+        return records
+
+    def run(self, skip_existing=True, skip_done=True, pilots=None):
+        """
+        ģдҵ⣬ɺ״̬д嵥
+        ƵʱȽģǰ pilots 壬ģ
+        :param skip_existing:  build
+        :param skip_done: ɵı
+        :param pilots: Ĭ tuner.count
+        :return: 漰嵥¼
+        """
+        if self.queue is None:
+            return self.build(skip_existing)
+
+        waves = [self.variants]
+        if self.tuner is not None:
+            pilots = self.tuner.count if pilots is None else pilots
+            waves = [self.variants[:pilots], self.variants[pilots:]]
+
+        records = []
+        for variants in waves:
+            if variants:
+                records.extend(self.solve(self.build(skip_existing, variants), skip_done))
+        return records
+
+    def solve(self, records, skip_done=True):
+        """
+        ҵ⣬ɺ״̬д嵥
+        :param records: 嵥¼
+        :param skip_done: ɵı
+        :return: records
+        """
+        for record in records:
+            if skip_done and record['status'] == 'done':
+                continue
+            self.queue.add(record['job'], record['inp'], tag=record['key'])
+        results = self.queue.run()
+
+        for record in records:
+            result = results.get(record['job'])
+            if result is not None:
+                record['status'] = 'done' if result['returncode'] == 0 else 'failed'
+                record['wall'] = result['wall']
+        self._save()
+        return records
+
+
+def _step_controls(controls):
+    """
+    Ƶ嵥ʽתΪַ
+    """
+    return _plain(dict((str(step), control) for step, control in controls.items()))
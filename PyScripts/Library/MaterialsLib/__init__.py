@@ -1,2 +1,4 @@
 from concrete import *
 from steels import *
+from tablecache import *
+from inpwriter import *
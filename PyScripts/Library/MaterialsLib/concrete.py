@@ -5,62 +5,302 @@ ABAQUS 
 * ݡṹƹ淶GB50010-2010 (2024)
 * ûǿȵȼΧ C20~C80
 """
+from collections import namedtuple
 import numpy as np
-from abaqus import *
+from ..ToolsLib.lazy import LazyModule
+from tablecache import cdp_cache, table_key
+from inpwriter import material_inp
+
+# ںģ飬 ConcreteAb ʹ
+_abaqus = LazyModule('abaqus')
+
+
+def _as_output(value):
+    """
+    뷵 float뱣
+    """
+    value = np.asarray(value, dtype=float)
+    if value.ndim == 0:
+        return float(value)
+    return value
 
 
 def cal_ec(fcu_k):
     """
     㵯ģ
-    :param fcu_k: 忹ѹǿȱ׼ֵ
+    :param fcu_k: 忹ѹǿȱ׼ֵΪ顣
     :return: ģ
     """
+    fcu_k = np.asarray(fcu_k, dtype=float)
     ec = 10 ** 5 / (2.2 + 34.7 / fcu_k)
-    ec = round(ec, 3)
-    return ec
+    ec = np.round(ec, 3)
+    return _as_output(ec)
 
 
 def convert_fcu_k(fcu_k=30, delta_c=None):
     """
     fcu,k  fck, ftk
 
-    :param fcu_k: 忹ѹǿȱ׼ֵǿȵȼֵ (N/mm^2)
+    :param fcu_k: 忹ѹǿȱ׼ֵǿȵȼֵ (N/mm^2)Ϊ顣
     :param delta_c:  ϵ c, Ϊ None, 򰴹淶ʽ㡣
     """
+    fcu_k = np.asarray(fcu_k, dtype=float)
 
-    # Բֵ 1, 2
-    if fcu_k <= 50:
-        alpha1 = 0.76
-    else:
-        alpha1 = np.interp(fcu_k, [50, 80], [0.76, 0.82])
-
-    if fcu_k <= 40:
-        alpha2 = 1
-    else:
-        alpha2 = np.interp(fcu_k, [40, 80], [1, 0.87])
+    # Բֵ 1, 2ȡ˵ֵ
+    alpha1 = np.interp(fcu_k, [50, 80], [0.76, 0.82])
+    alpha2 = np.interp(fcu_k, [40, 80], [1, 0.87])
 
     # ϵ
     if delta_c is None:
-        if fcu_k <= 20:
-            delta_c = 0.18
-        elif fcu_k <= 25:
-            delta_c = 0.16
-        elif fcu_k <= 30:
-            delta_c = 0.14
-        elif fcu_k <= 35:
-            delta_c = 0.13
-        elif fcu_k <= 45:
-            delta_c = 0.12
-        elif fcu_k <= 55:
-            delta_c = 0.11
-        else:
-            delta_c = 0.10
+        bounds = [20, 25, 30, 35, 45, 55]
+        values = np.array([0.18, 0.16, 0.14, 0.13, 0.12, 0.11, 0.10])
+        delta_c = values[np.searchsorted(bounds, fcu_k, side='left')]
 
     # 
     fck = 0.88 * alpha1 * alpha2 * fcu_k
     ftk = 0.88 * 0.395 * fcu_k ** 0.55 * (1 - 1.645 * delta_c) ** 0.45 * alpha2
 
-    return fck, ftk
+    return _as_output(fck), _as_output(ftk)
+
+
+def cal_grades(fcu_k, delta_c=None):
+    """
+    ǿȵȼ fck, ftk, Ec
+    :param fcu_k: 忹ѹǿȱ׼ֵ (N/mm^2)
+    :param delta_c: ϵ c, Ϊ None, 򰴹淶ʽ㡣
+    :return: fck, ftk, ec
+    """
+    fck, ftk = convert_fcu_k(fcu_k, delta_c)
+    return fck, ftk, cal_ec(fcu_k)
+
+
+def compress_x():
+    """
+    ѹĬȡ㣨һӦ /c,r
+    """
+    return np.concatenate([
+        np.arange(0.3, 1, 0.1),
+        np.arange(1, 4, 0.2),
+        np.arange(4, 14, 0.5),
+        np.arange(14, 50, 5)
+    ])
+
+
+def tensile_x():
+    """
+    Ĭȡ㣨һӦ /t,r
+    """
+    return np.concatenate([
+        np.arange(1, 4, 0.2),
+        np.arange(4, 14, 0.5),
+        np.arange(14, 50, 5)
+    ])
+
+
+def _broadcast_grades(fr, er, x):
+    """
+    ǿȡģΪ (ȼ, 1)ȡΪ (1, ȡ)
+    """
+    fr, er = np.broadcast_arrays(np.atleast_1d(np.asarray(fr, dtype=float)),
+                                 np.atleast_1d(np.asarray(er, dtype=float)))
+    x = np.asarray(x, dtype=float)
+    return fr[:, None], er[:, None], x[None, :]
+
+
+def _true_curve(d_arg, er, strain_peek, x):
+    """
+    ݻӡʵӦǵӦ
+    """
+    # ӦӦ
+    strain_nominal = x * strain_peek
+    stress_nominal = (1 - d_arg) * er * strain_nominal
+
+    # 
+    d = 1 - np.sqrt(stress_nominal / (er * strain_nominal))
+
+    # ʵӦӦ
+    stress_true = stress_nominal * (1 + strain_nominal)
+    strain_true = np.log(1 + strain_nominal)
+
+    # ǵӦ
+    strain_in = strain_true - (stress_true / er)
+
+    return d, stress_true, strain_in
+
+
+def cal_compress(fcr, er, x=None):
+    """
+    ѹǿȵȼһι㲥
+    :param fcr: Όѹǿȴֵһά (N/mm^2)
+    :param er: ģһά (N/mm^2)
+    :param x: һӦȡ㣬Ĭ compress_x()
+    :return: d, stress_true, strain_in״Ϊ (ȼ, ȡ)
+    """
+    if x is None:
+        x = compress_x()
+    fcr, er, x = _broadcast_grades(fcr, er, x)
+
+    # ֵѹӦ
+    strain_peek = (700 + 172 * np.sqrt(fcr)) * 1e-6
+
+    # ѹӦӦ½β
+    alpha = 0.157 * fcr ** 0.785 - 0.905
+
+    # ѹӦԲ
+    n = er * strain_peek / (er * strain_peek - fcr)
+
+    # ѹ˲
+    rho = fcr / (er * strain_peek)
+
+    # ѹݻ
+    dc_arg = np.where(x <= 1,
+                      1 - rho * n / (n - 1 + x ** n),
+                      1 - rho / (alpha * (x - 1) ** 2 + x))
+
+    return _true_curve(dc_arg, er, strain_peek, x)
+
+
+def cal_tensile(ftr, er, x=None):
+    """
+    ǿȵȼһι㲥
+    :param ftr: Όǿȴֵһά (N/mm^2)
+    :param er: ģһά (N/mm^2)
+    :param x: һӦȡ㣬Ĭ tensile_x()
+    :return: d, stress_true, strain_in״Ϊ (ȼ, ȡ)
+    """
+    if x is None:
+        x = tensile_x()
+    ftr, er, x = _broadcast_grades(ftr, er, x)
+
+    # ֵӦ
+    strain_peek = 65 * ftr ** 0.54 * 1e-6
+
+    # ӦӦ½β
+    alpha = 0.312 * ftr ** 2
+
+    # ˲
+    rho = ftr / (er * strain_peek)
+
+    # ݻ
+    dt_arg = np.where(x <= 1,
+                      1 - rho * (1.2 - 0.2 * x ** 5),
+                      1 - rho / (alpha * np.maximum(x - 1, 0) ** 1.7 + x))
+
+    return _true_curve(dt_arg, er, strain_peek, x)
+
+
+def cal_tables(fcr, ftr, er, xc=None, xt=None):
+    """
+     CDP ϱѰ Abaqus 뾫ȡ㣩
+    :param fcr: Όѹǿȴֵһά (N/mm^2)
+    :param ftr: Όǿȴֵһά (N/mm^2)
+    :param er: ģһά (N/mm^2)
+    :param xc: ѹһӦȡ㣬Ĭ compress_x()
+    :param xt: һӦȡ㣬Ĭ tensile_x()
+    :return: ѹӲѹˡű״Ϊ (ȼ, , 2)
+    """
+    dc_in, stress_c_in, strain_c_in = cal_compress(fcr, er, xc)
+    dt_in, stress_t_in, strain_t_in = cal_tensile(ftr, er, xt)
+
+    # 
+    dt_in = np.round(dt_in, 5)
+    dc_in = np.round(dc_in, 5)
+    stress_t_in = np.round(stress_t_in, 6)
+    stress_c_in = np.round(stress_c_in, 6)
+    strain_t_in = np.round(strain_t_in, 6)
+    strain_c_in = np.round(strain_c_in, 6)
+    dc_in[:, 0] = 0
+    dt_in[:, 0] = 0
+    strain_t_in[:, 0] = 0
+    strain_c_in[:, 0] = 0
+
+    hardening = np.stack([stress_c_in, strain_c_in], axis=-1)
+    stiffening = np.stack([stress_t_in, strain_t_in], axis=-1)
+    damage_c = np.stack([dc_in, strain_c_in], axis=-1)
+    damage_t = np.stack([dt_in, strain_t_in], axis=-1)
+    return hardening, stiffening, damage_c, damage_t
+
+
+# Ӧȡֵ
+SampleReport = namedtuple('SampleReport', ['rows', 'max_error'])
+
+
+def adaptive_x(curve, scale, x_min, x_max, tol=0.01, knots=(), max_rows=100, checks=4):
+    """
+    ϱֵӦȡ
+
+    Abaqus ԷǵӦΪԱӦԲֵﰴͬʽÿ䣺
+     = max(|Ҳֵ - | / scale, |dֵ - d|) tol ּܡ
+    ÿֻСڵǰ 1/4 䣨ֺԲֵԼΪ 1/4󴦣
+    ʱֻ꣬δﵽ tol ʱӡʾ
+    :param curve:  curve(x) -> (d, stress_true, strain_in)Ϊһά
+    :param scale: Ӧһ߶ȣȡǿȴֵ (N/mm^2)
+    :param x_min: һӦ
+    :param x_max: һӦյ
+    :param tol: ֵӦΪǿȵıֵΪֵ
+    :param knots: 뱣ȡ㣬ֵ 1.0
+    :param max_rows: 
+    :param checks: ÿڲļ
+    :return: x, SampleReport
+    """
+    x = np.unique(np.concatenate([[x_min, x_max], [k for k in knots if x_min < k < x_max]]))
+    t = (np.arange(checks) + 1.0) / (checks + 1)
+
+    while True:
+        d, stress, strain = curve(x)
+
+        # ڲʵֵֵ
+        x_check = x[:-1, None] + np.diff(x)[:, None] * t[None, :]
+        d_check, stress_check, strain_check = curve(x_check.ravel())
+        error = np.maximum(np.abs(np.interp(strain_check, strain, stress) - stress_check) / scale,
+                           np.abs(np.interp(strain_check, strain, d) - d_check))
+        error = error.reshape(x_check.shape).max(axis=1)
+
+        # ҽӽ䣬ʱֻ
+        bad = np.flatnonzero(error > max(tol, error.max() / 4))
+        budget = max_rows - len(x)
+        if not len(bad) or budget <= 0:
+            break
+        if len(bad) > budget:
+            bad = bad[np.argsort(error[bad])[::-1][:budget]]
+        x = np.sort(np.concatenate([x, (x[:-1][bad] + x[1:][bad]) / 2]))
+
+    report = SampleReport(len(x), float(error.max()))
+    if report.max_error > tol:
+        print('Python: Ӧȡﵽ %d %.2e δﵽ %.2e' % (max_rows, report.max_error, tol))
+    return x, report
+
+
+def adaptive_compress_x(fcr, er, tol=0.01, max_rows=100):
+    """
+    ѹӦȡ㣬Χ compress_x() ֵͬ
+    :param fcr: Όѹǿȴֵ (N/mm^2)
+    :param er: ģ (N/mm^2)
+    :param tol: ֵ
+    :param max_rows: 
+    :return: x, SampleReport
+    """
+    def curve(x):
+        return [value[0] for value in cal_compress(fcr, er, x)]
+
+    x = compress_x()
+    return adaptive_x(curve, fcr, x[0], x[-1], tol, (1.0,), max_rows)
+
+
+def adaptive_tensile_x(ftr, er, tol=0.01, max_rows=100):
+    """
+    Ӧȡ㣬Χ tensile_x() ͬ
+    :param ftr: Όǿȴֵ (N/mm^2)
+    :param er: ģ (N/mm^2)
+    :param tol: ֵ
+    :param max_rows: 
+    :return: x, SampleReport
+    """
+    def curve(x):
+        return [value[0] for value in cal_tensile(ftr, er, x)]
+
+    x = tensile_x()
+    return adaptive_x(curve, ftr, x[0], x[-1], tol, (), max_rows)
 
 
 class Concrete:
@@ -71,7 +311,8 @@ class Concrete:
                  er=30000,
                  density=2.4e-09,
                  poisson=0.2,
-                 cdp_plasticity=(30.0, 0.1, 1.16, 0.6667, 0.005)):
+                 cdp_plasticity=(30.0, 0.1, 1.16, 0.6667, 0.005),
+                 tol=None):
         """
         
         :param name: 
@@ -81,6 +322,7 @@ class Concrete:
         :param poisson: ɱȣȡ 0.2
         :param density:  ܶȣһ 2.2e-09~2.4e-09 (tone/mm^3)
         :param cdp_plasticity: CDP Բ
+        :param tol: ϱӦȡĲֵޣΪ None ʱ淶ֶȡ
         """
 
         self.name = name
@@ -90,103 +332,86 @@ class Concrete:
         self.density = density
         self.poisson = poisson
         self.cdp_plasticity = cdp_plasticity
+        self.tol = tol
+        self.compress_report = None
+        self.tensile_report = None
 
-    def compress(self):
+    def compress_points(self):
         """
-        ģѹ
+        ѹȡ㣬Ӧȡʱ¼ compress_report
         """
-        x = np.concatenate([
-            np.arange(0.3, 1, 0.1),
-            np.arange(1, 4, 0.2),
-            np.arange(4, 14, 0.5),
-            np.arange(14, 50, 5)
-        ])
-
-        fcr = self.fcr
-        er = self.er
-
-        x0 = x[x <= 1]
-        x1 = x[x > 1]
-
-        # ֵѹӦ
-        strain_peek = (700 + 172 * np.sqrt(fcr)) * 1e-6
-
-        # ѹӦӦ½β
-        alpha = 0.157 * fcr ** 0.785 - 0.905
-
-        # ѹӦԲ
-        n = er * strain_peek / (er * strain_peek - fcr)
-
-        # ѹ
-        rho = fcr / (er * strain_peek)
-
-        # ѹݻ
-        dc_arg = np.append(
-            1 - rho * n / (n - 1 + x0 ** n),
-            1 - rho / (alpha * (x1 - 1) ** 2 + x1)
-        )
+        if self.tol is None:
+            return compress_x()
+        x, self.compress_report = adaptive_compress_x(self.fcr, self.er, self.tol)
+        return x
 
-        # ӦӦ
-        strain_nominal = x * strain_peek
-        stress_nominal = (1 - dc_arg) * er * strain_nominal
-
-        # ѹ
-        d = 1 - np.sqrt(stress_nominal / (er * strain_nominal))
-
-        # ʵӦӦ
-        stress_true = stress_nominal * (1 + strain_nominal)
-        strain_true = np.log(1 + strain_nominal)
-
-        # ǵӦ
-        strain_in = strain_true - (stress_true / er)
+    def tensile_points(self):
+        """
+        ȡ㣬Ӧȡʱ¼ tensile_report
+        """
+        if self.tol is None:
+            return tensile_x()
+        x, self.tensile_report = adaptive_tensile_x(self.ftr, self.er, self.tol)
+        return x
 
-        return d, stress_true, strain_in
+    def compress(self):
+        """
+        ģѹ
+        """
+        d, stress_true, strain_in = cal_compress(self.fcr, self.er, self.compress_points())
+        return d[0], stress_true[0], strain_in[0]
 
     def tensile(self):
         """
         ģ
         """
-        x = np.concatenate([
-            np.arange(1, 4, 0.2),
-            np.arange(4, 14, 0.5),
-            np.arange(14, 50, 5)
-        ])
-
-        ftr = self.ftr
-        er = self.er
-        x0 = x[x <= 1]
-        x1 = x[x > 1]
-
-        # ֵӦ
-        strain_peek = 65 * ftr ** 0.54 * 1e-6
-
-        # ӦӦ½β
-        alpha = 0.312 * ftr ** 2
+        d, stress_true, strain_in = cal_tensile(self.ftr, self.er, self.tensile_points())
+        return d[0], stress_true[0], strain_in[0]
 
-        # 
-        rho = ftr / (er * strain_peek)
-
-        # ݻ
-        dt_arg = np.append(
-            1 - rho * (1.2 - 0.2 * x0 ** 5),
-            1 - rho / (alpha * (x1 - 1) ** 1.7 + x1)
-        )
-
-        # ӦӦ
-        strain_nominal = x * strain_peek
-        stress_nominal = (1 - dt_arg) * er * strain_nominal
-
-        # 
-        d = 1 - np.sqrt(stress_nominal / (er * strain_nominal))
+    def tables(self):
+        """
+        CDP ϱѹӲѹˡ
+        """
+        tables = cal_tables(self.fcr, self.ftr, self.er, self.compress_points(), self.tensile_points())
+        return tuple(table[0] for table in tables)
 
-        # ʵӦӦ
-        stress_true = stress_nominal * (1 + strain_nominal)
-        strain_true = np.log(1 + strain_nominal)
+    def _tables_with_report(self):
+        """
+        CDP ϱĩβӦȡ [[ѹ, ѹ], [, ]]淶ȡʱΪ nan
+        """
+        tables = self.tables()
+        reports = [self.compress_report, self.tensile_report]
+        return tables + (np.array([report or (np.nan, np.nan) for report in reports], dtype=float),)
 
-        # Ӧ
-        strain_in = strain_true - (stress_true / er)
+    def cdp_tables(self):
+        """
+         cdp_cache  CDP ϱлʱָͬ compress_reporttensile_report
+        :return: ѹӲѹˡ
+        """
+        tables = cdp_cache.get_or_compute(self.cache_key(), self._tables_with_report)
+        if self.tol is not None:
+            self.compress_report, self.tensile_report = [SampleReport(int(rows), float(error))
+                                                         for rows, error in tables[-1]]
+            print('Python:  %s Ӧȡ ѹ %d  ( %.2e) %d  ( %.2e)' % (
+                self.name,
+                self.compress_report.rows, self.compress_report.max_error,
+                self.tensile_report.rows, self.tensile_report.max_error))
+        return tables[:-1]
+
+    def cache_key(self):
+        """
+        CDP ϱӰϱĲ
+        """
+        return table_key('cdp', self.fcr, self.ftr, self.er, self.tol)
 
-        return d, stress_true, strain_in
+    def to_inp(self):
+        """
+         inp Ϲؼֿ飬 Abaqus/CAE
+        :return: *Material ... *Concrete Tension Damage ı
+        """
+        tables = self.cdp_tables()
+        return material_inp(self.name, self.density, (self.er, self.poisson),
+                            cdp=self.cdp_plasticity, cdp_tables=tables)
 
 
 class ConcreteAb(Concrete):
@@ -198,7 +423,8 @@ class ConcreteAb(Concrete):
                  er=30000,
                  density=2.4e-09,
                  poisson=0.2,
-                 cdp_plasticity=(30.0, 0.1, 1.16, 0.6667, 0.005)):
+                 cdp_plasticity=(30.0, 0.1, 1.16, 0.6667, 0.005),
+                 tol=None):
         """
         ABAQUS 
         :param model_name: ģ
@@ -209,13 +435,15 @@ class ConcreteAb(Concrete):
         :param poisson: ɱȣȡ 0.2
         :param density:  ܶȣһ 2.2e-09~2.4e-09 (tone/mm^3)
         :param cdp_plasticity: CDP Բ
+        :param tol: ϱӦȡĲֵޣΪ None ʱ淶ֶȡ
         """
-        Concrete.__init__(self, name, fcr, ftr, er, density, poisson, cdp_plasticity)
-        self.model = mdb.models[model_name]
+        Concrete.__init__(self, name, fcr, ftr, er, density, poisson, cdp_plasticity, tol)
+        self.model = _abaqus.mdb.models[model_name]
 
-    def create(self):
+    def create(self, tables=None):
         """
         ϣCDPˣԲ Abaqus
+        :param tables: Ԥȼ CDP ϱ cal_tablesΪ None ʱϲ㣨 cdp_tables
         :return:
         """
         name = self.name
@@ -227,30 +455,19 @@ class ConcreteAb(Concrete):
             return model.materials[name]
 
         # 
-        dc_in, stress_c_in, strain_c_in = self.compress()
-        dt_in, stress_t_in, strain_t_in = self.tensile()
-
-        # 
-        dt_in = np.round(dt_in, 5)
-        dc_in = np.round(dc_in, 5)
-        stress_t_in = np.round(stress_t_in, 6)
-        stress_c_in = np.round(stress_c_in, 6)
-        strain_t_in = np.round(strain_t_in, 6)
-        strain_c_in = np.round(strain_c_in, 6)
-        dc_in[0] = 0
-        dt_in[0] = 0
-        strain_t_in[0] = 0
-        strain_c_in[0] = 0
+        if tables is None:
+            tables = self.cdp_tables()
+        hardening, stiffening, damage_c, damage_t = tables
 
         # 
         material = model.Material(name=name)
         material.Density(table=((self.density,),))
         material.Elastic(table=((er, self.poisson),))
         cdp = material.ConcreteDamagedPlasticity(table=(self.cdp_plasticity,))
-        cdp.ConcreteCompressionHardening(table=np.column_stack([stress_c_in, strain_c_in]))
-        cdp.ConcreteTensionStiffening(table=np.column_stack([stress_t_in, strain_t_in]))
-        cdp.ConcreteCompressionDamage(table=np.column_stack([dc_in, strain_c_in]))
-        cdp.ConcreteTensionDamage(table=np.column_stack([dt_in, strain_t_in]))
+        cdp.ConcreteCompressionHardening(table=hardening)
+        cdp.ConcreteTensionStiffening(table=stiffening)
+        cdp.ConcreteCompressionDamage(table=damage_c)
+        cdp.ConcreteTensionDamage(table=damage_t)
 
         print('Python:  ' + name)
         return material
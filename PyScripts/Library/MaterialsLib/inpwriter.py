@@ -0,0 +1,112 @@
+# coding=cp936
+"""
+ inp ؼı
+
+*  Abaqus/CAE ںˣֱ *Material ȹؼֿ
+* ָʽж Abaqus/CAE 2022 д Job-*.inp һ
+"""
+
+
+def format_number(value):
+    """
+     Abaqus/CAE ʽ֣6 λЧֵ֣С
+    :param value: ֵ
+    :return: ַ 30000.0.22.4e-09
+    """
+    value = float(value)
+    if value == 0:
+        return '0.'
+    text = '%.6g' % value
+    if '.' not in text and 'e' not in text and 'n' not in text:
+        text += '.'
+    return text
+
+
+def format_table(table):
+    """
+     Abaqus/CAE ʽݱ
+
+    Ҷ뵽ȣֵʱһλͳһҶ뵽ȣ
+    бĩš
+    :param table: άУÿһ
+    :return: ıԻнβ
+    """
+    rows = [[format_number(value) for value in row] for row in table]
+    first = [row[0] for row in rows]
+    others = [text for row in rows for text in row[1:]]
+
+    width0 = max(len(text) for text in first)
+    if any(float(row[0]) != int(float(row[0])) for row in table):
+        width0 += 1
+    width1 = max([len(text) for text in others] or [0])
+
+    lines = []
+    for row in rows:
+        line = row[0].rjust(width0)
+        if len(row) == 1:
+            line += ','
+        for text in row[1:]:
+            line += ', ' + text.rjust(width1)
+        lines.append(line + '\n')
+    return ''.join(lines)
+
+
+def keyword_block(keyword, table):
+    """
+    һؼּ
+    :param keyword: ؼУ *Elastic
+    :param table: άݱ
+    """
+    return keyword + '\n' + format_table(table)
+
+
+def material_inp(name, density, elastic, plastic=None, cdp=None, cdp_tables=None):
+    """
+    һϵĹؼֿ
+    :param name: 
+    :param density: ܶ
+    :param elastic: (ģ, ɱ)
+    :param plastic: Ա ((Ӧ, Ӧ), ...)Ϊ None ʱ
+    :param cdp: CDP Բ (ͽ, ƫ, fb0/fc0, K, ճϵ)Ϊ None ʱ
+    :param cdp_tables: CDP ѹӲѹˡű
+    :return: ı
+    """
+    text = '*Material, name=' + name + '\n'
+    text += keyword_block('*Density', ((density,),))
+    text += keyword_block('*Elastic', (elastic,))
+    if plastic is not None:
+        text += keyword_block('*Plastic', plastic)
+    if cdp is not None:
+        hardening, stiffening, damage_c, damage_t = cdp_tables
+        text += keyword_block('*Concrete Damaged Plasticity', (cdp,))
+        text += keyword_block('*Concrete Compression Hardening', hardening)
+        text += keyword_block('*Concrete Tension Stiffening', stiffening)
+        text += keyword_block('*Concrete Compression Damage', damage_c)
+        text += keyword_block('*Concrete Tension Damage', damage_t)
+    return text
+
+
+def steel_inp(name, args):
+    """
+     SteelArgs ĿֲĹؼֿ飨 Steel.create ˫ģһ£
+    :param name: 
+    :param args: [ܶ, ģ, ɱ, Ӧ, Ӧ] SteelArgs.HRB400
+    :return: ı
+    """
+    rho, es, poisson, yie, limit = args
+    plastic = None
+    if yie and limit is not None:
+        plastic = ((yie, 0.0), (limit, 0.1))
+    return material_inp(name, rho, (es, poisson), plastic=plastic)
+
+
+def materials_inp(blocks, header=True):
+    """
+    ϲϹؼֿ飬 Abaqus/CAE д˳һ£
+    :param blocks: ϵĹؼֿı material_inp / to_inp
+    :param header: Ƿ "** MATERIALS" עͷ
+    :return: ı
+    """
+    blocks = sorted(blocks, key=lambda block: block.split('\n', 1)[0])
+    text = '** \n** MATERIALS\n** \n' if header else ''
+    return text + ''.join(blocks)
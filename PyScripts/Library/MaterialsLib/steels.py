@@ -4,7 +4,11 @@ Abaqus 
 
 * ˫ģ
 """
-from abaqus import *
+from ..ToolsLib.lazy import LazyModule
+from inpwriter import steel_inp
+
+# ںģ飬 model_name  None ʱʹ
+_abaqus = LazyModule('abaqus')
 
 
 class SteelArgs:
@@ -30,7 +34,7 @@ class Steel:
                  limit=540):
         """
         ֽ
-        :param model_name: ģ
+        :param model_name: ģΪ None ʱ inp ı
         :param name: 
         :param rho: ܶ
         :param es: ģ
@@ -38,7 +42,7 @@ class Steel:
         :param yie: Ӧ
         :param limit: Ӧ
         """
-        self.model = mdb.models[model_name]
+        self.model = _abaqus.mdb.models[model_name] if model_name is not None else None
         self.name = name
         self.rho = rho
         self.es = es
@@ -72,3 +76,10 @@ class Steel:
 
         print('Python:  ' + name)
         return material
+
+    def to_inp(self):
+        """
+         inp Ϲؼֿ飬 Abaqus/CAE
+        :return: *Material ... *Plastic ı
+        """
+        return steel_inp(self.name, [self.rho, self.es, self.poisson, self.yie, self.limit])
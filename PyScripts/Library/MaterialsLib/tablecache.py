@@ -0,0 +1,176 @@
+# coding=cp936
+"""
+ϱ
+
+* ݣϲȡ㣩ɼڴ LRU +  .npz 
+* ڴ水Ŀֽ̰ʱ̭δʹ
+"""
+import os
+import hashlib
+import tempfile
+from collections import OrderedDict
+import numpy as np
+
+# ʽ汾ʽʽıʱʹɻʧЧ
+CACHE_VERSION = 2
+
+
+def table_key(*parts):
+    """
+    ɲݼ㻺
+    :param parts: ַл
+    :return: ʮժҪ
+    """
+    md5 = hashlib.md5()
+    md5.update(repr(CACHE_VERSION).encode('ascii'))
+    for part in parts:
+        if part is None or isinstance(part, str):
+            md5.update(repr(part).encode('utf-8'))
+        else:
+            array = np.ascontiguousarray(part, dtype=float)
+            md5.update(repr(array.shape).encode('ascii'))
+            md5.update(array.tobytes())
+        md5.update(b'|')
+    return md5.hexdigest()
+
+
+class TableCache:
+    def __init__(self, path=None, max_items=64, max_bytes=64 * 1024 ** 2):
+        """
+        ϱ
+        :param path: ̻Ŀ¼Ϊ None ʱʹڴ滺
+        :param max_items: ڴ滺Ŀ
+        :param max_bytes: ֽ̻
+        """
+        self.path = path
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._memory = OrderedDict()
+
+    def _file(self, key):
+        return os.path.join(self.path, key + '.npz')
+
+    def _remember(self, key, tables):
+        self._memory.pop(key, None)
+        self._memory[key] = tables
+        while len(self._memory) > self.max_items:
+            self._memory.popitem(last=False)
+
+    def _load(self, key):
+        """
+        Ӵ̶ȡļʱΪδ
+        """
+        if self.path is None:
+            return None
+        file_path = self._file(key)
+        if not os.path.exists(file_path):
+            return None
+        try:
+            with np.load(file_path) as data:
+                tables = [data['arr_%d' % i] for i in range(len(data.files))]
+        except (IOError, OSError, ValueError, KeyError):
+            return None
+        # ·ʱ䣬 LRU ̭ʹ
+        os.utime(file_path, None)
+        return tables
+
+    def _dump(self, key, tables):
+        """
+        д̣дʱļٸⲢļ
+        """
+        if self.path is None:
+            return
+        if not os.path.exists(self.path):
+            os.makedirs(self.path)
+        file_path = self._file(key)
+        fd, temp_path = tempfile.mkstemp(suffix='.tmp', dir=self.path)
+        with os.fdopen(fd, 'wb') as file:
+            np.savez(file, *tables)
+        if os.path.exists(file_path):
+            os.remove(file_path)
+        os.rename(temp_path, file_path)
+        self._evict()
+
+    def _evict(self):
+        """
+        ܴСʱʱӾɵɾ
+        """
+        files = []
+        for file_name in os.listdir(self.path):
+            if file_name.endswith('.npz'):
+                stat = os.stat(os.path.join(self.path, file_name))
+                files.append((stat.st_mtime, stat.st_size, file_name))
+        files.sort()
+        total = sum(size for _, size, _ in files)
+        for _, size, file_name in files:
+            if total <= self.max_bytes:
+                break
+            os.remove(os.path.join(self.path, file_name))
+            total -= size
+
+    def get(self, key):
+        """
+        ȡ
+        :param key: 
+        :return: Ԫ飬δʱΪ None
+        """
+        if key in self._memory:
+            tables = self._memory[key]
+            self._remember(key, tables)
+            return tables
+
+        tables = self._load(key)
+        if tables is None:
+            return None
+        tables = self._freeze(tables)
+        self._remember(key, tables)
+        return tables
+
+    def put(self, key, tables):
+        """
+        д뻺
+        :param key: 
+        :param tables: 
+        :return: ֻıԪ
+        """
+        tables = self._freeze(tables)
+        self._remember(key, tables)
+        self._dump(key, tables)
+        return tables
+
+    def get_or_compute(self, key, func):
+        """
+        ʱֱӷػ棬 func() 㲢д뻺
+        """
+        tables = self.get(key)
+        if tables is not None:
+            self.hits += 1
+            return tables
+        self.misses += 1
+        return self.put(key, func())
+
+    def clear(self, disk=False):
+        """
+        ڴ滺
+        :param disk: Ƿͬʱɾ̻ļ
+        """
+        self._memory.clear()
+        if disk and self.path is not None and os.path.exists(self.path):
+            for file_name in os.listdir(self.path):
+                if file_name.endswith('.npz'):
+                    os.remove(os.path.join(self.path, file_name))
+
+    @staticmethod
+    def _freeze(tables):
+        frozen = []
+        for table in tables:
+            table = np.array(table, dtype=float)
+            table.flags.writeable = False
+            frozen.append(table)
+        return tuple(frozen)
+
+
+# ȫ CDP ϱ棬 cdp_cache.path ô̻
+cdp_cache = TableCache()
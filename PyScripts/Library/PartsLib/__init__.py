@@ -1,2 +1,11 @@
-from lines import *
-from solids import *
+# coding=cp936
+from partcache import *
+from meshgen import *
+from embedding import *
+from ..ToolsLib.lazy import LazyClass
+
+#  Abaqus ں˵Ĳ࣬״ʹʱ
+Lines = LazyClass(__name__ + '.lines', 'Lines')
+Cube = LazyClass(__name__ + '.solids', 'Cube')
+SimplyBeam = LazyClass(__name__ + '.solids', 'SimplyBeam')
+SimplyBeamMesh = LazyClass(__name__ + '.solids', 'SimplyBeamMesh')
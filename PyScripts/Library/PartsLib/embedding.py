@@ -0,0 +1,155 @@
+# coding=cp936
+"""
+ֽǶԤ
+
+* Խṹ񣨼 meshgen.hex_grid_mesh߶ֲÿֽڵڵԪֲ
+* ʽԼ (*Equation)ֽڵڵغʱĹڵţ EmbeddedRegion ݲ
+"""
+import numpy as np
+
+# C3D8R ǽڵľֲţ˳ͬ hex_grid_mesh
+HEX_CORNERS = np.array([[-1, -1, -1], [1, -1, -1], [1, 1, -1], [-1, 1, -1],
+                        [-1, -1, 1], [1, -1, 1], [1, 1, 1], [-1, 1, 1]], dtype=float)
+
+
+def _locate_axis(values, lines, tol):
+    """
+    ᶨλšھֲ [-1, 1]ľ
+    """
+    n = len(lines) - 1
+    index = np.clip(np.searchsorted(lines, values, side='right') - 1, 0, n - 1)
+    lower = lines[index]
+    upper = lines[index + 1]
+    natural = 2 * (values - lower) / (upper - lower) - 1
+    outside = np.maximum(lines[0] - values, 0) + np.maximum(values - lines[-1], 0)
+    natural = np.clip(natural, -1, 1)
+    return index, natural, np.where(outside > tol, outside, 0.0)
+
+
+def locate_in_grid(points, xs, ys, zs, tol=1e-6):
+    """
+    λֽڵڵԪ
+    :param points: ֽڵ (n, 3)ͬһϵѼʵƽƣ
+    :param xs:  x 
+    :param ys:  y 
+    :param zs:  z 
+    :param tol: ߽ľ룬Ϊ޷λ
+    :return: dict(elements Ԫ (n,)޷λΪ 0
+                  natural ֲ (n, 3)host_nodes Ԫڵ (n, 8)
+                  weights κȨ (n, 8)unplaced ޷λĽڵţdistance  (n,))
+    """
+    points = np.asarray(points, dtype=float)
+    xs, ys, zs = [np.asarray(lines, dtype=float) for lines in (xs, ys, zs)]
+    ny, nz = len(ys), len(zs)
+
+    i, xi, dx = _locate_axis(points[:, 0], xs, tol)
+    j, eta, dy = _locate_axis(points[:, 1], ys, tol)
+    k, zeta, dz = _locate_axis(points[:, 2], zs, tol)
+    distance = np.sqrt(dx ** 2 + dy ** 2 + dz ** 2)
+    placed = distance == 0
+
+    # ԪڵŹͬ hex_grid_mesh
+    elements = (i * (ny - 1) + j) * (nz - 1) + k + 1
+    elements[~placed] = 0
+    di, dj, dk = [((HEX_CORNERS[:, a] + 1) / 2).astype(int) for a in range(3)]
+    host_nodes = ((i[:, None] + di) * ny + (j[:, None] + dj)) * nz + (k[:, None] + dk) + 1
+
+    natural = np.column_stack([xi, eta, zeta])
+    weights = host_weights(natural)
+
+    return {
+        'elements': elements,
+        'natural': natural,
+        'host_nodes': host_nodes,
+        'weights': weights,
+        'unplaced': np.flatnonzero(~placed),
+        'distance': distance,
+    }
+
+
+def host_weights(natural):
+    """
+    ˽ڵκ N = (1 + Φa)(1 + Ǧa)(1 + Ʀa) / 8
+    :param natural: ֲ (n, 3)
+    :return: Ȩ (n, 8)
+    """
+    natural = np.asarray(natural, dtype=float)
+    return np.prod(1 + natural[:, None, :] * HEX_CORNERS[None, :, :], axis=2) / 8
+
+
+def shared_nodes(points, xs, ys, zs, tol=1e-6):
+    """
+    ڵ㲼ãֽڵڵغʱػڵ
+    辭ֽλã beam_hex_mesh  x_knots/y_knots/z_knots
+    :param points: ֽڵ (n, 3)
+    :param xs:  x 
+    :param ys:  y 
+    :param zs:  z 
+    :param tol: غж
+    :return: ڵ (n,)غΪ 0
+    """
+    points = np.asarray(points, dtype=float)
+    ny, nz = len(ys), len(zs)
+    index = []
+    hit = np.ones(len(points), dtype=bool)
+    for a, lines in enumerate((xs, ys, zs)):
+        lines = np.asarray(lines, dtype=float)
+        near = np.clip(np.searchsorted(lines, points[:, a]), 1, len(lines) - 1)
+        near -= (np.abs(points[:, a] - lines[near - 1]) <= np.abs(points[:, a] - lines[near])).astype(int)
+        hit &= np.abs(points[:, a] - lines[near]) <= tol
+        index.append(near)
+    labels = (index[0] * ny + index[1]) * nz + index[2] + 1
+    return np.where(hit, labels, 0)
+
+
+def equation_inp(rebar_instance, host_instance, rebar_labels, host_nodes, weights, unplaced=(),
+                 dofs=(1, 2, 3), min_weight=1e-10):
+    """
+    ʽǶԼ *Equationu(ֽڵ) =  Na u(ڵ)
+    ޷λĽڵûԪlocate_in_grid еԪΪ 0ֲ걻ضϣ뾭 unplaced 
+    :param rebar_instance: ֽʵ ReinMesh1
+    :param host_instance: ʵ Beam1
+    :param rebar_labels: ֽڵ (n,)
+    :param host_nodes: Ԫڵ (n, 8)
+    :param weights: κȨ (n, 8)
+    :param unplaced: Ľڵţȡ locate_in_grid ص unplaced
+    :param dofs: Լɶ
+    :param min_weight: Ե΢СȨ
+    :return: inp ı
+    """
+    keep = np.ones(len(rebar_labels), dtype=bool)
+    keep[np.asarray(unplaced, dtype=int)] = False
+    if not keep.all():
+        print('Python:  %d ޷λĸֽڵ㣬Լ' % (~keep).sum())
+
+    lines = []
+    for label, nodes, ws in zip(np.asarray(rebar_labels)[keep].tolist(), np.asarray(host_nodes)[keep].tolist(),
+                                np.asarray(weights)[keep].tolist()):
+        terms = [(node, w) for node, w in zip(nodes, ws) if abs(w) > min_weight]
+        for dof in dofs:
+            items = ['%s.%d, %d, -1.' % (rebar_instance, label, dof)]
+            items += ['%s.%d, %d, %.10g' % (host_instance, node, dof, w) for node, w in terms]
+            lines.append('*Equation')
+            lines.append('%d' % len(items))
+            # ÿ 4 
+            for n in range(0, len(items), 4):
+                lines.append(', '.join(items[n:n + 4]))
+    return '\n'.join(lines) + '\n'
+
+
+def embed_report(result, labels=None):
+    """
+    ӡλ
+    :param result: locate_in_grid ֵ
+    :param labels: ֽڵţг޷λĽڵ
+    :return: ޷λĽڵţţ
+    """
+    unplaced = result['unplaced']
+    total = len(result['elements'])
+    print('Python: ֽǶ Ѷλ %d / %d ڵ' % (total - len(unplaced), total))
+    if len(unplaced):
+        ids = unplaced if labels is None else np.asarray(labels)[unplaced]
+        print('Python: ޷λ %d ڵ㣬󳬳 %.6gڵ %s' % (
+            len(unplaced), result['distance'].max(), ids[:20].tolist()))
+        return ids
+    return unplaced
@@ -1,6 +1,10 @@
 # coding=cp936
+import regionToolset
 from abaqus import *
 from abaqusConstants import *
+from caeModules import mesh
+from partcache import part_cache, part_key
+from meshgen import beam_cage_mesh, node_data, element_data
 
 
 class Lines:
@@ -181,7 +185,9 @@ class Lines:
                          spacing_stirrup=100.0,
                          section_name_top='',
                          section_name_bottom='',
-                         section_name_stirrup=''):
+                         section_name_stirrup='',
+                         mesh_size=None,
+                         use_cache=True):
         """
         ֽ
         :param model_name: ģ
@@ -195,6 +201,8 @@ class Lines:
         :param section_name_top: ϲݽ
         :param section_name_bottom: ²ݽ
         :param section_name_stirrup: 
+        :param mesh_size: ߴ磬Ϊ None ʱֱӻ T3D2 
+        :param use_cache: Ƿʹò part_cache
         :return: 
         """
         model = mdb.models[model_name]
@@ -203,6 +211,14 @@ class Lines:
         if name in model.parts.keys():
             return model.parts[name]
 
+        # 
+        key = part_key('BeamMesh', length, width, height, num_top, num_bottom, spacing_stirrup,
+                       section_name_top, section_name_bottom, section_name_stirrup, mesh_size)
+        if use_cache:
+            part = part_cache.fetch(model_name, name, key)
+            if part is not None:
+                return part
+
         # ײݽ
         name0 = '__' + name + '_Long__'
         part0 = Lines.create_lines(model_name, name0, length, num_bottom, spacing=width / (num_bottom - 1))
@@ -244,5 +260,100 @@ class Lines:
         del model.parts[name0]
         del model.parts[name1]
 
+        # 
+        if mesh_size is not None:
+            part.seedPart(size=mesh_size, deviationFactor=0.1, minSizeFactor=0.1)
+            part.setElementType(regions=regionToolset.Region(edges=part.edges),
+                                elemTypes=(mesh.ElemType(elemCode=T3D2, elemLibrary=STANDARD),))
+            part.generateMesh()
+
+        if use_cache:
+            part_cache.register(model_name, name, key)
+
+        print('Python:  ' + name)
+        return part
+
+    @staticmethod
+    def create_beam_cage(model_name,
+                         name='BeamCage',
+                         length=1000.0,
+                         width=100.0,
+                         height=100.0,
+                         num_top=2,
+                         num_bottom=5,
+                         spacing_stirrup=100.0,
+                         section_name_top='',
+                         section_name_bottom='',
+                         section_name_stirrup='',
+                         mesh_size=None,
+                         use_cache=True,
+                         symmetry=0):
+        """
+        ֽ񲿼Ρ create_beam_mesh ͬ
+         NumPy ֱӼ T3D2 ڵ뵥ԪвͼСϲ
+        :param model_name: ģ
+        :param name: 
+        :param length: 
+        :param width: 
+        :param height: 
+        :param num_top: ϲݽ
+        :param num_bottom: ²ݽ
+        :param spacing_stirrup: 
+        :param section_name_top: ϲݽ
+        :param section_name_bottom: ²ݽ
+        :param section_name_stirrup: 
+        :param mesh_size: ߴ磬Ϊ None ʱֽÿΣ֮䣩һԪ
+        :param use_cache: Ƿʹò part_cache
+        :param symmetry: Գģʽ ( 0 ȫģͣ1 ģ x>=02 ķ֮һģ x>=0y>=0 )
+                         Գϵĸֽ뼯 "BottomReinSym""TopReinSym""StirrupsSym"
+                         ָɽ <>Half룬Ԥȴ
+        :return: 
+        """
+        model = mdb.models[model_name]
+
+        # 
+        if name in model.parts.keys():
+            return model.parts[name]
+
+        # 
+        key = part_key('BeamCage', length, width, height, num_top, num_bottom, spacing_stirrup,
+                       section_name_top, section_name_bottom, section_name_stirrup, mesh_size, symmetry)
+        if use_cache:
+            part = part_cache.fetch(model_name, name, key)
+            if part is not None:
+                return part
+
+        # 
+        nodes, groups = beam_cage_mesh(length, width, height, num_top, num_bottom, spacing_stirrup, mesh_size,
+                                       symmetry)
+
+        # 
+        part = model.Part(name=name, dimensionality=THREE_D, type=DEFORMABLE_BODY)
+        part.addNodes(nodeData=node_data(nodes))
+
+        set_sections = (('BottomRein', section_name_bottom),
+                        ('TopRein', section_name_top),
+                        ('Stirrups', section_name_stirrup),
+                        ('BottomReinSym', section_name_bottom + 'Half'),
+                        ('TopReinSym', section_name_top + 'Half'),
+                        ('StirrupsSym', section_name_stirrup + 'Half'))
+        label = 1
+        for set_name, _ in set_sections:
+            if set_name not in groups:
+                continue
+            conn = groups[set_name]
+            part.addElements(elementData=element_data(conn, label), type='T3D2', elementSetName=set_name)
+            label += len(conn)
+        part.Set(name='All', elements=part.elements)
+
+        # ָ
+        sections = model.sections.keys()
+        for set_name, section_name in set_sections:
+            if set_name in groups and section_name in sections:
+                part.SectionAssignment(part.sets[set_name], section_name)
+
+        if use_cache:
+            part_cache.register(model_name, name, key)
+
         print('Python:  ' + name)
         return part
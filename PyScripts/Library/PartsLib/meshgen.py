@@ -0,0 +1,304 @@
+# coding=cp936
+"""
+NumPy 
+
+* ֱӼڵꡢԪӣ Abaqus/CAE β
+* ڵ㡢ԪŴ 1 ʼ
+"""
+import numpy as np
+
+
+def refine_polyline(points, mesh_size=None):
+    """
+    ߴϸߣÿһԪ
+    :param points: ߶ (n, 3)
+    :param mesh_size: ߴ磬Ϊ None ʱÿһԪ
+    :return: ϸֺĶ (m, 3)
+    """
+    points = np.asarray(points, dtype=float)
+    if mesh_size is None:
+        return points
+
+    seg = np.diff(points, axis=0)
+    num = np.ceil(np.sqrt((seg ** 2).sum(axis=1)) / mesh_size - 1e-9).astype(int)
+    num = np.maximum(num, 1)
+
+    # ڲĲ t = 0, 1/n, ..., (n-1)/n
+    index = np.repeat(np.arange(len(num)), num)
+    start = np.repeat(np.cumsum(num) - num, num)
+    t = (np.arange(num.sum()) - start) / np.repeat(num, num).astype(float)
+    return np.vstack([points[index] + seg[index] * t[:, None], points[-1:]])
+
+
+def polyline_elements(lines):
+    """
+    ߵĶڵ㵥Ԫ
+    :param lines:  (, , 3)
+    :return:  (*, 3) (*(-1), 2)Ϊ 0 ʼľֲ
+    """
+    num_lines, num_points = lines.shape[:2]
+    first = np.arange(num_lines)[:, None] * num_points + np.arange(num_points - 1)[None, :]
+    conn = np.column_stack([first.ravel(), first.ravel() + 1])
+    return lines.reshape(-1, 3), conn
+
+
+def node_data(nodes, start=1):
+    """
+    תΪ Part.addNodes  nodeData((, x, y, z), ...)
+    :param nodes:  (N, 3)
+    :param start: ʼ
+    """
+    return [(start + i,) + tuple(xyz) for i, xyz in enumerate(np.asarray(nodes, dtype=float).tolist())]
+
+
+def element_data(elements, start=1):
+    """
+    תΪ Part.addElements  elementData((, ڵ1, ڵ2, ...), ...)
+    :param elements: Ԫڵ (E, k)
+    :param start: ʼ
+    """
+    return [(start + i,) + tuple(conn) for i, conn in enumerate(np.asarray(elements, dtype=int).tolist())]
+
+
+def merge_nodes(coords, groups, decimals=6):
+    """
+    ϲغϽڵ㣨ݽ빿㣩±
+    :param coords: ȫ (n, 3)
+    :param groups: {: ֲ (e, k)}ֲָ coords
+    :param decimals: жغϵ꾫ȣСλ
+    :return: nodes (N, 3){: Ԫڵ (e, k) 1 ʼ}
+    """
+    _, index, inverse = np.unique(np.round(coords, decimals), axis=0, return_index=True, return_inverse=True)
+    inverse = np.asarray(inverse).ravel()
+    nodes = coords[index]
+    return nodes, dict((name, inverse[conn] + 1) for name, conn in groups.items())
+
+
+def beam_cage_mesh(length=1000.0,
+                   width=100.0,
+                   height=100.0,
+                   num_top=2,
+                   num_bottom=5,
+                   spacing_stirrup=100.0,
+                   mesh_size=None,
+                   symmetry=0):
+    """
+    ֽ T3D2 񣬼 Lines.create_beam_mesh ͬ
+
+    ݽ x ᣬ׽ z=0 z=heighty  [-width/2, width/2]
+    λ yz ƽ棬 x ԳƲáݽڹϿڵ㡣
+    Գģֻ x>=0 y>=0֣ y=0 Ͽ
+    λڶԳϵݽ *Sym ϣӦָĽ档
+    :param length: 
+    :param width: 
+    :param height: 
+    :param num_top: ϲݽ
+    :param num_bottom: ²ݽ
+    :param spacing_stirrup: 
+    :param mesh_size: ߴ磬Ϊ None ʱÿһԪ seedEdgeByNumber(number=1) һ£
+    :param symmetry: Գģʽ ( 0 ȫģͣ1 ģ x>=02 ķ֮һģ x>=0y>=0 )
+    :return: nodes (N, 3){'BottomRein', 'TopRein', 'Stirrups'[, 'BottomReinSym', 'TopReinSym', 'StirrupsSym']:
+             Ԫڵ (e, 2)}ռϲ
+    """
+    tol = 1e-6
+
+    # λ
+    num = int(length / spacing_stirrup) + 1
+    x0 = length / 2 - length % spacing_stirrup / 2
+    xs = x0 - spacing_stirrup * np.arange(num)
+    if symmetry >= 1:
+        xs = xs[xs > -tol]
+
+    # ݽϵ㣺ˣԳʱΪУ
+    xb = np.unique(np.concatenate([[0.0 if symmetry >= 1 else -length / 2, length / 2], xs]))
+    yb = np.linspace(width / 2, -width / 2, num_bottom)
+    yt = np.linspace(-width / 2, width / 2, num_top)
+    if symmetry == 2:
+        yb = yb[yb > -tol]
+        yt = yt[yt > -tol]
+
+    def bars(ys, z):
+        template = refine_polyline(np.column_stack([xb, np.zeros_like(xb), np.full_like(xb, z)]), mesh_size)
+        lines = np.repeat(template[None, :, :], len(ys), axis=0)
+        lines[:, :, 1] = ys[:, None]
+        return polyline_elements(lines)
+
+    def stirrups(xs):
+        lines = np.repeat(template[None, :, :], len(xs), axis=0)
+        lines[:, :, 0] = xs[:, None]
+        return polyline_elements(lines)
+
+    if symmetry == 2:
+        # y=0  ױߣ׽ Ҳ  ߣ y=0
+        yb0 = np.unique(np.concatenate([[0.0], yb]))
+        yt0 = np.unique(np.concatenate([[0.0], yt]))[::-1]
+        loop = np.vstack([
+            np.column_stack([np.zeros(len(yb0)), yb0, np.zeros(len(yb0))]),
+            np.column_stack([np.zeros(len(yt0)), yt0, np.full(len(yt0), height)])
+        ])
+    else:
+        # ױߣ׽ Ҳ  ߣ ࣬պ
+        loop = np.vstack([
+            np.column_stack([np.zeros(num_bottom), yb[::-1], np.zeros(num_bottom)]),
+            np.column_stack([np.zeros(num_top), yt[::-1], np.full(num_top, height)]),
+            [[0.0, -width / 2, 0.0]]
+        ])
+    template = refine_polyline(loop, mesh_size)
+
+    # Գϵĸֽ
+    on_yb = np.abs(yb) < tol if symmetry == 2 else np.zeros(len(yb), dtype=bool)
+    on_yt = np.abs(yt) < tol if symmetry == 2 else np.zeros(len(yt), dtype=bool)
+    on_xs = np.abs(xs) < tol if symmetry >= 1 else np.zeros(len(xs), dtype=bool)
+
+    coords = []
+    groups = {}
+    offset = 0
+    for name, (xyz, conn) in (('BottomRein', bars(yb[~on_yb], 0.0)),
+                              ('TopRein', bars(yt[~on_yt], height)),
+                              ('Stirrups', stirrups(xs[~on_xs])),
+                              ('BottomReinSym', bars(yb[on_yb], 0.0)),
+                              ('TopReinSym', bars(yt[on_yt], height)),
+                              ('StirrupsSym', stirrups(xs[on_xs]))):
+        if not len(conn):
+            continue
+        coords.append(xyz)
+        groups[name] = conn + offset
+        offset += len(xyz)
+
+    return merge_nodes(np.vstack(coords), groups)
+
+
+def grid_axis(knots, mesh_size):
+    """
+    һάߣȫƵ㣨ָλã䰴ߴ
+    :param knots: Ƶ꣨ˣ
+    :param mesh_size: ߴ
+    :return: 
+    """
+    knots = np.unique(np.round(np.asarray(knots, dtype=float), 9))
+    return refine_polyline(knots[:, None], mesh_size)[:, 0]
+
+
+def hex_grid_mesh(xs, ys, zs):
+    """
+     C3D8R 
+    :param xs: x 
+    :param ys: y 
+    :param zs: z 
+    :return: nodes (N, 3)elements (E, 8)Ԫ (i, j, k) ˳
+    """
+    nx, ny, nz = len(xs), len(ys), len(zs)
+    grid = np.meshgrid(xs, ys, zs, indexing='ij')
+    nodes = np.column_stack([axis.ravel() for axis in grid])
+
+    ids = np.arange(1, nx * ny * nz + 1).reshape(nx, ny, nz)
+
+    def corner(di, dj, dk):
+        return ids[di:nx - 1 + di, dj:ny - 1 + dj, dk:nz - 1 + dk].ravel()
+
+    # ڵ 1-4 Ϊ z ±棨ʱ룩5-8 Ϊϱ
+    elements = np.column_stack([corner(0, 0, 0), corner(1, 0, 0), corner(1, 1, 0), corner(0, 1, 0),
+                                corner(0, 0, 1), corner(1, 0, 1), corner(1, 1, 1), corner(0, 1, 1)])
+    return nodes, elements
+
+
+def beam_grid(length=2000.0,
+              width=200.0,
+              height=300.0,
+              pad_width=0.0,
+              load_mode=0,
+              mesh_size=50.0,
+              x_knots=(),
+              y_knots=(),
+              z_knots=(),
+              symmetry=0):
+    """
+    ֧ṹߣͬ beam_hex_mesh
+    :return: (xs, ys, zs)
+    """
+    x = length / 2
+    knots = [-x, 0.0, x]
+    if pad_width != 0:
+        knots += [x - pad_width, pad_width - x]
+    if load_mode == 1:
+        knots += [pad_width / 2, -pad_width / 2]
+    if load_mode == 2:
+        x0 = length / 6 + pad_width / 2
+        x1 = length / 6 - pad_width / 2
+        knots += [x0, x1, -x1, -x0]
+
+    x_min = 0.0 if symmetry >= 1 else -x
+    y_min = 0.0 if symmetry == 2 else -width / 2
+    xs = grid_axis([k for k in knots + list(x_knots) if k >= x_min], mesh_size)
+    ys = grid_axis([k for k in [-width / 2, 0.0, width / 2] + list(y_knots) if k >= y_min], mesh_size)
+    zs = grid_axis([0.0, height] + list(z_knots), mesh_size)
+    return xs, ys, zs
+
+
+def beam_hex_mesh(length=2000.0,
+                  width=200.0,
+                  height=300.0,
+                  pad_width=0.0,
+                  load_mode=0,
+                  mesh_size=50.0,
+                  x_knots=(),
+                  y_knots=(),
+                  z_knots=(),
+                  symmetry=0):
+    """
+    ֧ C3D8R ṹ߶СԵλãͬ SimplyBeam
+    :param length: 
+    :param width: 
+    :param height: 
+    :param pad_width: ȣΪ 0 ʱ "ToPads"
+    :param load_mode: ģʽ ( 0 أ1 еأ2 ֵ )
+    :param mesh_size: ߴ
+    :param x_knots:  x ߣ繿λãڸֽڵ㣩
+    :param y_knots:  y ߣݽλ
+    :param z_knots:  z ߣݽ߶
+    :param symmetry: Գģʽ ( 0 ȫģͣ1 ģ x>=02 ķ֮һģ x>=0y>=0 )
+                     Գڵ㼯Ϊ "SymX""SymY"
+    :return: dict(nodes, elements, node_sets, element_sets, surfaces, grid)
+             surfaces Ϊ {: [( 1~6, Ԫ), ...]}ż S1~S6grid Ϊ (xs, ys, zs)
+    """
+    x = length / 2
+    x0 = length / 6 + pad_width / 2
+    x1 = length / 6 - pad_width / 2
+    xs, ys, zs = beam_grid(length, width, height, pad_width, load_mode, mesh_size, x_knots, y_knots, z_knots,
+                           symmetry)
+    nodes, elements = hex_grid_mesh(xs, ys, zs)
+
+    # Ԫ
+    shape = (len(xs) - 1, len(ys) - 1, len(zs) - 1)
+    xc = np.broadcast_to(((xs[:-1] + xs[1:]) / 2)[:, None, None], shape).ravel()
+    k = np.broadcast_to(np.arange(shape[2])[None, None, :], shape).ravel()
+    labels = np.arange(1, len(elements) + 1)
+    bottom = k == 0
+    top = k == shape[2] - 1
+
+    surfaces = {}
+    if pad_width != 0:
+        surfaces['ToPads'] = [(1, labels[bottom & (np.abs(xc) > x - pad_width)])]
+    if load_mode == 0:
+        surfaces['ToLoad'] = [(2, labels[top])]
+    if load_mode == 1:
+        surfaces['ToLoad'] = [(2, labels[top & (np.abs(xc) < pad_width / 2)])]
+    if load_mode == 2:
+        surfaces['ToLoad'] = [(2, labels[top & (np.abs(xc) > x1) & (np.abs(xc) < x0)])]
+
+    # ее
+    mid = np.flatnonzero((nodes == 0).all(axis=1)) + 1
+    node_sets = {'MidPoint': mid}
+    if symmetry >= 1:
+        node_sets['SymX'] = np.flatnonzero(nodes[:, 0] == 0) + 1
+    if symmetry == 2:
+        node_sets['SymY'] = np.flatnonzero(nodes[:, 1] == 0) + 1
+
+    return {
+        'nodes': nodes,
+        'elements': elements,
+        'node_sets': node_sets,
+        'element_sets': {'All': labels},
+        'surfaces': surfaces,
+        'grid': (xs, ys, zs),
+    }
@@ -0,0 +1,90 @@
+# coding=cp936
+"""
+λ
+
+* Թ淶ļβߴ硢ָʽ桢ߴȣΪ
+* ʱвָϡָɡ񣩸Ƶģͣͼ졢ָϲ
+"""
+from ..ToolsLib.lazy import LazyModule
+
+# ںģ飬 fetch ʹ
+_abaqus = LazyModule('abaqus')
+
+
+def part_key(kind, *params):
+    """
+    淶Ϊ
+    :param kind: ͣ 'Cube'
+    :param params: βֵͳһ float Ƚ
+    :return: Ԫ
+    """
+    key = [kind]
+    for param in params:
+        if isinstance(param, (int, float)) and not isinstance(param, bool):
+            param = round(float(param), 6)
+        key.append(param)
+    return tuple(key)
+
+
+class PartCache:
+    def __init__(self):
+        """
+        棬¼  -> (ģ, )
+        """
+        self.enabled = True
+        self.hits = 0
+        self.misses = 0
+        self._parts = {}
+
+    def fetch(self, model_name, name, key):
+        """
+        һ棬ʱԴΪ model_name е name
+        :param model_name: Ŀģ
+        :param name: Ŀ겿
+        :param key: 
+        :return: ƵõĲδʱΪ None
+        """
+        if not self.enabled:
+            return None
+
+        source = self._parts.get(key)
+        if source is not None:
+            source_model, source_name = source
+            models = _abaqus.mdb.models
+            if source_model in models.keys() and source_name in models[source_model].parts.keys():
+                part = models[model_name].Part(name=name, objectToCopy=models[source_model].parts[source_name])
+                self.hits += 1
+                print('Python: Ʋ ' + source_model + '.' + source_name + ' -> ' + name)
+                return part
+            # Դɾ
+            del self._parts[key]
+
+        self.misses += 1
+        return None
+
+    def register(self, model_name, name, key):
+        """
+        Ǽ½
+        :param model_name: ģ
+        :param name: 
+        :param key: 
+        """
+        if self.enabled:
+            self._parts[key] = (model_name, name)
+
+    def clear(self):
+        self._parts.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def report(self):
+        """
+        ӡͳ
+        :return: (д, δд)
+        """
+        print('Python:   %d Σδ %d ' % (self.hits, self.misses))
+        return self.hits, self.misses
+
+
+# ȫֲ
+part_cache = PartCache()
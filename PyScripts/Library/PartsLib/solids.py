@@ -1,6 +1,8 @@
 # coding=cp936
 from abaqus import *
 from abaqusConstants import *
+from partcache import part_cache, part_key
+from meshgen import beam_hex_mesh, node_data, element_data
 
 
 class Cube:
@@ -13,7 +15,11 @@ class Cube:
                  section_name='',
                  need_surf_top=False,
                  need_surf_bottom=False,
-                 need_repoint=False):
+                 need_repoint=False,
+                 mesh_size=None,
+                 use_cache=True,
+                 half_x=0,
+                 half_y=0):
         """
         3ά-ɱ ʵ岿
         :param model_name: ģ
@@ -26,6 +32,10 @@ class Cube:
         :param need_surf_top: Ƿö "Top"
         :param need_surf_bottom: Ƿõ "Bottom"
         :param need_repoint: Ƿڵòο
+        :param mesh_size: ߴ磬Ϊ None ʱֱӻ
+        :param use_cache: Ƿʹò part_cache
+        :param half_x:  x=0 У1  x>=0-1  x<=00 У漯 "SymX"
+        :param half_y:  y=0 У1  y>=0-1  y<=00 У漯 "SymY"
         """
 
         def create():
@@ -34,11 +44,21 @@ class Cube:
             if name in model.parts.keys():
                 return model.parts[name]
 
+            # 
+            key = part_key('Cube', length, width, height, section_name,
+                           need_surf_top, need_surf_bottom, need_repoint, mesh_size, half_x, half_y)
+            if use_cache:
+                part = part_cache.fetch(model_name, name, key)
+                if part is not None:
+                    self.restore(part)
+                    return part
+
             # 
             x = length / 2
             y = width / 2
             sketch = model.ConstrainedSketch(name='__profile__', sheetSize=1.2 * max(length, width))
-            sketch.rectangle(point1=(-x, -y), point2=(x, y))
+            sketch.rectangle(point1=(0.0 if half_x > 0 else -x, 0.0 if half_y > 0 else -y),
+                             point2=(0.0 if half_x < 0 else x, 0.0 if half_y < 0 else y))
 
             # 
             part = model.Part(name, dimensionality=THREE_D, type=DEFORMABLE_BODY)
@@ -61,11 +81,40 @@ class Cube:
             if need_repoint:
                 self.rp0 = part.ReferencePoint(point=(0.0, 0.0, 0.0))
 
+            # 
+            if half_x != 0:
+                part.Set(name='SymX', faces=part.faces.getByBoundingBox(xMin=0, xMax=0))
+            if half_y != 0:
+                part.Set(name='SymY', faces=part.faces.getByBoundingBox(yMin=0, yMax=0))
+
+            # 
+            if mesh_size is not None:
+                part.seedPart(size=mesh_size, deviationFactor=0.1, minSizeFactor=0.1)
+                part.generateMesh()
+
+            if use_cache:
+                part_cache.register(model_name, name, key)
+
             print('Python:  ' + name)
             return part
 
         self.part = create()
 
+    def restore(self, part):
+        """
+        ɸƵõĲָ½ʱõԣ All Top / Bottomο㣩ʹ½һ
+        :param part: 
+        """
+        if 'All' in part.sets.keys():
+            self.set_all = part.sets['All']
+        if 'Top' in part.surfaces.keys():
+            self.surf_top = part.surfaces['Top']
+        if 'Bottom' in part.surfaces.keys():
+            self.surf_bottom = part.surfaces['Bottom']
+        if len(part.referencePoints):
+            # οֿ id Ϊȡ½ʱͬ Feature
+            self.rp0 = part.featuresById[part.referencePoints.keys()[0]]
+
 
 class SimplyBeam(Cube):
     def __init__(self,
@@ -79,7 +128,10 @@ class SimplyBeam(Cube):
                  need_surf_bottom=False,
                  need_repoint=False,
                  pad_width=0.0,
-                 load_mode=0):
+                 load_mode=0,
+                 mesh_size=None,
+                 use_cache=True,
+                 symmetry=0):
         """
         3ά-ɱ ֧ʵ岿
         :param name: 
@@ -92,6 +144,10 @@ class SimplyBeam(Cube):
         :param need_repoint: Ƿڵòο
         :param pad_width: ȣĬ 0.0 õ飬õ󣬴 "ToPads"
         :param load_mode: ģʽָģͣر "ToLoad"( 0 أ1 мأ2 ֵ )
+        :param mesh_size: ߴ磬Ϊ None ʱֱָӻ
+        :param use_cache: Ƿʹò part_cache
+        :param symmetry: Գģʽ ( 0 ȫģͣ1 ģ x>=02 ķ֮һģ x>=0y>=0 )
+                         Գ漯 "SymX""SymY"
         """
 
         def create():
@@ -100,19 +156,32 @@ class SimplyBeam(Cube):
             if name in model.parts.keys():
                 return model.parts[name]
 
+            # 
+            key = part_key('SimplyBeam', length, width, height, section_name,
+                           need_surf_top, need_surf_bottom, need_repoint, pad_width, load_mode, mesh_size,
+                           symmetry)
+            if use_cache:
+                part = part_cache.fetch(model_name, name, key)
+                if part is not None:
+                    self.restore(part)
+                    self.mid_point = part.sets['MidPoint']
+                    return part
+
             Cube.__init__(self, model_name, name, length, width, height, section_name, need_surf_top, need_surf_bottom,
-                          need_repoint)
+                          need_repoint, None, False, int(symmetry >= 1), int(symmetry == 2))
             part = self.part
 
             y = width / 2
 
-            # зָ
-            dp0 = part.DatumPointByCoordinate(coords=(0, y, height))
-            part.PartitionCellByPlanePointNormal(point=part.datums[dp0.id],
-                                                 normal=part.edges.findAt((1e-2, y, 0)),
-                                                 cells=part.cells)
-            # е
-            part.PartitionEdgeByParam(edges=part.edges.findAt((0, 1e-2, 0)), parameter=0.5)
+            # зָԳģͿΪ߽棩
+            if symmetry == 0:
+                dp0 = part.DatumPointByCoordinate(coords=(0, y, height))
+                part.PartitionCellByPlanePointNormal(point=part.datums[dp0.id],
+                                                     normal=part.edges.findAt((1e-2, y, 0)),
+                                                     cells=part.cells)
+            # е㣨ķ֮һģΪǵ㣩
+            if symmetry < 2:
+                part.PartitionEdgeByParam(edges=part.edges.findAt((0, 1e-2, 0)), parameter=0.5)
             self.mid_point = part.Set(vertices=
                                       part.vertices.getByBoundingBox(xMin=0, yMin=0, zMin=0, zMax=0, xMax=0, yMax=0),
                                       name='MidPoint')
@@ -126,9 +195,10 @@ class SimplyBeam(Cube):
                 part.PartitionCellByPlanePointNormal(point=part.datums[dp0.id],
                                                      normal=part.edges.findAt((1e-2, y, 0)),
                                                      cells=part.cells)
-                part.PartitionCellByPlanePointNormal(point=part.datums[dp1.id],
-                                                     normal=part.edges.findAt((1e-2, y, 0)),
-                                                     cells=part.cells)
+                if symmetry == 0:
+                    part.PartitionCellByPlanePointNormal(point=part.datums[dp1.id],
+                                                         normal=part.edges.findAt((1e-2, y, 0)),
+                                                         cells=part.cells)
 
                 part.Surface(side1Faces=
                              part.faces.getByBoundingBox(xMin=x, zMax=0) +
@@ -149,9 +219,10 @@ class SimplyBeam(Cube):
                 part.PartitionCellByPlanePointNormal(point=part.datums[dp0.id],
                                                      normal=part.edges.findAt((1e-2, y, 0)),
                                                      cells=part.cells)
-                part.PartitionCellByPlanePointNormal(point=part.datums[dp1.id],
-                                                     normal=part.edges.findAt((1e-2, y, 0)),
-                                                     cells=part.cells)
+                if symmetry == 0:
+                    part.PartitionCellByPlanePointNormal(point=part.datums[dp1.id],
+                                                         normal=part.edges.findAt((1e-2, y, 0)),
+                                                         cells=part.cells)
                 part.Surface(side1Faces=
                              part.faces.getByBoundingBox(xMax=x, xMin=-x, zMin=height),
                              name=surf_load_name)
@@ -172,17 +243,108 @@ class SimplyBeam(Cube):
                 part.PartitionCellByPlanePointNormal(point=part.datums[dp1.id],
                                                      normal=part.edges.findAt((1e-2, y, 0)),
                                                      cells=part.cells)
-                part.PartitionCellByPlanePointNormal(point=part.datums[dp2.id],
-                                                     normal=part.edges.findAt((1e-2, y, 0)),
-                                                     cells=part.cells)
-                part.PartitionCellByPlanePointNormal(point=part.datums[dp3.id],
-                                                     normal=part.edges.findAt((1e-2, y, 0)),
-                                                     cells=part.cells)
+                if symmetry == 0:
+                    part.PartitionCellByPlanePointNormal(point=part.datums[dp2.id],
+                                                         normal=part.edges.findAt((1e-2, y, 0)),
+                                                         cells=part.cells)
+                    part.PartitionCellByPlanePointNormal(point=part.datums[dp3.id],
+                                                         normal=part.edges.findAt((1e-2, y, 0)),
+                                                         cells=part.cells)
 
                 part.Surface(side1Faces=
                              part.faces.getByBoundingBox(xMax=x0, xMin=x1, zMin=height) +
                              part.faces.getByBoundingBox(xMax=-x1, xMin=-x0, zMin=height),
                              name=surf_load_name)
+
+            # 
+            if mesh_size is not None:
+                part.seedPart(size=mesh_size, deviationFactor=0.1, minSizeFactor=0.1)
+                part.generateMesh()
+
+            if use_cache:
+                part_cache.register(model_name, name, key)
+            return part
+
+        self.part = create()
+
+
+class SimplyBeamMesh:
+    def __init__(self,
+                 model_name,
+                 name='Beam',
+                 length=2000.0,
+                 width=200.0,
+                 height=300.0,
+                 section_name='',
+                 pad_width=0.0,
+                 load_mode=0,
+                 mesh_size=50.0,
+                 use_cache=True,
+                 symmetry=0):
+        """
+        3ά-ɱ ֧񲿼 SimplyBeam ļϡͬ
+         NumPy ֱ C3D8R ṹ񣬲зָ񻮷
+        :param model_name: ģ
+        :param name: 
+        :param length: 
+        :param width: 
+        :param height: 
+        :param section_name: 
+        :param pad_width: ȣĬ 0.0 õ飬õ󣬴 "ToPads"
+        :param load_mode: ģʽߣر "ToLoad"( 0 أ1 мأ2 ֵ )
+        :param mesh_size: ߴ
+        :param use_cache: Ƿʹò part_cache
+        :param symmetry: Գģʽ ( 0 ȫģͣ1 ģ x>=02 ķ֮һģ x>=0y>=0 )
+                         Գڵ㼯 "SymX""SymY"
+        """
+
+        def create():
+            # 
+            model = mdb.models[model_name]
+            if name in model.parts.keys():
+                return model.parts[name]
+
+            # 
+            key = part_key('SimplyBeamMesh', length, width, height, section_name, pad_width, load_mode, mesh_size,
+                           symmetry)
+            if use_cache:
+                part = part_cache.fetch(model_name, name, key)
+                if part is not None:
+                    self.mid_point = part.sets['MidPoint']
+                    return part
+
+            # 
+            data = beam_hex_mesh(length, width, height, pad_width, load_mode, mesh_size, symmetry=symmetry)
+            nodes = data['nodes']
+            elements = data['elements']
+
+            # 
+            part = model.Part(name=name, dimensionality=THREE_D, type=DEFORMABLE_BODY)
+            part.addNodes(nodeData=node_data(nodes))
+            part.addElements(elementData=element_data(elements), type='C3D8R')
+
+            # 
+            for set_name, labels in data['node_sets'].items():
+                part.Set(name=set_name, nodes=part.nodes.sequenceFromLabels(labels.tolist()))
+            for set_name, labels in data['element_sets'].items():
+                part.Set(name=set_name, elements=part.elements.sequenceFromLabels(labels.tolist()))
+            self.mid_point = part.sets['MidPoint']
+
+            # 
+            for surf_name, faces in data['surfaces'].items():
+                kwargs = {}
+                for face, labels in faces:
+                    kwargs['face%dElements' % face] = part.elements.sequenceFromLabels(labels.tolist())
+                part.Surface(name=surf_name, **kwargs)
+
+            # ָ
+            if section_name in model.sections.keys():
+                part.SectionAssignment(region=part.sets['All'], sectionName=section_name)
+
+            if use_cache:
+                part_cache.register(model_name, name, key)
+
+            print('Python:  ' + name)
             return part
 
         self.part = create()
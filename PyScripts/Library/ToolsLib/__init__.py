@@ -0,0 +1,2 @@
+from profiler import *
+from lazy import *
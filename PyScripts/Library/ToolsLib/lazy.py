@@ -0,0 +1,71 @@
+# coding=cp936
+"""
+ӳٵ
+
+* Abaqus ںģ飨abaqusabaqusConstantsregionToolset ȣ CAE ڿ
+* ֵ֣ϱɡinp дҵȵȣںˣ Library ʱںģ
+* ں˵Դ״εûʱŵģ
+"""
+import importlib
+
+
+class LazyModule(object):
+    def __init__(self, name):
+        """
+        ģ״ηʱ
+        :param name: ģ 'abaqus'
+        """
+        self._name = name
+        self._module = None
+
+    def load(self):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr):
+        if attr.startswith('__'):
+            raise AttributeError(attr)
+        return getattr(self.load(), attr)
+
+    def __repr__(self):
+        return '<lazy module %s>' % self._name
+
+
+class LazyClass(object):
+    def __init__(self, module, name):
+        """
+        ״εûʱģ
+         isinstanceʱ load() ȡԭ
+        :param module: ģȫ 'Library.PartsLib.solids'
+        :param name: 
+        """
+        self._module = module
+        self._name = name
+        self._owner = None
+        self.__name__ = name
+
+    def load(self):
+        if self._owner is None:
+            self._owner = getattr(importlib.import_module(self._module), self._name)
+        return self._owner
+
+    def __call__(self, *args, **kwargs):
+        return self.load()(*args, **kwargs)
+
+    def __getattr__(self, attr):
+        if attr.startswith('__'):
+            raise AttributeError(attr)
+        return getattr(self.load(), attr)
+
+    def __repr__(self):
+        return '<lazy class %s.%s>' % (self._module, self._name)
+
+
+def resolve(owner):
+    """
+    ԭ࣬ԭ
+    """
+    if isinstance(owner, LazyClass):
+        return owner.load()
+    return owner
@@ -0,0 +1,199 @@
+# coding=cp936
+"""
+ģʱѡ
+
+*  mark ˳򻮷ֽ׶Σϡ桢¼׶ǽʱ
+*  sys.setprofile  c_call ¼ͳں APIC չ/ôĶں˶
+* enable ʱװָķLines.*CubeSimplyBeamConcreteAb.createSteel.create ȣ¼ô뺬Ƕ׺ʱ
+* ÿģд Profile-<ģ>.json / .csv
+"""
+import os
+import sys
+import csv
+import json
+import time
+import types
+from collections import OrderedDict
+from lazy import resolve
+
+# ں˵õ Python Դģ
+PYTHON_MODULES = set(['builtins', '__builtin__', 'posix', 'nt', 'time', 'math', 'io', '_io', 'sys', 'gc',
+                      'itertools', '_collections', '_functools', 'thread', '_thread', 'numpy', 'posixpath',
+                      'ntpath', 'codecs', '_codecs', 're', '_sre', 'json', '_json', 'inspect', 'os'])
+PYTHON_TYPES = set(['list', 'dict', 'str', 'unicode', 'bytes', 'tuple', 'set', 'frozenset', 'int', 'long',
+                    'float', 'bool', 'object', 'type', 'file', 'TextIOWrapper', 'BufferedReader',
+                    'BufferedWriter', 'ndarray', 'generator', 'OrderedDict', 'deque', 'Counter', 'SRE_Pattern',
+                    'Pattern', 'Match', 'SRE_Match', 'method_descriptor', 'module', 'NoneType'])
+
+
+def _call_name(func):
+    """
+    C .  ģ.
+    :return: (, Ƿں˵)
+    """
+    owner = getattr(func, '__self__', None)
+    name = getattr(func, '__name__', '?')
+    if owner is None or isinstance(owner, types.ModuleType):
+        module = getattr(func, '__module__', None) or getattr(owner, '__name__', None) or '?'
+        return module + '.' + name, module.split('.')[0] not in PYTHON_MODULES
+    kind = type(owner).__name__
+    return kind + '.' + name, kind not in PYTHON_TYPES
+
+
+class Profiler:
+    def __init__(self):
+        """
+        ģʱδ enable ʱΪղ
+        """
+        self.enabled = False
+        self.path = None
+        self.model = None
+        self.phases = OrderedDict()
+        self._phase = None
+        self._start = None
+        self._begin = None
+
+    def enable(self, owners=(), path=None):
+        """
+        װָжķ
+        :param owners: У (Lines, Cube, SimplyBeam, ConcreteAb, Steel)
+        :param path: Ŀ¼ĬϵǰĿ¼
+        """
+        self.enabled = True
+        self.path = path
+        for owner in owners:
+            self.instrument(owner)
+
+    def disable(self):
+        self.enabled = False
+
+    def instrument(self, owner):
+        """
+        װжĹз̬ __init__
+        :param owner:  LazyClass 
+        """
+        owner = resolve(owner)
+        for name, value in list(owner.__dict__.items()):
+            if name.startswith('_') and name != '__init__':
+                continue
+            is_static = isinstance(value, staticmethod)
+            func = value.__func__ if is_static else value
+            if not isinstance(func, types.FunctionType) or getattr(func, '_profiled', False):
+                continue
+            wrapper = self.wrap(func, owner.__name__ + ('' if name == '__init__' else '.' + name))
+            setattr(owner, name, staticmethod(wrapper) if is_static else wrapper)
+
+    def wrap(self, func, label):
+        """
+        װʱ¼ôʱ
+        :param func: 
+        :param label: е
+        """
+        profiler = self
+
+        def wrapper(*args, **kwargs):
+            if profiler._phase is None:
+                return func(*args, **kwargs)
+            start = time.time()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record = profiler.phases[profiler._phase]['builders'].setdefault(label, [0, 0.0])
+                record[0] += 1
+                record[1] += time.time() - start
+
+        wrapper.__name__ = func.__name__
+        wrapper.__doc__ = func.__doc__
+        wrapper._profiled = True
+        return wrapper
+
+    def _trace(self, frame, event, arg):
+        if event != 'c_call' or self._phase is None:
+            return
+        name, kernel = _call_name(arg)
+        calls = self.phases[self._phase]['kernel' if kernel else 'python']
+        calls[name] = calls.get(name, 0) + 1
+
+    def start(self, model):
+        """
+        ʼһģ
+        :param model: ģ
+        """
+        if not self.enabled:
+            return
+        self.model = model
+        self.phases = OrderedDict()
+        self._phase = None
+        self._begin = time.time()
+        sys.setprofile(self._trace)
+
+    def mark(self, phase):
+        """
+        ǰ׶βʼ½׶
+        :param phase: ׶
+        """
+        if not self.enabled or self.model is None:
+            return
+        self._close()
+        self.phases.setdefault(phase, {'wall': 0.0, 'kernel': {}, 'python': {}, 'builders': {}})
+        self._start = time.time()
+        self._phase = phase
+
+    def _close(self):
+        if self._phase is not None:
+            self.phases[self._phase]['wall'] += time.time() - self._start
+            self._phase = None
+
+    def stop(self):
+        """
+        д
+        :return:  dictδʱΪ None
+        """
+        if not self.enabled or self.model is None:
+            return None
+        self._close()
+        sys.setprofile(None)
+        report = self.report()
+        self.save(report)
+        self.model = None
+        return report
+
+    def report(self):
+        """
+        ܱ
+        :return: dict(model, wall, phases=[dict(name, wall, kernel_calls, python_calls, kernel, builders)])
+        """
+        phases = []
+        for name, phase in self.phases.items():
+            phases.append({'name': name,
+                           'wall': phase['wall'],
+                           'kernel_calls': sum(phase['kernel'].values()),
+                           'python_calls': sum(phase['python'].values()),
+                           'kernel': phase['kernel'],
+                           'builders': dict((label, {'count': count, 'wall': wall})
+                                            for label, (count, wall) in phase['builders'].items())})
+        return {'model': self.model, 'wall': time.time() - self._begin, 'phases': phases}
+
+    def save(self, report):
+        """
+        д Profile-<ģ>.json׶ں API ϸ .csv׶λܣ
+        """
+        path = self.path or os.getcwd()
+        name = os.path.join(path, 'Profile-' + report['model'])
+        with open(name + '.json', 'w') as file:
+            json.dump(report, file, indent=1, sort_keys=True)
+        with open(name + '.csv', 'w') as file:
+            writer = csv.writer(file, lineterminator='\n')
+            writer.writerow(['phase', 'wall', 'kernel_calls', 'python_calls', 'top_kernel'])
+            for phase in report['phases']:
+                top = sorted(phase['kernel'].items(), key=lambda item: -item[1])[:3]
+                writer.writerow([phase['name'], '%.4f' % phase['wall'], phase['kernel_calls'],
+                                 phase['python_calls'], ' '.join('%s:%d' % item for item in top)])
+
+        print('Python: ģʱ ' + report['model'] + '  %.2f s' % report['wall'])
+        for phase in sorted(report['phases'], key=lambda item: -item['wall'])[:5]:
+            print('Python:   %-12s %8.3f s  ں˵ %d' % (phase['name'], phase['wall'], phase['kernel_calls']))
+
+
+# ȫַ
+profiler = Profiler()
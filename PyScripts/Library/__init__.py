@@ -1,2 +1,4 @@
 from MaterialsLib import *
 from PartsLib import *
+from JobsLib import *
+from ToolsLib import *
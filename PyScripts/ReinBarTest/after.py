@@ -1,33 +1,41 @@
 # coding=cp936
 import csv
 import numpy as np
-from base import work_path, data_path
+import base
 from odbAccess import openOdb
+from Library import extract_fields
 
-# ·
-odb_name = 'job-1.odb'
-path = work_path + '/' + odb_name
 
-# odb
-odb = openOdb(path)
-node = odb.rootAssembly.instances['REINBAR-1'].nodeSets['LEFT']
+def get_smax_emax(context=None, odb_name='job-1.odb', csv_name='ReinBar_SMAX_EMAX.csv'):
+    """
+    ȡֽӦӦ䣬д <Ŀ¼>/<csv_name>
+    :param context:  RunContextĬ base.context
+    :param odb_name: <Ŀ¼> µ odb ļ
+    :param csv_name:  csv ļ
+    :return: (s_max, e_max)
+    """
+    if context is None:
+        context = base.context
 
-# ӦӦ
-s_max = np.array([])
-e_max = np.array([])
+    # odb֡ȡӦӦ
+    odb = openOdb(context.work(odb_name), readOnly=True)
+    try:
+        node = odb.rootAssembly.instances['REINBAR-1'].nodeSets['LEFT']
+        fields = extract_fields(odb, ('S', 'E'), region=node, invariants=('maxPrincipal',))[1]
+    finally:
+        odb.close()
 
-# ȡ
-for step in odb.steps.values():
-    for frame in step.frames:
-        s_out = frame.fieldOutputs['S']
-        e_out = frame.fieldOutputs['E']
+    # ӦӦ
+    s_max = fields['S.maxPrincipal'].values[:, 0]
+    e_max = fields['E.maxPrincipal'].values[:, 0]
 
-        s_max = np.append(s_max, s_out.getSubset(region=node).values[0].maxPrincipal)
-        e_max = np.append(e_max, e_out.getSubset(region=node).values[0].maxPrincipal)
+    #  csv
+    with open(context.data(csv_name), mode='w') as file:
+        writer = csv.writer(file, lineterminator='\n')
+        writer.writerow(['SMAX', 'EMAX'])
+        writer.writerows(np.column_stack([s_max, e_max]))
+    return s_max, e_max
 
-#  csv
-csv_name = 'ReinBar_SMAX_EMAX.csv'
-with open(data_path + '/' + csv_name, mode='w') as file:
-    writer = csv.writer(file, lineterminator='\n')
-    writer.writerow(['SMAX', 'EMAX'])
-    writer.writerows(np.column_stack([s_max, e_max]))
+
+if __name__ == '__main__':
+    get_smax_emax(base.context)
@@ -4,7 +4,7 @@ from abaqus import *
 from abaqusConstants import *
 from caeModules import *
 
-# Ŀģ飨ͳһ·
+# Ŀģ飨ģͳһ·
 from base import *
 
 # ģ SI(mm)
@@ -85,10 +85,10 @@ t3d2 = mesh.ElemType(elemCode=T3D2, elemLibrary=STANDARD)
 part.setElementType(regions=regionToolset.Region(edges=part.edges), elemTypes=(t3d2,))
 part.generateMesh()
 
-# ύҵ
-job = mdb.Job(name='Job-1', model=model)
-job.submit(consistencyChecking=OFF)
+# ύҵ棨ҵļ cae дĿ¼
+with context:
+    job = mdb.Job(name='Job-1', model=model)
+    job.submit(consistencyChecking=OFF)
 
-# 
-mdb.saveAs('ReinBarTest.cae')
-mdb.close()
+    mdb.saveAs('ReinBarTest.cae')
+    mdb.close()
@@ -1,56 +1,63 @@
 # coding=cp936
-import csv
-import numpy as np
-from base import data_path, work_path
+import os
+import sys
+import base
 from odbAccess import openOdb
+from Library import extract_history, history_rule, HistoryTable, PostPool, OdbCache
 
 
-def get_urf_data(odb, csv_path='', pad0_name='PADL', pad1_name='PADR', beam_name='BEAM1'):
-    rf0 = None
-    rf1 = None
-    u3 = None
-    for step in odb.steps.values():
-        for hr in step.historyRegions.keys():
-            data = step.historyRegions[hr].historyOutputs.values()[0].data
-            data = np.array(data)
-            if pad0_name in hr:
-                if rf0 is not None:
-                    rf0 = np.concatenate((rf0, data))
-                else:
-                    rf0 = data
-            if pad1_name in hr:
-                if rf1 is not None:
-                    rf1 = np.concatenate((rf1, data))
-                else:
-                    rf1 = data
-            if beam_name in hr:
-                if u3 is not None:
-                    u3 = np.concatenate((u3, data))
-                else:
-                    u3 = data
-    rf = rf0 + rf1
-    if csv_path != '':
-        with open(csv_path, mode='w') as file:
-            writer = csv.writer(file, lineterminator='\n')
-            writer.writerow(['U', 'RF'])
-            u3 = -u3[:, 1]
-            rf = rf[:, 1]
-            writer.writerows(np.column_stack([u3, rf]))
+def urf_rules(pad0_name='PADL', pad1_name='PADR', beam_name='BEAM1', symmetry=0):
+    """
+    -ӶӶ UU3 ȡ֧֮ RF
+    :param symmetry: ģͶԳģʽͬ before.mainԳģͷ 2 ** symmetry ԭΪȫģ
+    """
+    return (history_rule('U', ('U3',), (beam_name,), op='first', scale=-1),
+            history_rule('RF', ('RF3',), (pad0_name, pad1_name), scale=2 ** symmetry))
+
 
+def get_urf_data(odb, csv_path='', pad0_name='PADL', pad1_name='PADR', beam_name='BEAM1', symmetry=0):
+    """
+    ȡӶ֧
+    :param odb: ODB 󣬻ȡ HistoryTable OdbCache.history ֵ
+    :param symmetry: ģͶԳģʽͬ before.mainԳģͷ 2 ** symmetry ԭΪȫģ
+    :return: (u3, rf)
+    """
+    table = odb if isinstance(odb, HistoryTable) else extract_history(odb)
+    u3, rf = table.derive(urf_rules(pad0_name, pad1_name, beam_name, symmetry))
+    if csv_path != '':
+        table.to_csv(csv_path, ['U', 'RF'])
     return u3, rf
 
 
+def extract_urf(job_name, context=None, cache=None, **kwargs):
+    """
+     <Ŀ¼>/<ҵ>.odb ȡ U-RFд <Ŀ¼>/<ģ>_URF.csv
+    :param job_name: ҵ Job-<ģ>
+    :param context:  RunContextĬ base.context
+    :param cache: OdbCacheODB δʱضʱֻ
+    :param kwargs:  get_urf_data symmetry
+    :return: (u3, rf)
+    """
+    if context is None:
+        context = base.context
+    odb_path = context.work(job_name + '.odb')
+    csv_path = context.data(job_name[4:] + '_URF.csv')
+    if cache is not None:
+        return get_urf_data(cache.history(odb_path), csv_path, **kwargs)
+    odb = openOdb(odb_path, readOnly=True)
+    try:
+        return get_urf_data(odb, csv_path, **kwargs)
+    finally:
+        odb.close()
+
+
 if __name__ == '__main__':
-    path0 = work_path + '/' + 'Job-SimplyBeam0.odb'
-    path1 = work_path + '/' + 'Job-SimplyBeam1.odb'
-    path2 = work_path + '/' + 'Job-SimplyBeam2.odb'
-
-    odb0 = openOdb(path0)
-    odb1 = openOdb(path1)
-    odb2 = openOdb(path2)
-    get_urf_data(odb0, csv_path=data_path + '/' + 'SimplyBeam0_URF.csv')
-    get_urf_data(odb1, csv_path=data_path + '/' + 'SimplyBeam1_URF.csv')
-    get_urf_data(odb2, csv_path=data_path + '/' + 'SimplyBeam2_URF.csv')
-    odb0.close()
-    odb1.close()
-    odb2.close()
+    #  abaqus python after.py [ҵ ...] У ODB ڶȡҵʱȡּطʽΪ URF.csv
+    # ȡڻĿ¼еҵҲȡڼ䷴
+    jobs = sys.argv[1:] or ['Job-SimplyBeam0', 'Job-SimplyBeam1', 'Job-SimplyBeam2']
+    cache = OdbCache(os.path.join(base.context.cache_path, 'Odb'))
+    pool = PostPool(extract_urf, base.context, timeout=600.0, running=True, cache=cache)
+    results = pool.run(jobs)
+    if not sys.argv[1:]:
+        pool.save(base.context.data('URF.csv'), ['U', 'RF'])
+    sys.exit(0 if all(result['status'] == 'done' for result in results.values()) else 1)
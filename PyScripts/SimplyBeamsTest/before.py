@@ -1,4 +1,5 @@
 # coding=cp936
+import os
 import math
 import regionToolset
 from abaqus import *
@@ -6,6 +7,10 @@ from abaqusConstants import *
 from caeModules import mesh
 from Library import *
 from base import *
+import base
+
+# CDP ϱ̻棬ỰãժҪȡĹã
+cdp_cache.path = context.cache_path
 
 
 # ģ
@@ -15,6 +20,7 @@ def main(model_name='Model-SimplyBeam',
          beam_length=5000.0,
          beam_width=300.0,
          beam_height=500.0,
+         beam_orphan=False,
          # 
          ax=25.0,
          ay=25.0,
@@ -25,6 +31,8 @@ def main(model_name='Model-SimplyBeam',
          pad_height=50.0,
          # ֽ
          rm_name='ReinMesh',
+         rm_orphan=False,
+         rm_embed='auto',
          # 
          r0_num=2,
          r0_d=12.0,
@@ -50,12 +58,26 @@ def main(model_name='Model-SimplyBeam',
          # 
          load_mode=2,
          load_force=70000.0,
+         # Գ
+         symmetry=0,
          # 
          beam_mesh_size=50,
          pad_mesh_size=25,
          rein_mesh_size=50,
+         # 
+         output_budget=None,
+         midspan_band=1000.0,
+         # 
+         step_controls=None,
+         # 
+         restart_interval=0,
          # ҵ
-         num_cpu=4
+         num_cpu=4,
+         submit=True,
+         # ʱ
+         profile=False,
+         # 
+         context=None
          ):
     """
      ֧ģͽģ
@@ -66,6 +88,7 @@ def main(model_name='Model-SimplyBeam',
     :param beam_length: 
     :param beam_width: 
     :param beam_height: 
+    :param beam_orphan: Ƿֱɽṹ񣨲ηָ񻮷֣
 
     :param ax: x 򱣻
     :param ay: y 򱣻
@@ -76,6 +99,10 @@ def main(model_name='Model-SimplyBeam',
     :param pad_height: 
 
     :param rm_name: ֽ
+    :param rm_orphan: ֽǷֱɹ񣨲βϲԳģΪ
+    :param rm_embed: ֽǶ뷽ʽ ( 'region' EmbeddedRegion ݲԪ
+                     'equation' Ԥȶλдʽ *Equation beam_orphan  rm_orphan
+                     'auto' ߾Ϊʱȡ 'equation' )нڵ޷λʱ˻ 'region'
     :param r0_num: 
     :param r0_d: ֱ
     :param r0_material: 
@@ -99,333 +126,546 @@ def main(model_name='Model-SimplyBeam',
     :param load_mode: ģʽ ( 0 أ1 мأ2 ֵ )
     :param load_force: С kN
 
+    :param symmetry: Գģʽ ( 0 ȫģͣ1 ģ x>=02 ķ֮һģ x>=0y>=0 )
+                     ֻԳƲֲʩӶԳƱ߽磬ذȫģȡֵԶۼȡʱ 2 ** symmetry
+
     :param beam_mesh_size: 
     :param pad_mesh_size: 
     :param rein_mesh_size: ֽ
 
-    :param num_cpu: ҵcpu߳
-    :return:
+    :param output_budget: Ԥ OutputBudgetΪ None ʱȫģÿ ESUDAMAGECDAMAGET
+                          ȫģֻ֡ӦӦ䡢ֻڿж "Midspan" ֽ "Rein" 
+                          ڴҵǰ ODB С
+    :param midspan_band: ж "Midspan" Ŀ
+
+    :param step_controls:  {: dict(initialInc, maxInc, minInc, maxNumInc, discontinuous)}
+                           StepTuner.propose ģ .sta ֵĬ
+
+    :param restart_interval: д0 ΪдֻһΣ restart_inp 
+
+    :param num_cpu: ҵcpu߳ύʱʹãɵѡȡ
+    :param submit: ǷύҵΪ False ʱֻҵɨ writeInput
+
+    :param profile: Ƿ¼׶κʱں API ôд Data/Profile-<ģ>.json/.csv
+
+    :param context:  RunContextĬ base.contextύʱ乤Ŀ¼ύ
+    :return: ҵ
     """
-    # region ģ
-    if model_name in mdb.models.keys():
-        model = mdb.models[model_name]
-    else:
-        model = mdb.Model(name=model_name)
-
-    a = model.rootAssembly
-    # endregion
-
-    # region 
-    ConcreteAb(model_name, concrete_name, fcr, ftr).create()
-    Steel(model_name, r0_material, *r0_args).create()
-    Steel(model_name, r1_material, *r1_args).create()
-    Steel(model_name, r2_material, *r2_args).create()
-    Steel(model_name, rigid_steel_name, *rigid_steel_args).create()
-    # endregion
-
-    # 
-    def cal_area(d):
-        return (d / 2) ** 2 * math.pi
-
-    class Sec:
-        r0 = model.TrussSection(name='TrD%d' % r0_d + r0_material,
-                                material=r0_material,
-                                area=cal_area(r0_d)
-                                ).name
-
-        r1 = model.TrussSection(name='TrD%d' % r1_d + r1_material,
-                                material=r1_material,
-                                area=cal_area(r1_d)
-                                ).name
-
-        r2 = model.TrussSection(name='TrD%d' % r2_d + r2_material,
-                                material=r2_material,
-                                area=cal_area(r2_d)
-                                ).name
-
-        concrete = model.HomogeneousSolidSection(name='Hm' + concrete_name,
-                                                 material=concrete_name,
-                                                 thickness=None
-                                                 ).name
-
-        rigid = model.HomogeneousSolidSection(name='Hm' + rigid_steel_name,
-                                              material=rigid_steel_name,
-                                              thickness=None
-                                              ).name
-
-    # 
-    class P:
-        # ֽ
-        rm = Lines.create_beam_mesh(model_name,
-                                    name=rm_name,
-                                    length=beam_length - ax * 2,
-                                    width=beam_width - ay * 2,
-                                    height=beam_height - az * 2,
-                                    num_top=r0_num,
-                                    num_bottom=r1_num,
-                                    spacing_stirrup=r2_spacing,
-                                    section_name_top=Sec.r0,
-                                    section_name_bottom=Sec.r1,
-                                    section_name_stirrup=Sec.r2)
-
-        # 
-        beam = SimplyBeam(model_name,
-                          name=beam_name,
-                          length=beam_length,
-                          width=beam_width,
-                          height=beam_height,
-                          section_name=Sec.concrete,
-                          pad_width=pad_width,
-                          load_mode=load_mode).part
-
-        # 
-        pad = Cube(model_name,
-                   name=pad_name,
-                   length=pad_width,
-                   width=beam_width,
-                   height=pad_height,
-                   section_name=Sec.rigid,
-                   need_surf_top=True,
-                   need_surf_bottom=True,
-                   need_repoint=True).part
-
-    # region ʵ
-    beam = a.Instance(name=P.beam.name + '1', part=P.beam, dependent=ON)
-    rm = a.Instance(name=P.rm.name + '1', part=P.rm, dependent=ON)
-    pad0 = a.Instance(name=P.pad.name + 'L', part=P.pad, dependent=ON)
-    pad1 = a.Instance(name=P.pad.name + 'R', part=P.pad, dependent=ON)
-
-    if load_mode == 1:
-        pad_t0 = a.Instance(name=P.pad.name + 'T', part=P.pad, dependent=ON)
-        pad_t1 = None
-    elif load_mode == 2:
-        pad_t0 = a.Instance(name=P.pad.name + 'TL', part=P.pad, dependent=ON)
-        pad_t1 = a.Instance(name=P.pad.name + 'TR', part=P.pad, dependent=ON)
-    else:
-        pad_t0 = None
-        pad_t1 = None
-    # endregion
-
-    # region ʵλñ任
-    rm.translate(vector=(0, 0, az))
-    pad0.translate(vector=(beam_length / 2 - pad_width / 2, 0, -pad_height))
-    pad1.translate(vector=(-beam_length / 2 + pad_width / 2, 0, -pad_height))
-
-    y_rotate180 = ((0, 0, 0), (0, 1, 0), 180)
-    if load_mode == 1:
-        pad_t0.rotateAboutAxis(*y_rotate180)
-        pad_t0.translate(vector=(0, 0, beam_height + pad_height))
-    if load_mode == 2:
-        pad_t0.rotateAboutAxis(*y_rotate180)
-        pad_t0.translate(vector=(beam_length / 6, 0, beam_height + pad_height))
-        pad_t1.rotateAboutAxis(*y_rotate180)
-        pad_t1.translate(vector=(-beam_length / 6, 0, beam_height + pad_height))
-
-    # endregion
-
-    # 
-    class St:
-        rp0 = a.Set(name='RpL', referencePoints=(pad0.referencePoints.values()[0],))
-        rp1 = a.Set(name='RpR', referencePoints=(pad1.referencePoints.values()[0],))
-        if load_mode == 1:
-            rp_t0 = a.Set(name='RpT', referencePoints=(pad_t0.referencePoints.values()[0],))
-            rp_t1 = None
-        elif load_mode == 2:
-            rp_t0 = a.Set(name='RpTL', referencePoints=(pad_t0.referencePoints.values()[0],))
-            rp_t1 = a.Set(name='RpTR', referencePoints=(pad_t1.referencePoints.values()[0],))
+    if context is None:
+        context = base.context
+    if profile:
+        profiler.enable((Lines, Cube, SimplyBeam, SimplyBeamMesh, ConcreteAb, Steel), path=context.data_path)
+    profiler.start(model_name)
+    try:
+        # Գģֽͣ NumPy У뷴 scale ۼ
+        scale = 2 ** symmetry
+        rm_orphan = rm_orphan or symmetry > 0
+
+        # region ģ
+        profiler.mark('model')
+        if model_name in mdb.models.keys():
+            model = mdb.models[model_name]
         else:
-            rp_t0 = None
-            rp_t1 = None
+            model = mdb.Model(name=model_name)
+
+        a = model.rootAssembly
+        # endregion
+
+        # region 
+        profiler.mark('materials')
+        ConcreteAb(model_name, concrete_name, fcr, ftr).create()
+        Steel(model_name, r0_material, *r0_args).create()
+        Steel(model_name, r1_material, *r1_args).create()
+        Steel(model_name, r2_material, *r2_args).create()
+        Steel(model_name, rigid_steel_name, *rigid_steel_args).create()
+        # endregion
+
+        # 
+        profiler.mark('sections')
+        def cal_area(d):
+            return (d / 2) ** 2 * math.pi
+
+        class Sec:
+            r0 = model.TrussSection(name='TrD%d' % r0_d + r0_material,
+                                    material=r0_material,
+                                    area=cal_area(r0_d)
+                                    ).name
+
+            r1 = model.TrussSection(name='TrD%d' % r1_d + r1_material,
+                                    material=r1_material,
+                                    area=cal_area(r1_d)
+                                    ).name
+
+            r2 = model.TrussSection(name='TrD%d' % r2_d + r2_material,
+                                    material=r2_material,
+                                    area=cal_area(r2_d)
+                                    ).name
+
+            concrete = model.HomogeneousSolidSection(name='Hm' + concrete_name,
+                                                     material=concrete_name,
+                                                     thickness=None
+                                                     ).name
+
+            rigid = model.HomogeneousSolidSection(name='Hm' + rigid_steel_name,
+                                                  material=rigid_steel_name,
+                                                  thickness=None
+                                                  ).name
+
+        # Գϵĸֽ
+        if symmetry:
+            for name, d, material in ((Sec.r0, r0_d, r0_material),
+                                      (Sec.r1, r1_d, r1_material),
+                                      (Sec.r2, r2_d, r2_material)):
+                model.TrussSection(name=name + 'Half', material=material, area=cal_area(d) / 2)
+
+        # 
+        profiler.mark('parts')
+        class P:
+            # ֽ
+            rm_args = dict(name=rm_name,
+                           length=beam_length - ax * 2,
+                           width=beam_width - ay * 2,
+                           height=beam_height - az * 2,
+                           num_top=r0_num,
+                           num_bottom=r1_num,
+                           spacing_stirrup=r2_spacing,
+                           section_name_top=Sec.r0,
+                           section_name_bottom=Sec.r1,
+                           section_name_stirrup=Sec.r2)
+            if rm_orphan:
+                rm = Lines.create_beam_cage(model_name, symmetry=symmetry, **rm_args)
+            else:
+                rm = Lines.create_beam_mesh(model_name, **rm_args)
+
+            # 
+            if beam_orphan:
+                beam = SimplyBeamMesh(model_name,
+                                      name=beam_name,
+                                      length=beam_length,
+                                      width=beam_width,
+                                      height=beam_height,
+                                      section_name=Sec.concrete,
+                                      pad_width=pad_width,
+                                      load_mode=load_mode,
+                                      mesh_size=beam_mesh_size,
+                                      symmetry=symmetry).part
+            else:
+                beam = SimplyBeam(model_name,
+                                  name=beam_name,
+                                  length=beam_length,
+                                  width=beam_width,
+                                  height=beam_height,
+                                  section_name=Sec.concrete,
+                                  pad_width=pad_width,
+                                  load_mode=load_mode,
+                                  mesh_size=beam_mesh_size,
+                                  symmetry=symmetry).part
+
+            # 飨ķ֮һģ y=0 У
+            pad = Cube(model_name,
+                       name=pad_name,
+                       length=pad_width,
+                       width=beam_width,
+                       height=pad_height,
+                       section_name=Sec.rigid,
+                       need_surf_top=True,
+                       need_surf_bottom=True,
+                       need_repoint=True,
+                       mesh_size=pad_mesh_size,
+                       half_y=int(symmetry == 2)).part
+
+            # мصڶԳģ x=0 У y ᷭתλ x>=0
+            if load_mode == 1 and symmetry:
+                pad_t = Cube(model_name,
+                             name=pad_name + 'T',
+                             length=pad_width,
+                             width=beam_width,
+                             height=pad_height,
+                             section_name=Sec.rigid,
+                             need_surf_top=True,
+                             need_surf_bottom=True,
+                             need_repoint=True,
+                             mesh_size=pad_mesh_size,
+                             half_x=-1,
+                             half_y=int(symmetry == 2)).part
+            else:
+                pad_t = pad
+
+        # region ʵ
+        profiler.mark('instances')
+        beam = a.Instance(name=P.beam.name + '1', part=P.beam, dependent=ON)
+        rm = a.Instance(name=P.rm.name + '1', part=P.rm, dependent=ON)
+        pad0 = a.Instance(name=P.pad.name + 'L', part=P.pad, dependent=ON)
+        pad1 = a.Instance(name=P.pad.name + 'R', part=P.pad, dependent=ON) if symmetry == 0 else None
 
-    # 
-    class Sf:
-        bc_pads = a.Surface(name='BCPads',
-                            side1Faces=pad0.surfaces['Top'].faces + pad1.surfaces['Top'].faces)
         if load_mode == 1:
-            load_pads = a.Surface(name='LoadPad',
-                                  side1Faces=pad_t0.surfaces['Top'].faces)
+            pad_t0 = a.Instance(name=P.pad.name + 'T', part=P.pad_t, dependent=ON)
+            pad_t1 = None
         elif load_mode == 2:
-            load_pads = a.Surface(name='LoadPads',
-                                  side1Faces=pad_t0.surfaces['Top'].faces + pad_t1.surfaces['Top'].faces)
+            pad_t0 = a.Instance(name=P.pad.name + 'TL', part=P.pad, dependent=ON)
+            pad_t1 = a.Instance(name=P.pad.name + 'TR', part=P.pad, dependent=ON) if symmetry == 0 else None
         else:
-            load_pads = None
-
-    # region 
-    step0 = model.steps.keys()[0]
-    step1 = model.StaticStep(name='Step-1',
-                             previous=step0,
-                             initialInc=0.01,
-                             minInc=1e-6,
-                             maxInc=0.2,
-                             maxNumInc=10000,
-                             timePeriod=0.2).name
-
-    step2 = model.StaticStep(name='Step-2',
-                             previous=step1,
-                             initialInc=0.01,
-                             minInc=1e-6,
-                             maxInc=1,
-                             maxNumInc=10000,
-                             timePeriod=1).name
-    # endregion
-
-    # region ú
-    model.Gravity(name='Load-G',
-                  createStepName=step1,
-                  comp3=-9810)
-
-    if load_mode == 0:
-        model.Pressure(name='Load-P',
-                       createStepName=step2,
-                       region=beam.surfaces['ToLoad'],
-                       distributionType=TOTAL_FORCE,
-                       magnitude=load_force)
-    if load_mode == 1:
-        model.ConcentratedForce(name='Load-CF',
-                                createStepName=step2,
-                                region=St.rp_t0,
-                                cf3=load_force)
-    if load_mode == 2:
-        model.ConcentratedForce(name='Load-CF',
-                                createStepName=step2,
-                                region=regionToolset.Region(referencePoints=
-                                                            St.rp_t0.referencePoints + St.rp_t1.referencePoints),
-                                cf3=load_force)
-    # endregion
-
-    # region ߽
-    model.DisplacementBC(name='BC-R',
-                         createStepName=step0,
-                         region=St.rp1,
-                         u1=UNSET, u2=SET, u3=SET,
-                         ur1=SET, ur2=UNSET, ur3=SET)
-
-    model.DisplacementBC(name='BC-L',
-                         createStepName=step0,
-                         region=St.rp0,
-                         u1=SET, u2=SET, u3=SET,
-                         ur1=SET, ur2=UNSET, ur3=SET)
-    # endregion
-
-    # region 
-    model.FieldOutputRequest(name='F-Output-1',
-                             createStepName=step1,
-                             variables=('E', 'S', 'U', 'DAMAGEC', 'DAMAGET'))
-
-    model.HistoryOutputRequest(name='H-Output-1',
-                               createStepName=step1,
-                               variables=('U3',),
-                               region=beam.sets['MidPoint'])
-
-    model.HistoryOutputRequest(name='H-Output-2',
-                               createStepName=step1,
-                               variables=('RF3',),
-                               region=St.rp0)
-
-    model.HistoryOutputRequest(name='H-Output-3',
-                               createStepName=step1,
-                               variables=('RF3',),
-                               region=St.rp1)
-    # endregion
-
-    # region Լ
-    model.Coupling(name='Cg-RpR',
-                   controlPoint=St.rp1,
-                   surface=pad1.surfaces['Bottom'],
-                   influenceRadius=WHOLE_SURFACE,
-                   couplingType=KINEMATIC)
-
-    model.Coupling(name='Cg-RpL',
-                   controlPoint=St.rp0,
-                   surface=pad0.surfaces['Bottom'],
-                   influenceRadius=WHOLE_SURFACE,
-                   couplingType=KINEMATIC)
-
-    if load_mode == 1:
-        model.Coupling(name='Cg-RpT',
-                       controlPoint=St.rp_t0,
-                       surface=pad_t0.surfaces['Bottom'],
-                       influenceRadius=WHOLE_SURFACE,
-                       couplingType=KINEMATIC)
-
-    if load_mode == 2:
-        model.Coupling(name='Cg-RpTL',
-                       controlPoint=St.rp_t0,
-                       surface=pad_t0.surfaces['Bottom'],
-                       influenceRadius=WHOLE_SURFACE,
-                       couplingType=KINEMATIC)
-
-        model.Coupling(name='Cg-RpTR',
-                       controlPoint=St.rp_t1,
-                       surface=pad_t1.surfaces['Bottom'],
+            pad_t0 = None
+            pad_t1 = None
+        # endregion
+
+        # region ʵλñ任
+        profiler.mark('transforms')
+        rm.translate(vector=(0, 0, az))
+        pad0.translate(vector=(beam_length / 2 - pad_width / 2, 0, -pad_height))
+        if pad1 is not None:
+            pad1.translate(vector=(-beam_length / 2 + pad_width / 2, 0, -pad_height))
+
+        y_rotate180 = ((0, 0, 0), (0, 1, 0), 180)
+        if load_mode == 1:
+            pad_t0.rotateAboutAxis(*y_rotate180)
+            pad_t0.translate(vector=(0, 0, beam_height + pad_height))
+        if load_mode == 2:
+            pad_t0.rotateAboutAxis(*y_rotate180)
+            pad_t0.translate(vector=(beam_length / 6, 0, beam_height + pad_height))
+            if pad_t1 is not None:
+                pad_t1.rotateAboutAxis(*y_rotate180)
+                pad_t1.translate(vector=(-beam_length / 6, 0, beam_height + pad_height))
+
+        # endregion
+
+        # 
+        profiler.mark('sets')
+        class St:
+            rp0 = a.Set(name='RpL', referencePoints=(pad0.referencePoints.values()[0],))
+            if pad1 is not None:
+                rp1 = a.Set(name='RpR', referencePoints=(pad1.referencePoints.values()[0],))
+            else:
+                rp1 = None
+            if load_mode == 1:
+                rp_t0 = a.Set(name='RpT', referencePoints=(pad_t0.referencePoints.values()[0],))
+                rp_t1 = None
+            elif load_mode == 2:
+                rp_t0 = a.Set(name='RpTL', referencePoints=(pad_t0.referencePoints.values()[0],))
+                if pad_t1 is not None:
+                    rp_t1 = a.Set(name='RpTR', referencePoints=(pad_t1.referencePoints.values()[0],))
+                else:
+                    rp_t1 = None
+            else:
+                rp_t0 = None
+                rp_t1 = None
+
+        # 
+        profiler.mark('surfaces')
+        class Sf:
+            faces = pad0.surfaces['Top'].faces
+            if pad1 is not None:
+                faces += pad1.surfaces['Top'].faces
+            bc_pads = a.Surface(name='BCPads', side1Faces=faces)
+            if load_mode == 1:
+                load_pads = a.Surface(name='LoadPad',
+                                      side1Faces=pad_t0.surfaces['Top'].faces)
+            elif load_mode == 2:
+                faces = pad_t0.surfaces['Top'].faces
+                if pad_t1 is not None:
+                    faces += pad_t1.surfaces['Top'].faces
+                load_pads = a.Surface(name='LoadPads', side1Faces=faces)
+            else:
+                load_pads = None
+
+        # region 
+        profiler.mark('steps')
+        step0 = model.steps.keys()[0]
+        step1 = model.StaticStep(name='Step-1',
+                                 previous=step0,
+                                 initialInc=0.01,
+                                 minInc=1e-6,
+                                 maxInc=0.2,
+                                 maxNumInc=10000,
+                                 timePeriod=0.2).name
+
+        step2 = model.StaticStep(name='Step-2',
+                                 previous=step1,
+                                 initialInc=0.01,
+                                 minInc=1e-6,
+                                 maxInc=1,
+                                 maxNumInc=10000,
+                                 timePeriod=1).name
+
+        if step_controls:
+            for number, step in enumerate((step1, step2), 1):
+                control = step_controls.get(number) or step_controls.get(str(number))
+                if not control:
+                    continue
+                model.steps[step].setValues(**step_values(control))
+                if control.get('discontinuous'):
+                    model.steps[step].control.setValues(allowPropagation=OFF, resetDefaultValues=OFF,
+                                                        discontinuous=ON)
+
+        if restart_interval > 0:
+            for step in (step1, step2):
+                model.steps[step].Restart(frequency=restart_interval, numberIntervals=0, overlay=ON, timeMarks=OFF)
+        # endregion
+
+        # region ú
+        profiler.mark('loads')
+        model.Gravity(name='Load-G',
+                      createStepName=step1,
+                      comp3=-9810)
+
+        if load_mode == 0:
+            model.Pressure(name='Load-P',
+                           createStepName=step2,
+                           region=beam.surfaces['ToLoad'],
+                           distributionType=TOTAL_FORCE,
+                           magnitude=load_force / scale)
+        if load_mode == 1:
+            model.ConcentratedForce(name='Load-CF',
+                                    createStepName=step2,
+                                    region=St.rp_t0,
+                                    cf3=load_force / scale)
+        if load_mode == 2:
+            # ȫģ load_forceԳģֻһ㣬õе 2 * load_force бۼ
+            if St.rp_t1 is not None:
+                region = regionToolset.Region(referencePoints=St.rp_t0.referencePoints + St.rp_t1.referencePoints)
+                cf3 = load_force / scale
+            else:
+                region = St.rp_t0
+                cf3 = load_force * 2 / scale
+            model.ConcentratedForce(name='Load-CF',
+                                    createStepName=step2,
+                                    region=region,
+                                    cf3=cf3)
+        # endregion
+
+        # region ߽
+        profiler.mark('bcs')
+        if St.rp1 is not None:
+            model.DisplacementBC(name='BC-R',
+                                 createStepName=step0,
+                                 region=St.rp1,
+                                 u1=UNSET, u2=SET, u3=SET,
+                                 ur1=SET, ur2=UNSET, ur3=SET)
+
+        # ԳģпжԳԼ x 򣬱֧Ϊ֧
+        model.DisplacementBC(name='BC-L',
+                             createStepName=step0,
+                             region=St.rp0,
+                             u1=SET if symmetry == 0 else UNSET, u2=SET, u3=SET,
+                             ur1=SET, ur2=UNSET, ur3=SET)
+
+        # Գ
+        if symmetry:
+            for instance in (beam, pad0, pad_t0):
+                if instance is None:
+                    continue
+                if 'SymX' in instance.sets.keys():
+                    model.XsymmBC(name='BC-SymX-' + instance.name, createStepName=step0, region=instance.sets['SymX'])
+                if 'SymY' in instance.sets.keys():
+                    model.YsymmBC(name='BC-SymY-' + instance.name, createStepName=step0, region=instance.sets['SymY'])
+
+            # λڶԳϵļص
+            sym_x = load_mode == 1
+            sym_y = symmetry == 2 and load_mode != 0
+            if sym_x or sym_y:
+                model.DisplacementBC(name='BC-SymRp',
+                                     createStepName=step0,
+                                     region=St.rp_t0,
+                                     u1=SET if sym_x else UNSET, u2=SET if sym_y else UNSET, u3=UNSET,
+                                     ur1=SET if sym_y else UNSET, ur2=SET if sym_x else UNSET, ur3=SET)
+        # endregion
+
+        # region 
+        profiler.mark('outputs')
+        # Ԥʱ񻮷ֺ򴴽
+        if output_budget is None:
+            model.FieldOutputRequest(name='F-Output-1',
+                                     createStepName=step1,
+                                     variables=('E', 'S', 'U', 'DAMAGEC', 'DAMAGET'))
+
+        model.HistoryOutputRequest(name='H-Output-1',
+                                   createStepName=step1,
+                                   variables=('U3',),
+                                   region=beam.sets['MidPoint'])
+
+        model.HistoryOutputRequest(name='H-Output-2',
+                                   createStepName=step1,
+                                   variables=('RF3',),
+                                   region=St.rp0)
+
+        if St.rp1 is not None:
+            model.HistoryOutputRequest(name='H-Output-3',
+                                       createStepName=step1,
+                                       variables=('RF3',),
+                                       region=St.rp1)
+        # endregion
+
+        # region Լ
+        profiler.mark('constraints')
+        if pad1 is not None:
+            model.Coupling(name='Cg-RpR',
+                           controlPoint=St.rp1,
+                           surface=pad1.surfaces['Bottom'],
+                           influenceRadius=WHOLE_SURFACE,
+                           couplingType=KINEMATIC)
+
+        model.Coupling(name='Cg-RpL',
+                       controlPoint=St.rp0,
+                       surface=pad0.surfaces['Bottom'],
                        influenceRadius=WHOLE_SURFACE,
                        couplingType=KINEMATIC)
 
-    model.Tie(name="Tie-BeamPads",
-              main=beam.surfaces['ToPads'],
-              secondary=Sf.bc_pads,
-              positionToleranceMethod=COMPUTED,
-              adjust=ON,
-              tieRotations=ON,
-              thickness=ON)
-
-    if load_mode != 0:
-        model.Tie(name="Tie-BeamPadsT",
-                  main=beam.surfaces['ToLoad'],
-                  secondary=Sf.load_pads,
+        if load_mode == 1:
+            model.Coupling(name='Cg-RpT',
+                           controlPoint=St.rp_t0,
+                           surface=pad_t0.surfaces['Bottom'],
+                           influenceRadius=WHOLE_SURFACE,
+                           couplingType=KINEMATIC)
+
+        if load_mode == 2:
+            model.Coupling(name='Cg-RpTL',
+                           controlPoint=St.rp_t0,
+                           surface=pad_t0.surfaces['Bottom'],
+                           influenceRadius=WHOLE_SURFACE,
+                           couplingType=KINEMATIC)
+
+            if pad_t1 is not None:
+                model.Coupling(name='Cg-RpTR',
+                               controlPoint=St.rp_t1,
+                               surface=pad_t1.surfaces['Bottom'],
+                               influenceRadius=WHOLE_SURFACE,
+                               couplingType=KINEMATIC)
+
+        model.Tie(name="Tie-BeamPads",
+                  main=beam.surfaces['ToPads'],
+                  secondary=Sf.bc_pads,
                   positionToleranceMethod=COMPUTED,
                   adjust=ON,
                   tieRotations=ON,
                   thickness=ON)
 
-    model.EmbeddedRegion(name="Em-ReinMeshBeam",
-                         embeddedRegion=regionToolset.Region(edges=rm.edges),
-                         hostRegion=regionToolset.Region(cells=beam.cells),
-                         weightFactorTolerance=1e-06,
-                         absoluteTolerance=0.0,
-                         fractionalTolerance=0.05,
-                         toleranceMethod=BOTH)
-    # endregion
-
-    # region 
-    t3d2 = mesh.ElemType(elemCode=T3D2, elemLibrary=STANDARD)
-
-    if P.beam.getMeshStats().numMeshedRegions == 0:
-        P.beam.seedPart(size=beam_mesh_size, deviationFactor=0.1, minSizeFactor=0.1)
-        P.beam.generateMesh()
-
-    if P.pad.getMeshStats().numMeshedRegions == 0:
-        P.pad.seedPart(size=pad_mesh_size, deviationFactor=0.1, minSizeFactor=0.1)
-        P.pad.generateMesh()
-
-    if P.rm.getMeshStats().numMeshedRegions == 0:
-        P.rm.seedEdgeByNumber(edges=P.rm.edges, number=1, constraint=FINER)
-        P.rm.setElementType(regions=regionToolset.Region(edges=P.rm.edges), elemTypes=(t3d2,))
-        P.rm.generateMesh()
-    # endregion
-
-    a.regenerate()
-
-    # region ҵ
-    if num_cpu > 1:
-        job = mdb.Job(name='Job-' + model.name,
-                      model=model.name,
-                      numCpus=num_cpu,
-                      numDomains=num_cpu,
-                      multiprocessingMode=THREADS)
-    else:
-        job = mdb.Job(name='Job-' + model.name)
-    job.submit(consistencyChecking=OFF)
-    # endregion
-
+        if load_mode != 0:
+            model.Tie(name="Tie-BeamPadsT",
+                      main=beam.surfaces['ToLoad'],
+                      secondary=Sf.load_pads,
+                      positionToleranceMethod=COMPUTED,
+                      adjust=ON,
+                      tieRotations=ON,
+                      thickness=ON)
+
+        # Ľڵ NumPy ȷֽڵֱжλдʽԼ
+        embed_inp = None
+        if rm_embed == 'auto':
+            rm_embed = 'equation' if beam_orphan and rm_orphan else 'region'
+        if rm_embed == 'equation' and beam_orphan and rm_orphan:
+            points, _ = beam_cage_mesh(P.rm_args['length'], P.rm_args['width'], P.rm_args['height'],
+                                       r0_num, r1_num, r2_spacing, symmetry=symmetry)
+            points[:, 2] += az
+            grid = beam_grid(beam_length, beam_width, beam_height, pad_width, load_mode, beam_mesh_size,
+                             symmetry=symmetry)
+            located = locate_in_grid(points, *grid)
+            labels = range(1, len(points) + 1)
+            if len(located['unplaced']):
+                embed_report(located, labels)
+                print('Python: ֽǶ EmbeddedRegion')
+            else:
+                embed_inp = equation_inp(rm.name, beam.name, labels, located['host_nodes'], located['weights'])
+
+        if embed_inp is None:
+            if rm_orphan:
+                rm_region = regionToolset.Region(elements=rm.elements)
+            else:
+                rm_region = regionToolset.Region(edges=rm.edges)
+            if beam_orphan:
+                beam_region = regionToolset.Region(elements=beam.elements)
+            else:
+                beam_region = regionToolset.Region(cells=beam.cells)
+            model.EmbeddedRegion(name="Em-ReinMeshBeam",
+                                 embeddedRegion=rm_region,
+                                 hostRegion=beam_region,
+                                 weightFactorTolerance=1e-06,
+                                 absoluteTolerance=0.0,
+                                 fractionalTolerance=0.05,
+                                 toleranceMethod=BOTH)
+        # endregion
+
+        # region 
+        profiler.mark('mesh')
+        t3d2 = mesh.ElemType(elemCode=T3D2, elemLibrary=STANDARD)
+
+        if not beam_orphan and P.beam.getMeshStats().numMeshedRegions == 0:
+            P.beam.seedPart(size=beam_mesh_size, deviationFactor=0.1, minSizeFactor=0.1)
+            P.beam.generateMesh()
+
+        for pad in (P.pad, P.pad_t):
+            if pad.getMeshStats().numMeshedRegions == 0:
+                pad.seedPart(size=pad_mesh_size, deviationFactor=0.1, minSizeFactor=0.1)
+                pad.generateMesh()
+
+        if not rm_orphan and P.rm.getMeshStats().numMeshedRegions == 0:
+            P.rm.seedEdgeByNumber(edges=P.rm.edges, number=1, constraint=FINER)
+            P.rm.setElementType(regions=regionToolset.Region(edges=P.rm.edges), elemTypes=(t3d2,))
+            P.rm.generateMesh()
+        # endregion
+
+        profiler.mark('regenerate')
+        a.regenerate()
+
+        # region Ԥ
+        if output_budget is not None:
+            profiler.mark('budget')
+            x = midspan_band / 2
+            regions = {'Midspan': a.Set(name='Midspan', elements=beam.elements.getByBoundingBox(xMin=-x, xMax=x)),
+                       'Rein': rm.sets['All']}
+            output_budget.apply(model, (step1, step2), regions)
+        # endregion
+
+        # region ֽǶԼ
+        if embed_inp is not None:
+            profiler.mark('embed')
+            model.keywordBlock.synchVersions(storeNodesAndElements=False)
+            blocks = model.keywordBlock.sieBlocks
+            end = max(i for i, block in enumerate(blocks) if block.startswith('*End Assembly'))
+            model.keywordBlock.insert(end - 1, embed_inp.rstrip('\n'))
+            print('Python: ֽǶд %d ڵ *Equation' % len(located['elements']))
+        # endregion
+
+        # region ҵ
+        profiler.mark('job')
+        if num_cpu > 1:
+            job = mdb.Job(name='Job-' + model.name,
+                          model=model.name,
+                          numCpus=num_cpu,
+                          numDomains=num_cpu,
+                          multiprocessingMode=THREADS)
+        else:
+            job = mdb.Job(name='Job-' + model.name)
+        if submit:
+            with context:
+                job.submit(consistencyChecking=OFF)
+        # endregion
+    finally:
+        # ģʱͬж sys.setprofile ӣ֮ CAE Ự
+        profiler.stop()
+        if profile:
+            profiler.disable()
+    part_cache.report()
     print('Python: ' + model_name + ' ɡ')
+    return job
 
 
 if __name__ == '__main__':
 
-    main('SimplyBeam0', load_mode=0, load_force=320*1e3)
-    main('SimplyBeam1', load_mode=1, load_force=-180*1e3)
-    main('SimplyBeam2', load_mode=2, load_force=-120*1e3)
-
-    mdb.saveAs(pathName='SimplyBeamsTest.cae')
-    mdb.close()
+    # inpҵļ cae дĿ¼
+    with context:
+        # ֻд inpɵк֤Ŷ⣬ͬʱύռ
+        # ֻÿ 20 ֡ӦӦ䡢ڿжֽ
+        scheduler = Scheduler(tokens=None)
+        budget = OutputBudget(frames=20, limit=2000)
+        jobs = [main('SimplyBeam0', load_mode=0, load_force=320*1e3, output_budget=budget, submit=False),
+                main('SimplyBeam1', load_mode=1, load_force=-180*1e3, output_budget=budget, submit=False),
+                main('SimplyBeam2', load_mode=2, load_force=-120*1e3, output_budget=budget, submit=False)]
+        for job in jobs:
+            job.writeInput(consistencyChecking=OFF)
+            scheduler.add(job.name)
+
+        mdb.saveAs(pathName='SimplyBeamsTest.cae')
+        mdb.close()
+
+        scheduler.report()
+        scheduler.run()
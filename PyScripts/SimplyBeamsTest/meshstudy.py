@@ -0,0 +1,30 @@
+# coding=cp936
+from abaqus import *
+from Library import *
+from base import *
+from before import main
+from after import extract_urf
+
+
+def mesh_sizes(h):
+    """
+    ȡ hȡ h / 2ֽÿһԪ֣ h 仯
+    """
+    return dict(beam_mesh_size=h, pad_mesh_size=h / 2)
+
+
+def extract(job_name):
+    return extract_urf(job_name, context)
+
+
+if __name__ == '__main__':
+
+    # inpҵļдĿ¼
+    with context:
+        study = MeshStudy('MeshSB2', main, extract, mesh_sizes,
+                          start=100.0, ratio=1.5, max_levels=5, tol=0.02,
+                          params=dict(load_mode=2, load_force=-120 * 1e3),
+                          queue=Scheduler(tokens=None),
+                          path=context.data_path)
+        study.run()
+        print('Python: ݲߴ %s' % study.converged_size)
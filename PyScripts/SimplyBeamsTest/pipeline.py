@@ -0,0 +1,223 @@
+"""
+求解 → 监视 → 提取 → 绘图 流水线（Python 3，在 Abaqus 外运行）
+
+* 监视各作业的 .sta、.lck：.sta 出现结束语句且 .lck 已删除即视为结束，某个作业一结束就提取、绘图，
+  与仍在求解的作业重叠进行
+* 求解、提取、绘图各有并发上限；提取以 abaqus python after.py <作业名> 在独立进程中进行
+* --fake 时以 Library/JobsLib/fakesolver.py 代替求解与提取，无需 Abaqus，用于测试；
+  在临时目录中运行（复制已有的 inp），不改动 Result 中的作业文件与数据
+* 不提交作业（--watch）时只监视由 CAE 或其他进程提交的作业
+
+    python pipeline.py --fake Job-SimplyBeam0 Job-SimplyBeam1 Job-SimplyBeam2
+"""
+import os
+import sys
+import time
+import shutil
+import asyncio
+import argparse
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+import base
+
+PYSCRIPTS = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+AFTER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'after.py')
+FAKE_SOLVER = os.path.join(PYSCRIPTS, 'Library', 'JobsLib', 'fakesolver.py')
+
+
+def job_status(context, job, since=None):
+    """
+    由 .sta 末尾与 .lck 判断作业状态
+    :param since: 提交时刻，早于此时刻的 .sta 为上次求解留下的，视为未开始
+    :return: 'waiting' / 'running' / 'completed' / 'failed'
+    """
+    sta = context.work(job + '.sta')
+    if not os.path.exists(sta) or (since is not None and os.path.getmtime(sta) < since):
+        return 'waiting'
+    with open(sta, 'rb') as file:
+        file.seek(max(0, os.path.getsize(sta) - 4096))
+        tail = file.read().decode('cp936', 'replace')
+    if os.path.exists(context.work(job + '.lck')):
+        return 'running'
+    if 'COMPLETED SUCCESSFULLY' in tail:
+        return 'completed'
+    if 'HAS NOT BEEN COMPLETED' in tail:
+        return 'failed'
+    return 'running'
+
+
+def plot_urf(csv_path, png_path, title):
+    """
+    绘制单个作业的荷载-位移曲线，使用 Figure 对象而非 pyplot 全局状态，可在线程中并行
+    """
+    import pandas as pd
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    df = pd.read_csv(csv_path)
+    figure = Figure(figsize=(8, 6))
+    FigureCanvasAgg(figure)
+    axes = figure.add_subplot(111)
+    axes.plot(df['U'], df['RF'] / 1000, 'o--', markerfacecolor='w')
+    axes.set_xlim(left=0)
+    axes.set_ylim(bottom=0)
+    axes.set_title(title)
+    axes.set_xlabel('位移 (mm)')
+    axes.set_ylabel('荷载 (kN)')
+    figure.savefig(png_path)
+
+
+class Pipeline:
+    def __init__(self, context, fake=False, solve_limit=2, extract_limit=2, plot_limit=2, cpus=1, poll=2.0,
+                 plot=plot_urf):
+        """
+        求解 → 监视 → 提取 → 绘图 流水线
+        :param context: 运行上下文 RunContext，inp 与作业文件位于其工作目录
+        :param fake: 是否以替身求解器求解、提取，为 True 时在临时目录的上下文中运行，context 只用于读取 inp
+        :param solve_limit: 同时求解的作业数
+        :param extract_limit: 同时提取的作业数
+        :param plot_limit: 同时绘图的作业数
+        :param cpus: 每个作业的线程数
+        :param poll: 监视 .sta、.lck 的间隔 s
+        :param plot: 绘图函数 plot(csv 路径, png 路径, 标题)，为 None 时不绘图
+        """
+        self.source = context
+        self.context = base.RunContext(tempfile.mkdtemp(prefix='fake-pipeline-')) if fake else context
+        self.fake = fake
+        self.limits = (solve_limit, extract_limit, plot_limit)
+        self.cpus = cpus
+        self.poll = poll
+        self.plot = plot
+        self.executor = None
+        self.results = {}
+
+    def solve_command(self, job):
+        command = [sys.executable, FAKE_SOLVER] if self.fake else ['abaqus']
+        return command + ['job=' + job, 'input=' + self.context.work(job + '.inp'), 'cpus=%d' % self.cpus,
+                          'interactive']
+
+    def extract_command(self, job):
+        if self.fake:
+            return [sys.executable, FAKE_SOLVER, 'extract', 'job=' + job, 'data=' + self.context.data_path]
+        return ['abaqus', 'python', AFTER, job]
+
+    async def _run(self, job, stage, command):
+        """
+        在工作目录运行命令，输出写入 <作业名>.<阶段>.log
+        :return: 返回值
+        """
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.pathsep.join(filter(None, [PYSCRIPTS, env.get('PYTHONPATH')]))
+        with open(self.context.work('%s.%s.log' % (job, stage)), 'w') as log:
+            # Windows 下 abaqus 为批处理命令，需经 shell 启动
+            if os.name == 'nt' and not self.fake:
+                process = await asyncio.create_subprocess_shell(
+                    ' '.join('"%s"' % arg if ' ' in arg else arg for arg in command),
+                    cwd=self.context.work_path, stdout=log, stderr=log, env=env)
+            else:
+                process = await asyncio.create_subprocess_exec(*command, cwd=self.context.work_path,
+                                                               stdout=log, stderr=log, env=env)
+            return await process.wait()
+
+    async def monitor(self, job, process=None, since=None):
+        """
+        轮询 .sta、.lck 至作业结束
+        :param process: 本流水线启动的求解任务，其结束而 .sta 未出现结束语句时视为失败
+        :param since: 提交时刻，见 job_status
+        :return: 'completed' / 'failed'
+        """
+        while True:
+            status = job_status(self.context, job, since)
+            if status in ('completed', 'failed'):
+                return status
+            if process is not None and process.done():
+                # 求解进程已退出，再查一次以免错过最后写入
+                status = job_status(self.context, job, since)
+                return status if status in ('completed', 'failed') else 'failed'
+            await asyncio.sleep(self.poll)
+
+    async def flow(self, job, submit, semaphores):
+        """
+        单个作业：求解（可选）→ 监视 → 提取 → 绘图
+        """
+        solve, extract, plot = semaphores
+        start = time.time()
+        result = self.results[job] = {'status': 'waiting', 'wall': None}
+
+        if submit:
+            async with solve:
+                print('Python: 提交作业 ' + job)
+                process = asyncio.ensure_future(self._run(job, 'solve', self.solve_command(job)))
+                result['status'] = await self.monitor(job, process, start - 1)
+                await process
+        else:
+            result['status'] = await self.monitor(job)
+        print('Python: 作业 %s 结束，%s，用时 %.1f s' % (job, result['status'], time.time() - start))
+        if result['status'] != 'completed':
+            return
+
+        async with extract:
+            code = await self._run(job, 'extract', self.extract_command(job))
+        csv_path = self.context.data(job[4:] + '_URF.csv')
+        if code != 0 or not os.path.exists(csv_path):
+            result['status'] = 'extract failed'
+            print('Python: 提取 %s 失败，返回值 %d' % (job, code))
+            return
+
+        if self.plot is not None:
+            async with plot:
+                loop = asyncio.get_event_loop()
+                try:
+                    await loop.run_in_executor(self.executor, self.plot, csv_path,
+                                               self.context.img(job[4:] + '_URF.png'), job[4:])
+                except Exception as error:
+                    result['status'] = 'plot failed'
+                    print('Python: 绘图 %s 失败，%r' % (job, error))
+                    return
+        result['status'] = 'done'
+        result['wall'] = time.time() - start
+        print('Python: 作业 %s 处理完成，用时 %.1f s' % (job, result['wall']))
+
+    async def run_async(self, jobs, submit=True):
+        semaphores = [asyncio.Semaphore(limit) for limit in self.limits]
+        self.executor = ThreadPoolExecutor(self.limits[2])
+        try:
+            await asyncio.gather(*[self.flow(job, submit, semaphores) for job in jobs])
+        finally:
+            self.executor.shutdown()
+        return self.results
+
+    def run(self, jobs, submit=True):
+        """
+        运行流水线，阻塞至全部作业处理完
+        :param jobs: 作业名序列
+        :param submit: 是否提交求解，为 False 时只监视
+        :return: {作业名: dict(status, wall)}，status 为 done / failed / extract failed / plot failed
+        """
+        if self.fake and not submit:
+            raise ValueError('替身模式在临时目录中运行，不能只监视已有作业')
+        self.context.makedirs()
+        if self.fake:
+            print('Python: 替身求解目录 ' + self.context.work_path)
+            for job in jobs:
+                inp = self.source.work(job + '.inp')
+                if os.path.exists(inp):
+                    shutil.copy(inp, self.context.work(job + '.inp'))
+        return asyncio.run(self.run_async(jobs, submit))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='求解 → 监视 → 提取 → 绘图 流水线')
+    parser.add_argument('jobs', nargs='*', default=['Job-SimplyBeam0', 'Job-SimplyBeam1', 'Job-SimplyBeam2'])
+    parser.add_argument('--fake', action='store_true', help='以替身求解器求解、提取')
+    parser.add_argument('--watch', action='store_true', help='只监视，不提交作业')
+    parser.add_argument('--solve', type=int, default=2, help='同时求解的作业数')
+    parser.add_argument('--extract', type=int, default=2, help='同时提取的作业数')
+    parser.add_argument('--plot', type=int, default=2, help='同时绘图的作业数')
+    parser.add_argument('--cpus', type=int, default=1, help='每个作业的线程数')
+    parser.add_argument('--poll', type=float, default=2.0, help='监视间隔 s')
+    args = parser.parse_args()
+
+    pipeline = Pipeline(base.context, args.fake, args.solve, args.extract, args.plot, args.cpus, args.poll)
+    results = pipeline.run(args.jobs, submit=not args.watch)
+    sys.exit(0 if all(result['status'] == 'done' for result in results.values()) else 1)
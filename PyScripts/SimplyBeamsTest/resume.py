@@ -0,0 +1,18 @@
+# coding=cp936
+from Library import *
+from base import *
+
+if __name__ == '__main__':
+
+    # ԭҵļҵλڹĿ¼
+    with context:
+        # ԭҵ main(..., restart_interval=n) д
+        #  Step-2 һдݵ㣺Сߺ
+        variant = InpVariant('Job-SimplyBeam2-R')
+        variant.static('Step-2-R', initial=0.005, period=1.0, minimum=1e-8, maximum=0.05)
+        variant.load('Load-CF', -150 * 1e3)
+        inp, oldjob = restart_inp('Job-SimplyBeam2.inp', 'Job-SimplyBeam2-R', step='Step-2', variant=variant)
+
+        scheduler = Scheduler(tokens=None)
+        scheduler.add('Job-SimplyBeam2-R', inp, oldjob=oldjob)
+        scheduler.run()
@@ -0,0 +1,27 @@
+# coding=cp936
+import os
+from Library import *
+from base import *
+
+if __name__ == '__main__':
+
+    # ׸ inp λڹĿ¼
+    with context:
+        #  CAE дֵģΪ׸壬ֻĺǿȣ½ģ
+        base_inp = 'Job-SimplyBeam2.inp'
+        concretes = [('C25', 16.7, 1.78), ('C30', 20.1, 2.01), ('C40', 26.8, 2.39)]
+        forces = [-100 * 1e3, -120 * 1e3, -140 * 1e3]
+
+        variants = []
+        for grade, fcr, ftr in concretes:
+            for force in forces:
+                variant = InpVariant('Job-SimplyBeam2-%s-F%d' % (grade, -force / 1e3))
+                # ֵ׸е C30ò
+                variant.material(Concrete('C30', fcr, ftr).to_inp())
+                variant.load('Load-CF', force)
+                variants.append(variant)
+
+        scheduler = Scheduler(tokens=None)
+        for path in stamp_inp(base_inp, variants):
+            scheduler.add(os.path.splitext(os.path.basename(path))[0], path)
+        scheduler.run()
@@ -0,0 +1,32 @@
+# coding=cp936
+from abaqus import *
+from Library import *
+from base import *
+from before import main
+
+
+def drop_model(model_name):
+    """
+    д inp ɾģͣٸͬʱפڴ
+    """
+    del mdb.models[model_name]
+
+
+if __name__ == '__main__':
+
+    # inpҵļɨ嵥дĿ¼
+    with context:
+        # ģʽس仯ǿȡȡѿ
+        variants = param_grid(load=[dict(load_mode=0, load_force=320 * 1e3),
+                                    dict(load_mode=1, load_force=-180 * 1e3),
+                                    dict(load_mode=2, load_force=-120 * 1e3)],
+                              concrete=[dict(concrete_name='C30', fcr=20.1, ftr=2.01),
+                                        dict(concrete_name='C40', fcr=26.8, ftr=2.39)],
+                              r1_num=[3, 4])
+
+        # ǰ 3 壬ɵ .sta 
+        sweep = Sweep('SB', main, variants,
+                      queue=Scheduler(tokens=None),
+                      cleanup=drop_model,
+                      tuner=StepTuner())
+        sweep.run()
@@ -1,26 +1,86 @@
 # coding=cp936
+"""
+
+
+* RunContext һоĹݡͼƬĿ¼ģȡʽգȫֵǰĿ¼
+* with context: 빤Ŀ¼Abaqus ҵļдǰĿ¼˳ʱָԭĿ¼Ƕ
+* ̵ǰĿ¼໥̳еĲ̴ͬ벻ͬģнģȡ
+* ģ鼶 context ýűĿ¼ΪűʹãʱֻĿ¼лĿ¼
+"""
 import os
 import inspect
 
-# ȡߵļ·
-frame = inspect.currentframe()
-while frame.f_back is not None:
-    frame = frame.f_back
-call_path = os.path.dirname(os.path.abspath(frame.f_code.co_filename))
-del frame
-
-# ·
-work_path = os.path.join(call_path, 'Result')
-data_path = os.path.join(work_path, 'Data')
-img_path = os.path.join(work_path, 'Img')
-
-# Ŀ¼
-if not os.path.exists(work_path):
-    os.makedirs(work_path)
-if not os.path.exists(data_path):
-    os.makedirs(data_path)
-if not os.path.exists(img_path):
-    os.makedirs(img_path)
-
-os.chdir(work_path)
+
+class RunContext:
+    def __init__(self, root, name='Result'):
+        """
+        
+        :param root: Ŀ¼
+        :param name: Ŀ¼Ŀ¼Ϊ <Ŀ¼>/<name>ݡͼƬĿ¼λ
+        """
+        self.root = os.path.abspath(root)
+        self.work_path = os.path.join(self.root, name)
+        self.data_path = os.path.join(self.work_path, 'Data')
+        self.img_path = os.path.join(self.work_path, 'Img')
+        self.cache_path = os.path.join(self.work_path, 'Cache')
+        self._cwd = []
+
+    def makedirs(self):
+        """
+        ݡͼƬĿ¼
+        """
+        for path in (self.work_path, self.data_path, self.img_path):
+            try:
+                os.makedirs(path)
+            except OSError:
+                # Ѵڣɲнͬʱ
+                if not os.path.isdir(path):
+                    raise
+        return self
+
+    def work(self, *names):
+        return os.path.join(self.work_path, *names)
+
+    def data(self, *names):
+        return os.path.join(self.data_path, *names)
+
+    def img(self, *names):
+        return os.path.join(self.img_path, *names)
+
+    def __enter__(self):
+        self.makedirs()
+        self._cwd.append(os.getcwd())
+        os.chdir(self.work_path)
+        return self
+
+    def __exit__(self, *args):
+        os.chdir(self._cwd.pop())
+
+    def __getstate__(self):
+        # ʱǰĿ¼ջ
+        state = dict(self.__dict__)
+        state['_cwd'] = []
+        return state
+
+    def __repr__(self):
+        return 'RunContext(%r)' % self.work_path
+
+
+def caller_path():
+    """
+    ߵļĿ¼
+    """
+    frame = inspect.currentframe()
+    while frame.f_back is not None:
+        frame = frame.f_back
+    path = os.path.dirname(os.path.abspath(frame.f_code.co_filename))
+    del frame
+    return path
+
+
+# Ĭģݰģȡ·Ľű
+context = RunContext(caller_path()).makedirs()
+work_path = context.work_path
+data_path = context.data_path
+img_path = context.img_path
 print("Python: Ŀ¼ " + work_path)